@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
 
 from complexes.guest import Guest
+from complexes.helper_functions import get_dipole_moments, get_host_atoms
 from constants.relative_permittivity import RelativePermittivity
+from interactions.dipole_moment import DipoleMoment
 from molecular_structure.atom import Atom
+from molecular_structure.neighbor_list import BondTopology, VerletNeighborList
 
 
 class ComplexGuestAnion(ABC):
@@ -10,17 +13,49 @@ class ComplexGuestAnion(ABC):
     An abstract base class that represents host-guest complex with an anion as a guest.
     """
 
-    def __init__(self, atoms: list[Atom], guest: Guest, solvent: str, homo_energy: float | None = None):
+    def __init__(self, atoms: list[Atom], guest: Guest, solvent: str, homo_energy: float | None = None,
+                 neighbor_list: VerletNeighborList | None = None, bond_topology: BondTopology | None = None):
         """
         :param atoms: A list of Atom objects that represent the structure of the complex.
         :param guest: A class that represents the guest ion or molecule.
         :param solvent: The name of the solvent used (e.g., water or chloroform).
+        :param neighbor_list: The neighbor list of the central atom reused across frames (None searches all atoms).
+        :param bond_topology: The bonds held fixed across frames (None perceives the bonds from the distances).
         """
 
         self.atoms = atoms
         self.guest = guest
         self.solvent = RelativePermittivity[solvent.upper()].value
         self.homo_energy = homo_energy
+        self.neighbor_list = neighbor_list
+        self.bond_topology = bond_topology
+
+        # The dipole moments are shared by all interaction energies (the host dipole moments per radius).
+        self.host_dipole_moments: dict[float, list[DipoleMoment]] = {}
+        self.guest_dipole_moments: list[DipoleMoment] | None = None
+
+    def get_host_dipole_moments(self, interaction_radius: float) -> list[DipoleMoment]:
+        """
+        :param interaction_radius: The cut-off radius of the interaction in Angstroms.
+        :return: The dipole moments of the host within the interaction radius of the central atom of the guest.
+        """
+
+        if interaction_radius not in self.host_dipole_moments:
+            self.host_dipole_moments[interaction_radius] = get_dipole_moments(
+                get_host_atoms(self.atoms, self.guest, interaction_radius, self.neighbor_list), self.bond_topology)
+
+        return self.host_dipole_moments[interaction_radius]
+
+    def get_guest_dipole_moments(self) -> list[DipoleMoment]:
+        """
+        :return: The dipole moments of the guest.
+        """
+
+        if self.guest_dipole_moments is None:
+            self.guest_dipole_moments = get_dipole_moments([self.atoms[index] for index in self.guest.atoms],
+                                                           self.bond_topology)
+
+        return self.guest_dipole_moments
 
     @abstractmethod
     def get_dipole_interactions(self):
@@ -1,5 +1,4 @@
 from complexes.complex_guest_anion import ComplexGuestAnion
-from complexes.helper_functions import get_host_atoms, get_dipole_moments
 from interactions.dipole_interactions import (get_charge_dipole_interaction, get_charge_non_polar_dipole_interaction,
                                               get_charge_freely_rotating_dipole_interaction)
 
@@ -20,7 +19,7 @@ class ComplexGuestSphericalAnion(ComplexGuestAnion):
 
         interaction_energy = 0.0
 
-        for dipole_moment in get_dipole_moments(get_host_atoms(self.atoms, self.guest, interaction_radius)):
+        for dipole_moment in self.get_host_dipole_moments(interaction_radius):
             interaction_energy += get_charge_dipole_interaction(self.atoms[self.guest.central_atom], dipole_moment,
                                                                 self.solvent)
 
@@ -48,7 +47,7 @@ class ComplexGuestSphericalAnion(ComplexGuestAnion):
 
         interaction_energy = 0.0
 
-        for dipole_moment in get_dipole_moments(get_host_atoms(self.atoms, self.guest, interaction_radius)):
+        for dipole_moment in self.get_host_dipole_moments(interaction_radius):
             interaction_energy += get_charge_freely_rotating_dipole_interaction(self.atoms[self.guest.central_atom],
                                                                                 dipole_moment, self.solvent)
 
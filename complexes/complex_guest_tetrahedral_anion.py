@@ -1,5 +1,4 @@
 from complexes.complex_guest_anion import ComplexGuestAnion
-from complexes.helper_functions import get_host_atoms, get_dipole_moments
 from interactions.dipole_interactions import (
     get_dipole_dipole_interaction, get_freely_rotating_dipole_dipole_interaction, get_london_dispersion_force,
     get_dipole_non_polar_molecule_interaction, get_non_polar_freely_rotating_dipole_dipole_interaction
@@ -22,8 +21,8 @@ class ComplexGuestTetrahedralAnion(ComplexGuestAnion):
 
         interaction_energy = 0.0
 
-        host_dipole_moments = get_dipole_moments(get_host_atoms(self.atoms, self.guest, interaction_radius))
-        guest_dipole_moments = get_dipole_moments([self.atoms[index] for index in self.guest.atoms])
+        host_dipole_moments = self.get_host_dipole_moments(interaction_radius)
+        guest_dipole_moments = self.get_guest_dipole_moments()
 
         for host_dipole_moment in host_dipole_moments:
             for guest_dipole_moment in guest_dipole_moments:
@@ -43,8 +42,8 @@ class ComplexGuestTetrahedralAnion(ComplexGuestAnion):
 
         interaction_energy = 0.0
 
-        host_dipole_moments = get_dipole_moments(get_host_atoms(self.atoms, self.guest, interaction_radius))
-        guest_dipole_moments = get_dipole_moments([self.atoms[index] for index in self.guest.atoms])
+        host_dipole_moments = self.get_host_dipole_moments(interaction_radius)
+        guest_dipole_moments = self.get_guest_dipole_moments()
 
         for host_dipole_moment in host_dipole_moments:
             for guest_dipole_moment in guest_dipole_moments:
@@ -64,8 +63,8 @@ class ComplexGuestTetrahedralAnion(ComplexGuestAnion):
 
         interaction_energy = 0.0
 
-        host_dipole_moments = get_dipole_moments(get_host_atoms(self.atoms, self.guest, interaction_radius))
-        guest_dipole_moments = get_dipole_moments([self.atoms[index] for index in self.guest.atoms])
+        host_dipole_moments = self.get_host_dipole_moments(interaction_radius)
+        guest_dipole_moments = self.get_guest_dipole_moments()
 
         for host_dipole_moment in host_dipole_moments:
             for guest_dipole_moment in guest_dipole_moments:
@@ -85,8 +84,8 @@ class ComplexGuestTetrahedralAnion(ComplexGuestAnion):
 
         interaction_energy = 0.0
 
-        host_dipole_moments = get_dipole_moments(get_host_atoms(self.atoms, self.guest, interaction_radius))
-        guest_dipole_moments = get_dipole_moments([self.atoms[index] for index in self.guest.atoms])
+        host_dipole_moments = self.get_host_dipole_moments(interaction_radius)
+        guest_dipole_moments = self.get_guest_dipole_moments()
 
         for host_dipole_moment in host_dipole_moments:
             for guest_dipole_moment in guest_dipole_moments:
@@ -107,8 +106,8 @@ class ComplexGuestTetrahedralAnion(ComplexGuestAnion):
 
         interaction_energy = 0.0
 
-        host_dipole_moments = get_dipole_moments(get_host_atoms(self.atoms, self.guest, interaction_radius))
-        guest_dipole_moments = get_dipole_moments([self.atoms[index] for index in self.guest.atoms])
+        host_dipole_moments = self.get_host_dipole_moments(interaction_radius)
+        guest_dipole_moments = self.get_guest_dipole_moments()
 
         for host_dipole_moment in host_dipole_moments:
             for guest_dipole_moment in guest_dipole_moments:
@@ -0,0 +1,234 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator
+
+from joblib import effective_n_jobs
+from numpy import array, average, empty, exp, ndarray
+
+from complexes.complex_guest_anion import ComplexGuestAnion
+from constants.physical_constants import PhysicalConstants
+from dataset.helper_functions import get_host_guest_complex
+from molecular_structure.atom import Atom
+from molecular_structure.molecular_structure import make_atoms
+from molecular_structure.neighbor_list import BondTopology, VerletNeighborList
+from molecular_structure.trajectory import Trajectory
+
+ENSEMBLE_COLUMNS = [
+    'Dipole Interactions',
+    'Non-polar Dipole Interactions',
+    'Freely rotating Dipole Interactions',
+    'Freely rotating Dipoles Interactions',
+    'London Dispersion Force'
+]
+
+# The trajectory, the charges, the information of the complex and the neighbor list of a worker process.
+_worker_state: dict = {}
+
+
+def get_interaction_energies(host_guest_complex: ComplexGuestAnion, interaction_radius: float = 6.0) -> list[float]:
+    """
+    :param host_guest_complex: The host-guest complex.
+    :param interaction_radius: The cut-off radius of the interactions in Angstroms.
+    :return: All interaction energy components of the complex in Hartrees (in the order of ENSEMBLE_COLUMNS).
+    """
+
+    return [
+        host_guest_complex.get_dipole_interactions(interaction_radius),
+        host_guest_complex.get_non_polar_dipole_interactions(interaction_radius),
+        host_guest_complex.get_freely_rotating_dipole_interactions(interaction_radius),
+        host_guest_complex.get_freely_rotating_dipoles_interactions(interaction_radius),
+        host_guest_complex.get_london_dispersion_force(interaction_radius)
+    ]
+
+
+def make_frame_atoms(elements: ndarray, coordinates: ndarray, charges: ndarray) -> list[Atom]:
+    """
+    :param elements: The elements of the frame.
+    :param coordinates: The coordinates of the frame.
+    :param charges: The partial charges of the atoms (shared by all frames).
+    :raises RuntimeError: The number of charges does not match the number of atoms in the frame.
+    :return: A list of Atom objects that represent the frame.
+    """
+
+    if len(charges) != len(elements):
+        raise RuntimeError(f'the frame has {len(elements)} atoms, but {len(charges)} charges are given.')
+
+    return make_atoms(elements, coordinates, charges)
+
+
+def get_frame_energies(elements: ndarray, coordinates: ndarray, charges: ndarray, complex_information: dict,
+                       interaction_radius: float = 6.0, neighbor_list: VerletNeighborList | None = None,
+                       bond_topology: BondTopology | None = None) -> list[float]:
+    """
+    :param elements: The elements of the frame.
+    :param coordinates: The coordinates of the frame.
+    :param charges: The partial charges of the atoms (shared by all frames).
+    :param complex_information: The guest indices, the solvent and the HOMO-LUMO gap of the complex.
+    :param interaction_radius: The cut-off radius of the interactions in Angstroms.
+    :param neighbor_list: The neighbor list of the central atom reused across frames (None searches all atoms).
+    :param bond_topology: The bonds held fixed across frames (None perceives the bonds of the frame).
+    :raises RuntimeError: The number of charges does not match the number of atoms in the frame.
+    :return: All interaction energy components of the frame in Hartrees.
+    """
+
+    host_guest_complex = get_host_guest_complex(make_frame_atoms(elements, coordinates, charges), complex_information,
+                                                neighbor_list, bond_topology)
+
+    return get_interaction_energies(host_guest_complex, interaction_radius)
+
+
+def make_frame_neighbors(trajectory: Trajectory, charges: ndarray, complex_information: dict,
+                         interaction_radius: float, skin: float | None,
+                         first_frame: int) -> tuple[VerletNeighborList | None, BondTopology | None]:
+    """
+    :param trajectory: The trajectory.
+    :param charges: The partial charges of the atoms (shared by all frames).
+    :param complex_information: The guest indices, the solvent and the HOMO-LUMO gap of the complex.
+    :param interaction_radius: The cut-off radius of the interactions in Angstroms.
+    :param skin: The skin distance of the neighbor list in Angstroms (None searches and perceives every frame anew).
+    :param first_frame: The frame the bonds are perceived from.
+    :return: The neighbor list of the central atom and the bond topology (None and None without a skin).
+    """
+
+    if skin is None or len(trajectory) == 0:
+        return None, None
+
+    neighbor_list = VerletNeighborList(interaction_radius, skin, [complex_information.get('Guest - Central Atom')])
+    bond_topology = BondTopology(make_frame_atoms(*trajectory[first_frame], charges))
+
+    return neighbor_list, bond_topology
+
+
+def _initialize_worker(trajectory_file_path: str, charges: ndarray, complex_information: dict,
+                       interaction_radius: float, skin: float | None, first_frame: int):
+    trajectory = Trajectory(trajectory_file_path)
+    neighbor_list, bond_topology = make_frame_neighbors(trajectory, charges, complex_information, interaction_radius,
+                                                        skin, first_frame)
+
+    _worker_state.update(trajectory=trajectory, charges=charges, complex_information=complex_information,
+                         interaction_radius=interaction_radius, neighbor_list=neighbor_list,
+                         bond_topology=bond_topology)
+
+
+def _get_worker_frame_energies(frame: int) -> list[float]:
+    return get_frame_energies(*_worker_state['trajectory'][frame], _worker_state['charges'],
+                              _worker_state['complex_information'], _worker_state['interaction_radius'],
+                              _worker_state['neighbor_list'], _worker_state['bond_topology'])
+
+
+def iterate_ensemble_energies(trajectory_file_path: str, charges: ndarray, complex_information: dict,
+                              interaction_radius: float = 6.0, start: int = 0, stop: int | None = None, step: int = 1,
+                              n_jobs: int = 1, chunk_size: int = 16, skin: float | None = 1.0) -> Iterator[list[float]]:
+    """
+    The function evaluates the interaction energies of the frames of a trajectory one frame at a time. In parallel,
+    every worker process memory-maps the trajectory and receives only the frame indices, so no process holds more
+    than the frames it is evaluating.
+
+    The host atoms are selected with a Verlet neighbor list that is only rebuilt when an atom moved more than half of
+    the skin, and the bonds are perceived once from the first frame and held fixed for all frames.
+
+    :param trajectory_file_path: The full path of the trajectory (.xyz) file.
+    :param charges: The partial charges of the atoms (shared by all frames).
+    :param complex_information: The guest indices, the solvent and the HOMO-LUMO gap of the complex.
+    :param interaction_radius: The cut-off radius of the interactions in Angstroms.
+    :param start: The index of the first frame.
+    :param stop: The index after the last frame (None reads to the end).
+    :param step: The stride between the frames.
+    :param n_jobs: The number of worker processes (-1 uses all CPUs).
+    :param chunk_size: The number of frames sent to a worker at a time.
+    :param skin: The skin distance of the neighbor list in Angstroms (None searches the host atoms and perceives the
+    bonds in every frame anew).
+    :return: All interaction energy components of every frame in Hartrees (in the order of the frames).
+    """
+
+    with Trajectory(trajectory_file_path) as trajectory:
+        frames = range(len(trajectory))[start:stop:step]
+        first_frame = frames[0] if len(frames) > 0 else 0
+
+        if n_jobs == 1:
+            neighbor_list, bond_topology = make_frame_neighbors(trajectory, charges, complex_information,
+                                                                interaction_radius, skin, first_frame)
+
+            for elements, coordinates in trajectory.iterate_frames(start, stop, step):
+                yield get_frame_energies(elements, coordinates, charges, complex_information, interaction_radius,
+                                         neighbor_list, bond_topology)
+
+            return
+
+    with ProcessPoolExecutor(effective_n_jobs(n_jobs), initializer=_initialize_worker,
+                             initargs=(trajectory_file_path, charges, complex_information, interaction_radius, skin,
+                                       first_frame)) as executor:
+        yield from executor.map(_get_worker_frame_energies, frames, chunksize=chunk_size)
+
+
+def calculate_ensemble_energies(trajectory_file_path: str, charges: ndarray, complex_information: dict,
+                                interaction_radius: float = 6.0, start: int = 0, stop: int | None = None,
+                                step: int = 1, n_jobs: int = 1, chunk_size: int = 16,
+                                skin: float | None = 1.0) -> ndarray:
+    """
+    The function evaluates all interaction energy components of every frame of a conformer or molecular dynamics
+    ensemble; only the energies are held in memory, not the frames.
+
+    :param trajectory_file_path: The full path of the trajectory (.xyz) file.
+    :param charges: The partial charges of the atoms (shared by all frames).
+    :param complex_information: The guest indices, the solvent and the HOMO-LUMO gap of the complex.
+    :param interaction_radius: The cut-off radius of the interactions in Angstroms.
+    :param start: The index of the first frame.
+    :param stop: The index after the last frame (None reads to the end).
+    :param step: The stride between the frames.
+    :param n_jobs: The number of worker processes (-1 uses all CPUs).
+    :param chunk_size: The number of frames sent to a worker at a time.
+    :param skin: The skin distance of the neighbor list in Angstroms (None searches the host atoms and perceives the
+    bonds in every frame anew).
+    :return: The interaction energies of the frames in Hartrees (frames, components).
+    """
+
+    with Trajectory(trajectory_file_path) as trajectory:
+        number_of_frames = len(range(len(trajectory))[start:stop:step])
+
+    energies = empty((number_of_frames, len(ENSEMBLE_COLUMNS)), dtype=float)
+
+    for frame, frame_energies in enumerate(iterate_ensemble_energies(
+            trajectory_file_path, charges, complex_information, interaction_radius, start, stop, step, n_jobs,
+            chunk_size, skin)):
+        energies[frame] = frame_energies
+
+    return energies
+
+
+def get_boltzmann_weights(energies: ndarray, temperature: float = 298.15) -> ndarray:
+    """
+    :param energies: The energies of the frames in Hartrees.
+    :param temperature: The temperature in Kelvins.
+    :return: The normalized Boltzmann weights of the frames.
+    """
+
+    energies = array(energies, dtype=float)
+    weights = exp(-(energies - energies.min()) / (PhysicalConstants.BOLTZMANN.value * temperature))
+
+    return weights / weights.sum()
+
+
+def get_ensemble_average(energies: ndarray, weighting: str = 'uniform', frame_energies: ndarray | None = None,
+                         temperature: float = 298.15) -> ndarray:
+    """
+    The function averages the interaction energies over the frames of an ensemble.
+
+    :param energies: The interaction energies of the frames in Hartrees (frames, components).
+    :param weighting: The weighting of the frames ('uniform' or 'boltzmann').
+    :param frame_energies: The energies of the frames used for the Boltzmann weights in Hartrees, e.g., the conformer
+    energies (the total interaction energies of the frames if None).
+    :param temperature: The temperature of the Boltzmann weights in Kelvins.
+    :raises RuntimeError: The weighting is not 'uniform' or 'boltzmann'.
+    :return: The averaged interaction energies in Hartrees (components,).
+    """
+
+    if weighting == 'uniform':
+        return average(energies, axis=0)
+
+    if weighting == 'boltzmann':
+        if frame_energies is None:
+            frame_energies = energies.sum(axis=1)
+
+        return average(energies, axis=0, weights=get_boltzmann_weights(frame_energies, temperature))
+
+    raise RuntimeError(f'unknown weighting: {weighting} (use uniform or boltzmann).')
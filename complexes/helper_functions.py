@@ -1,21 +1,36 @@
 from itertools import combinations
 
+from numpy import array
+
 from complexes.guest import Guest
 from interactions.dipole_moment import DipoleMoment
 from molecular_structure.atom import Atom
+from molecular_structure.neighbor_list import BondTopology, VerletNeighborList
 from molecular_structure.spatial_analysis import get_distance
 
 
-def get_host_atoms(atoms: list[Atom], guest: Guest, interaction_radius: float) -> list[Atom]:
+def get_host_atoms(atoms: list[Atom], guest: Guest, interaction_radius: float,
+                   neighbor_list: VerletNeighborList | None = None) -> list[Atom]:
     """
     The function returns the atom indices of the host that are within the given interaction radius cut-off.
 
     :param atoms: The list of Atom objects that form the host-guest system.
     :param guest: The guest as a Guest object.
     :param interaction_radius: The cut-off radius.
+    :param neighbor_list: The neighbor list of the central atom with the interaction radius as the cut-off (None
+    checks the distances of all atoms).
+    :raises RuntimeError: The cut-off of the neighbor list is not the interaction radius.
     :return: A list of atom objects of the host.
     """
 
+    if neighbor_list is not None:
+        if neighbor_list.cut_off != interaction_radius:
+            raise RuntimeError('the cut-off of the neighbor list does not match the interaction radius.')
+
+        neighbors = neighbor_list.get_neighbors(guest.central_atom, array([atom.coord for atom in atoms]))
+
+        return [atoms[index] for index in neighbors if atoms[index].index not in guest.atoms]
+
     host_atoms = []
 
     for atom in atoms:
@@ -27,14 +42,19 @@ def get_host_atoms(atoms: list[Atom], guest: Guest, interaction_radius: float) -
     return host_atoms
 
 
-def get_dipole_moments(atoms: list[Atom]) -> list[DipoleMoment]:
+def get_dipole_moments(atoms: list[Atom], bond_topology: BondTopology | None = None) -> list[DipoleMoment]:
     """
     The function iterates over the given atoms and forms all potential dipole moments between atoms.
 
     :param atoms: Atoms of the given system represented as Atom objects.
+    :param bond_topology: The fixed bonds of the system (None perceives the bonds from the distances).
     :return: A list of DipoleMoment objects.
     """
 
+    if bond_topology is not None:
+        return [DipoleMoment(atoms[position_a], atoms[position_b]) for position_a, position_b in
+                bond_topology.get_bonds([atom.index for atom in atoms])]
+
     dipole_moments = []
 
     for atom_a, atom_b in combinations(atoms, 2):
@@ -0,0 +1,56 @@
+from numpy import array, full, nan, ndarray, unique
+
+from constants.covalent_radii import CovalentRadii
+
+# The element symbols in the order of the atomic numbers (the covalent radii are listed in that order).
+ELEMENT_SYMBOLS = tuple(element.name for element in CovalentRadii)
+
+ATOMIC_NUMBERS = {symbol: atomic_number for atomic_number, symbol in enumerate(ELEMENT_SYMBOLS, 1)}
+
+# The columns of the covalent radii table.
+SINGLE_BOND, DOUBLE_BOND, TRIPLE_BOND = 0, 1, 2
+
+
+def make_element_table(values: list[tuple[float, ...]]) -> ndarray:
+    """
+    :param values: The values of the elements in the order of the atomic numbers.
+    :return: A read-only table indexed by the atomic number (the row of atomic number zero is NaN).
+    """
+
+    table = full((len(values) + 1, len(values[0])), nan)
+    table[1:] = values
+    table.flags.writeable = False
+
+    return table
+
+
+# The single, double and triple bond covalent radii in Angstroms, indexed by the atomic number.
+COVALENT_RADII = make_element_table([element.value for element in CovalentRadii])
+
+
+def get_atomic_number(element: str) -> int:
+    """
+    :param element: The element symbol (case-insensitive).
+    :raises RuntimeError: The element is unknown.
+    :return: The atomic number of the element.
+    """
+
+    try:
+        return ATOMIC_NUMBERS[element.capitalize()]
+
+    except KeyError:
+        raise RuntimeError(f'unknown element: {element}.')
+
+
+def get_atomic_numbers(elements: list[str] | ndarray) -> ndarray:
+    """
+    The function converts the element symbols into atomic numbers; every distinct symbol is looked up once.
+
+    :param elements: The element symbols (case-insensitive).
+    :raises RuntimeError: An element is unknown.
+    :return: The atomic numbers of the elements.
+    """
+
+    symbols, inverse = unique(array(elements, dtype=str), return_inverse=True)
+
+    return array([get_atomic_number(str(symbol)) for symbol in symbols], dtype=int)[inverse.reshape(-1)]
@@ -0,0 +1,53 @@
+import os
+import statistics
+import time
+
+from numpy import array_equal
+
+from dataset.splits import load_data_arrays
+from models.flat_forest import flatten_random_forest
+from models.model_artifact import load_model_artifact
+
+DATA = 'anion-data.csv'
+MODEL = 'cavitand-model'  # The model saved by train_cavitand_model.py.
+BATCH_SIZES = [1, 16, 256]
+REPEATS = 20
+
+
+def get_median_time(predict, descriptors) -> float:
+    """
+    :param predict: The prediction function.
+    :param descriptors: The descriptors of the batch.
+    :return: The median time of a prediction of the batch in seconds.
+    """
+
+    timings = []
+
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        predict(descriptors)
+        timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings)
+
+
+model = load_model_artifact(os.path.join(os.getcwd(), MODEL)).model
+model.set_params(n_jobs=1)
+
+start = time.perf_counter()
+flat_forest = flatten_random_forest(model)
+flatten_time = time.perf_counter() - start
+
+descriptors, _, _ = load_data_arrays(os.path.join(os.getcwd(), DATA))
+
+print(f'{flat_forest.get_number_of_trees()} trees, {flat_forest.get_number_of_nodes()} nodes, '
+      f'{flat_forest.get_size() / 1e6:.1f} MB, flattened in {flatten_time * 1000:.1f} ms')
+print(f'Identical predictions: {array_equal(flat_forest.predict(descriptors), model.predict(descriptors))}')
+
+for batch_size in BATCH_SIZES:
+    batch = descriptors[:batch_size]
+    forest_time = get_median_time(model.predict, batch)
+    flat_time = get_median_time(flat_forest.predict, batch)
+
+    print(f'{batch_size:>4} complexes: scikit-learn {forest_time * 1000:.2f} ms, flat forest {flat_time * 1000:.2f} ms '
+          f'({forest_time / flat_time:.1f}x)')
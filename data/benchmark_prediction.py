@@ -0,0 +1,58 @@
+import json
+import os
+import statistics
+import time
+
+COMPLEX = 'anions-000'  # A complex with 265 atoms.
+MODEL = 'cavitand-model'  # The model saved by train_cavitand_model.py.
+REPEATS = 50
+
+# The import of the prediction path is part of the cold start (scikit-learn, DScribe and ASE are imported lazily).
+start = time.perf_counter()
+
+from dataset.helper_functions import get_host_guest_complex  # noqa: E402
+from models.binding_energy import PREDICTION_STAGES, predict_binding_energy  # noqa: E402
+from molecular_structure.molecular_structure import make_list_of_atoms  # noqa: E402
+
+import_time = time.perf_counter() - start
+
+
+def read_complex():
+    """
+    :return: The host-guest complex read from its files.
+    """
+
+    with open(os.path.join(os.getcwd(), f'{COMPLEX}-information.json'), 'r') as information_file:
+        information = json.load(information_file)
+
+    return get_host_guest_complex(make_list_of_atoms(os.path.join(os.getcwd(), f'{COMPLEX}-geometry.xyz'),
+                                                     os.path.join(os.getcwd(), f'{COMPLEX}-charges')), information)
+
+
+# The first prediction loads the model and forms the descriptor object.
+start = time.perf_counter()
+predict_binding_energy(read_complex(), os.path.join(os.getcwd(), MODEL))
+cold_time = time.perf_counter() - start
+
+# The warm predictions: every repeat reads the complex again, so nothing is reused but the model and the descriptor.
+timings = {stage: [] for stage in ['parse'] + PREDICTION_STAGES + ['total']}
+
+for _ in range(REPEATS):
+    start = time.perf_counter()
+    host_guest_complex = read_complex()
+    parse_time = time.perf_counter() - start
+
+    stage_timings = {}
+    predict_binding_energy(host_guest_complex, os.path.join(os.getcwd(), MODEL), stage_timings)
+
+    timings['parse'].append(parse_time)
+    timings['total'].append(time.perf_counter() - start)
+
+    for stage in PREDICTION_STAGES:
+        timings[stage].append(stage_timings[stage])
+
+print(f'Import: {import_time * 1000:.1f} ms, first prediction (loads the model): {cold_time * 1000:.1f} ms')
+print(f'Median latency over {REPEATS} predictions of {COMPLEX}:')
+
+for stage, stage_timings in timings.items():
+    print(f'{stage:>12}: {statistics.median(stage_timings) * 1000:.1f} ms')
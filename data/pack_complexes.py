@@ -0,0 +1,8 @@
+import os
+
+from dataset.complex_archive import pack_complexes
+
+# Pack the complex files of every data set into an archive (<prefix>-archive); the data set builders read the archive
+# instead of the loose files when it exists.
+for prefix in ['anions', 'anions-not-caviton', 'anions-external']:
+    print(f'Packed {pack_complexes(os.getcwd(), prefix)}')
@@ -1,76 +1,61 @@
 import os
 
 import numpy
-import pandas
 from matplotlib import pyplot
-from sklearn.ensemble import RandomForestRegressor
 from sklearn.metrics import mean_absolute_error
 from sklearn.metrics import r2_score
-from sklearn.model_selection import GridSearchCV
+
+from dataset.feature_table import read_feature_data_frame
+from dataset.splits import load_data_arrays, load_split_arrays, load_split_definition
+from descriptors.descriptor_registry import Descriptor
+from models.hyperparameter_search import run_halving_search
+from models.model_artifact import save_model_artifact
+from models.random_forest import fit_random_forest, predict_random_forest
 
 ANALYSIS = True  # All sets are run if True.
+SEARCH = False  # The hyperparameters are searched (successive halving) if True.
+N_JOBS = -1  # The number of parallel jobs of the forests and the search (-1 uses all CPUs).
+BACKEND = 'threads'  # The backend of the parallel jobs ('threads' or 'processes').
 
-# Load the CSV files as a Pandas dataframes.
-data = pandas.read_csv(os.path.join(os.getcwd(), 'anion-data.csv'))
-external_data = pandas.read_csv(os.path.join(os.getcwd(), 'anion-external-data.csv'))
+# The descriptor and the interaction radius the data set was built with (see create_dataset.py); they are saved with
+# the model, so the features of new complexes are calculated the same way.
+DESCRIPTOR = 'acsf'
+DESCRIPTOR_PARAMETERS = {}
+INTERACTION_RADIUS = 6.0
 
-TRN = [0, 2, 3, 4, 6, 8, 9, 10, 11, 12, 13, 14, 16, 19, 20, 21, 22, 23, 24, 26, 27, 28, 30, 31, 32, 33, 35, 36, 37, 38,
-       39, 40, 41, 42, 44, 45, 46, 48, 49, 50, 51, 52, 53, 55, 56, 57, 58, 59, 61, 62, 63, 64, 65, 66, 68, 69, 70, 71,
-       75, 78, 80, 81, 83, 84, 86, 87, 89, 94, 97, 98, 100, 101, 104]
-VAL = [5, 15, 18, 29, 43, 54, 67, 72, 74, 76, 82, 88, 91, 93, 95, 103]
-TST = [1, 7, 17, 25, 34, 47, 60, 73, 77, 79, 85, 90, 92, 96, 99, 102]
+# Load the CSV files as a Pandas dataframes (memory-mapped from the binary feature tables).
+data = read_feature_data_frame(os.path.join(os.getcwd(), 'anion-data.csv'))
 
-TRN_DESCRIPTORS, TRN_VALUES, VAL_DESCRIPTORS, VAL_VALUES, TST_VALUES, TST_DESCRIPTORS = [], [], [], [], [], []
+# Split the data set with the split definition (the rows are masked in one step).
+splits = load_split_arrays(os.path.join(os.getcwd(), 'anion-data.csv'),
+                           load_split_definition(os.path.join(os.getcwd(), 'splits.json'), 'cavitand'))
 
-for index, row in data.iterrows():
+TRN_DESCRIPTORS, TRN_VALUES = splits['TRN']  # Replace with [:, :5] for only energy.
+VAL_DESCRIPTORS, VAL_VALUES = splits['VAL']
+TST_DESCRIPTORS, TST_VALUES = splits['TST']
 
-    if index in TRN:
-        TRN_DESCRIPTORS.append(row.iloc[2:])  # Replace with 2:7 for only energy.
-        TRN_VALUES.append(row.iloc[1])
+# Register the descriptors and the respective values for the external data.
+EXT_DESCRIPTORS, EXT_VALUES, _ = load_data_arrays(os.path.join(os.getcwd(), 'anion-external-data.csv'))
 
-    elif index in VAL:
-        VAL_DESCRIPTORS.append(row.iloc[2:])  # Replace with 2:7 for only energy.
-        VAL_VALUES.append(row.iloc[1])
+if SEARCH is True:
 
-    else:  # TST
-        TST_DESCRIPTORS.append(row.iloc[2:])  # Replace with 2:7 for only energy.
-        TST_VALUES.append(row.iloc[1])
+    # Successive halving search: all candidates start with 100 trees and only the best third of them is evaluated
+    # again with three times as many trees, up to 5000 trees (the out-of-bag score does not change the forest).
+    parameter_grid = {
+        'max_depth': [None, 10, 20, 30, 100],
+        'min_samples_split': [2, 5, 10, 40],
+        'min_samples_leaf': [1, 2, 4, 20],
+        'bootstrap': [True, False]
+    }
 
-# Register the descriptors and the respective values for the external data.
-EXT_DESCRIPTORS, EXT_VALUES = [], []
-
-for index, row in external_data.iterrows():
-    EXT_DESCRIPTORS.append(row.iloc[2:])
-    EXT_VALUES.append(row.iloc[1])
-
-# # Grid search.
-# rfr = RandomForestRegressor(random_state=42)
-#
-# # Define the hyperparameter grid (discrete values for each parameter)
-# param_grid = {
-#     'n_estimators': [100, 500, 1000, 5000],
-#     'max_depth': [None, 10, 20, 30, 100],
-#     'min_samples_split': [2, 5, 10, 40],
-#     'min_samples_leaf': [1, 2, 4, 20],
-#     'bootstrap': [True, False],
-#     'oob_score': [True, False]
-# }
-#
-# # Initialize GridSearchCV
-# grid_search = GridSearchCV(estimator=rfr, param_grid=param_grid, cv=3, n_jobs=1, verbose=2)
-#
-# # Fit the model with GridSearchCV
-# grid_search.fit(TRN_DESCRIPTORS, TRN_VALUES)
-#
-# # Print the best hyperparameters found
-# print("Best Hyperparameters:", grid_search.best_params_)
-#
-# # Predict on the test set using the best model
-# y_pred = grid_search.predict(VAL_DESCRIPTORS)
-#
-# # Evaluate the model performance (mean absolute error)
-# mae = mean_absolute_error(VAL_VALUES, y_pred)
-# print(f"Mean Absolute Error: {mae:.2f}")
+    # The best hyperparameters and the results of all iterations are written next to the data set.
+    search = run_halving_search(TRN_DESCRIPTORS, TRN_VALUES, parameter_grid, os.getcwd(), 'cavitand', BACKEND,
+                                resource='n_estimators', min_resources=100, max_resources=5000, factor=3,
+                                n_jobs=N_JOBS, cv=3, random_state=42, verbose=2)
+
+    print(f'The best hyperparameters: {search.best_params_}.')
+    print(f'The MAE score for the validation set: '
+          f'{mean_absolute_error(VAL_VALUES, predict_random_forest(search.best_estimator_, VAL_DESCRIPTORS))}')
 
 
 def train_model(trn_descriptors, trn_values, val_descriptors, val_values, set_name):
@@ -82,16 +67,16 @@ def train_model(trn_descriptors, trn_values, val_descriptors, val_values, set_na
     :param set_name: The name of the set.
     """
 
-    # Initialise the random forest regressor.
-    rfr = RandomForestRegressor(n_estimators=1000, random_state=42, oob_score=True)
-    rfr.fit(trn_descriptors, trn_values)
+    # Initialise the random forest regressor (the trees are fitted in parallel, the results do not depend on N_JOBS).
+    rfr = fit_random_forest(trn_descriptors, trn_values, N_JOBS, BACKEND, n_estimators=1000, random_state=42,
+                            oob_score=True)
 
-    results = rfr.predict(trn_descriptors)
+    results = predict_random_forest(rfr, trn_descriptors, N_JOBS, BACKEND)
     print(f'The R2 score for the training set ({set_name}): {r2_score(trn_values, results)}.')
     print(f'The RMSE score for the training set: {numpy.sqrt(numpy.mean((numpy.array(trn_values) - results) ** 2))}')
     print(f'The MAE score for the training set: {mean_absolute_error(trn_values, results)}')
 
-    results = rfr.predict(val_descriptors)
+    results = predict_random_forest(rfr, val_descriptors, N_JOBS, BACKEND)
     print(f'The R2 score for the validation set ({set_name}): {r2_score(val_values, results)}.')
     print(f'The RMSE score for the validation set ({set_name}): {numpy.sqrt(numpy.mean((numpy.array(val_values) -
                                                                                         results) ** 2))}')
@@ -131,10 +116,14 @@ def train_model(trn_descriptors, trn_values, val_descriptors, val_values, set_na
 # Train the model.
 model = train_model(TRN_DESCRIPTORS, TRN_VALUES, VAL_DESCRIPTORS, VAL_VALUES, 'Validation')
 
+# Save the model with the schema of its input, so new complexes can be predicted without retraining.
+save_model_artifact(os.path.join(os.getcwd(), 'cavitand-model'), model, list(data.columns[2:]),
+                    Descriptor(DESCRIPTOR, **DESCRIPTOR_PARAMETERS), INTERACTION_RADIUS)
+
 if ANALYSIS is True:
 
     # Test on the test set.
-    tst_results = numpy.array(model.predict(TST_DESCRIPTORS))
+    tst_results = predict_random_forest(model, TST_DESCRIPTORS, N_JOBS, BACKEND)
 
     print(f'The R2 score for the test set: {r2_score(TST_VALUES, tst_results)}.')
     print(f'The RMSE score for the test set: {numpy.sqrt(numpy.mean((numpy.array(TST_VALUES) - tst_results) ** 2))}')
@@ -157,7 +146,7 @@ if ANALYSIS is True:
     pyplot.show()
 
     # Test the external test set.
-    ext_results = numpy.array(model.predict(EXT_DESCRIPTORS))
+    ext_results = predict_random_forest(model, EXT_DESCRIPTORS, N_JOBS, BACKEND)
 
     print(
         f'SBF6-: {round(float(ext_results[0]), 1)} kJ per mol\n'
@@ -1,8 +1,5 @@
 import os
 
-import numpy
-import pandas
-
 from matplotlib import pyplot
 
 # Linear Models
@@ -23,105 +20,57 @@ from sklearn.svm import SVR, NuSVR, LinearSVR
 from sklearn.gaussian_process import GaussianProcessRegressor
 
 # Load additional classes and functions.
-from sklearn.metrics import mean_absolute_error, r2_score
 from sklearn.model_selection import KFold
 
+from dataset.feature_table import read_feature_data_frame
+from dataset.splits import load_data_arrays
+from models.cross_validation import cross_validate_models, get_fold_scores
+from models.random_forest import fit_random_forest
 
-# Load the CSV files as a Pandas dataframes.
-data = pandas.read_csv(os.path.join(os.getcwd(), 'anion-data.csv'))
-
-# Compile the arrays for descriptors and values.
-DESCRIPTORS, VALUES = [], []
+N_JOBS = -1  # The number of parallel jobs of the cross-validation and the forests (-1 uses all CPUs).
+BACKEND = 'threads'  # The backend of the parallel jobs ('threads' or 'processes').
 
-for index, row in data.iterrows():
 
-    DESCRIPTORS.append(numpy.array([float(descriptor) for descriptor in row.iloc[2:6]]))
-    VALUES.append(float(row.iloc[1]))
+# Load the CSV files as a Pandas dataframes (memory-mapped from the binary feature tables).
+data = read_feature_data_frame(os.path.join(os.getcwd(), 'anion-data.csv'))
 
-DESCRIPTORS = numpy.array(DESCRIPTORS)
-VALUES = numpy.array(VALUES)
+# Load the electrostatic descriptors (the first four) and the values (memory-mapped from the binary feature table).
+DESCRIPTORS, VALUES, _ = load_data_arrays(os.path.join(os.getcwd(), 'anion-data.csv'))
+DESCRIPTORS = DESCRIPTORS[:, :4]
 
 # Put together the five-fold cross-validation sets.
 validation_sets = KFold(n_splits=5, shuffle=True, random_state=42)
 
-# Initialize lists to store results for r2 and mae
-r2_scores = {
-    'Linear Regression': [],
-    'Ridge': [],
-    'Lasso': [],
-    'Elastic Net': [],
-    'Bayesian Ridge': [],
-    'Huber Regressor': [],
-    'Passive Aggressive Regressor': [],
-    'K-nearest Neighbors Regressor': [],
-    'Decision Tree Regressor': [],
-    'Random Forest Regressor': [],
-    'Gradient Boosting Regressor': [],
-    'Ada Boost Regressor': [],
-    'SVR': [],
-    'NuSVR': [],
-    'Linear SVR': [],
-    'Gaussian Process Regressor': []
-}
-
-mae_scores = {
-    'Linear Regression': [],
-    'Ridge': [],
-    'Lasso': [],
-    'Elastic Net': [],
-    'Bayesian Ridge': [],
-    'Huber Regressor': [],
-    'Passive Aggressive Regressor': [],
-    'K-nearest Neighbors Regressor': [],
-    'Decision Tree Regressor': [],
-    'Random Forest Regressor': [],
-    'Gradient Boosting Regressor': [],
-    'Ada Boost Regressor': [],
-    'SVR': [],
-    'NuSVR': [],
-    'Linear SVR': [],
-    'Gaussian Process Regressor': []
-}
-
-# Test different modelling methods using default parameters.
-for train_index, test_index in validation_sets.split(DESCRIPTORS, VALUES):
-
-    # Split data into train and test sets
-    X_train, X_test = DESCRIPTORS[train_index], DESCRIPTORS[test_index]
-    y_train, y_test = VALUES[train_index], VALUES[test_index]
-
-    # Define models and corresponding names
-    models = [
-        ('Linear Regression', LinearRegression()),
-        ('Ridge', Ridge()),
-        ('Lasso', Lasso(random_state=42)),
-        ('Elastic Net', ElasticNet(random_state=42)),
-        ('Bayesian Ridge', BayesianRidge()),
-        ('Huber Regressor', HuberRegressor()),
-        ('Passive Aggressive Regressor', PassiveAggressiveRegressor(random_state=42)),
-        ('K-nearest Neighbors Regressor', KNeighborsRegressor()),
-        ('Decision Tree Regressor', DecisionTreeRegressor(random_state=42)),
-        ('Random Forest Regressor', RandomForestRegressor(random_state=42)),
-        ('Gradient Boosting Regressor', GradientBoostingRegressor(random_state=42)),
-        ('Ada Boost Regressor', AdaBoostRegressor(random_state=42)),
-        ('SVR', SVR()),
-        ('NuSVR', NuSVR()),
-        ('Linear SVR', LinearSVR(random_state=42)),
-        ('Gaussian Process Regressor', GaussianProcessRegressor())
-    ]
-
-    # Loop through models
-    for name, model in models:
-        model.fit(X_train, y_train)
-        results = model.predict(X_test)
-
-        # Calculate r2 and mae
-        r2 = r2_score(y_test, results)
-        mae = mean_absolute_error(y_test, results)
-
-        # Append results to the corresponding lists
-        r2_scores[name].append(round(r2, 2))
-        mae_scores[name].append(round(mae, 2))
+# Define models and corresponding names
+models = [
+    ('Linear Regression', LinearRegression()),
+    ('Ridge', Ridge()),
+    ('Lasso', Lasso(random_state=42)),
+    ('Elastic Net', ElasticNet(random_state=42)),
+    ('Bayesian Ridge', BayesianRidge()),
+    ('Huber Regressor', HuberRegressor()),
+    ('Passive Aggressive Regressor', PassiveAggressiveRegressor(random_state=42)),
+    ('K-nearest Neighbors Regressor', KNeighborsRegressor()),
+    ('Decision Tree Regressor', DecisionTreeRegressor(random_state=42)),
+    ('Random Forest Regressor', RandomForestRegressor(random_state=42)),
+    ('Gradient Boosting Regressor', GradientBoostingRegressor(random_state=42)),
+    ('Ada Boost Regressor', AdaBoostRegressor(random_state=42)),
+    ('SVR', SVR()),
+    ('NuSVR', NuSVR()),
+    ('Linear SVR', LinearSVR(random_state=42)),
+    ('Gaussian Process Regressor', GaussianProcessRegressor())
+]
+
+# Test different modelling methods using default parameters: the (model, fold) pairs run in parallel processes and
+# the predictions are cached, so a rerun only fits the models (or folds) that were added or changed.
+folds = list(validation_sets.split(DESCRIPTORS, VALUES))
+predictions = cross_validate_models(models, DESCRIPTORS, VALUES, folds,
+                                    os.path.join(os.getcwd(), 'electrostatic-cross-validation'), N_JOBS)
+
+# Calculate r2 and mae
+r2_scores, mae_scores = get_fold_scores(predictions, VALUES, folds)
+r2_scores = {name: [round(r2, 2) for r2 in scores] for name, scores in r2_scores.items()}
+mae_scores = {name: [round(mae, 2) for mae in scores] for name, scores in mae_scores.items()}
 
 # Print r2 scores table
 print("R2:")
@@ -134,16 +83,14 @@ for name in mae_scores:
     print(f'{name}, {', '.join(map(str, mae_scores[name]))}')
 
 # As expected, the ensemble methods had the best performance with Random forest regressor having the highest average R2.
-for train_index, test_index in validation_sets.split(DESCRIPTORS, VALUES):
+for fold, (train_index, test_index) in enumerate(folds):
 
     # Split data into train and test sets
-    X_train, X_test = DESCRIPTORS[train_index], DESCRIPTORS[test_index]
-    y_train, y_test = VALUES[train_index], VALUES[test_index]
-    
-    # Train a random forest model.
-    model = RandomForestRegressor(random_state=42)
-    model.fit(X_train, y_train)
-    results = model.predict(X_test)
+    X_train, y_train, y_test = DESCRIPTORS[train_index], VALUES[train_index], VALUES[test_index]
+
+    # Train a random forest model for the descriptor importance (the predictions of the fold are cached).
+    model = fit_random_forest(X_train, y_train, N_JOBS, BACKEND, n_estimators=100, random_state=42, oob_score=False)
+    results = predictions['Random Forest Regressor'][fold]
 
     # Plot the descriptor importance.
     descriptor_importance = model.feature_importances_
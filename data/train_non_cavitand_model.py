@@ -1,68 +1,39 @@
 import os
 
 import numpy
-import pandas
 from matplotlib import pyplot
-from sklearn.ensemble import RandomForestRegressor
 from sklearn.metrics import mean_absolute_error
 from sklearn.metrics import r2_score
 
-ANALYSIS = True  # All sets are run if True.
-
-# Load the CSV files as a Pandas dataframes.
-data = pandas.read_csv(os.path.join(os.getcwd(), 'anion-not-caviton-data.csv'))
-external_data = pandas.read_csv(os.path.join(os.getcwd(), 'anion-external-data.csv'))
-
-TRN = [
-
-    # The training set from the caviton model.
-    0, 2, 3, 4, 6, 8, 9, 10, 11, 12, 13, 14, 16, 19, 20, 21, 22, 23, 24, 26, 27, 28, 30, 31, 32, 33, 35, 36, 37, 38,
-    39, 40, 41, 42, 44, 45, 46, 48, 49, 50, 51, 52, 53, 55, 56, 57, 58, 59, 61, 62, 63, 64, 65, 66, 68, 69, 70, 71,
-    75, 78, 80, 81, 83, 84, 86, 87, 89, 94, 97, 98, 100, 101, 104,
-
-    # The validation set from the caviton model.
-    5, 15, 18, 29, 43, 54, 67, 72, 74, 76, 82, 88, 91, 93, 95, 103,
-
-    # Random complexes from the non-cavitons.
-    106, 107, 108, 110, 111, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 124, 126, 127, 128, 129, 130, 135, 136,
-    137, 138, 139, 140, 141, 142, 143, 145, 146, 148, 149, 152, 153, 154, 155, 156, 157, 159, 160, 161, 162, 163, 164,
-    166, 167, 169, 171, 172, 173, 174, 175, 176, 177, 178, 179, 181, 182, 183, 184, 185, 186, 187, 190, 191, 192, 193,
-    194, 195, 196, 198, 199, 200, 201, 202, 203, 204, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 220,
-    221, 223, 224, 225, 227, 228, 229, 230, 232, 233, 235, 236, 237, 238, 239, 241, 242, 246
-]
-
-TST = [
+from dataset.feature_table import read_feature_data_frame
+from dataset.splits import load_data_arrays, load_split_arrays, load_split_definition
+from descriptors.descriptor_registry import Descriptor
+from models.model_artifact import save_model_artifact
+from models.random_forest import fit_random_forest, predict_random_forest
 
-    # The test set from the caviton model.
-    1, 7, 17, 25, 34, 47, 60, 73, 77, 79, 85, 90, 92, 96, 99, 102,
-
-    # Random complexes from the non-cavitons.
-    105, 109, 112, 123, 125, 131, 132, 133, 134, 144, 147, 150, 151, 158, 165, 168, 170, 180, 188, 189, 197, 205, 218,
-    219, 222, 226, 231, 234, 240, 243, 244, 245
-
-]
-
-TRN_DESCRIPTORS, TRN_VALUES, TST_VALUES, TST_DESCRIPTORS = [], [], [], []
+ANALYSIS = True  # All sets are run if True.
+N_JOBS = -1  # The number of parallel jobs of the forests and the grid search (-1 uses all CPUs).
+BACKEND = 'threads'  # The backend of the parallel jobs ('threads' or 'processes').
 
-for index, row in data.iterrows():
+# The descriptor and the interaction radius the data set was built with (see create_dataset.py); they are saved with
+# the model, so the features of new complexes are calculated the same way.
+DESCRIPTOR = 'acsf'
+DESCRIPTOR_PARAMETERS = {}
+INTERACTION_RADIUS = 6.0
 
-    if index in TRN:
-        TRN_DESCRIPTORS.append(row.iloc[2:])  # Replace with 2:7 for only energy.
-        TRN_VALUES.append(row.iloc[1])
+# Load the CSV files as a Pandas dataframes (memory-mapped from the binary feature tables).
+data = read_feature_data_frame(os.path.join(os.getcwd(), 'anion-not-caviton-data.csv'))
 
-    elif index in TST:
-        TST_DESCRIPTORS.append(row.iloc[2:])  # Replace with 2:7 for only energy.
-        TST_VALUES.append(row.iloc[1])
+# Split the data set with the split definition: the training set holds the training and validation sets of the
+# caviton model and random non-cavitons, the test set holds the test set of the caviton model and random non-cavitons.
+splits = load_split_arrays(os.path.join(os.getcwd(), 'anion-not-caviton-data.csv'),
+                           load_split_definition(os.path.join(os.getcwd(), 'splits.json'), 'non-cavitand'))
 
-    else:
-        raise RuntimeError(f'index {index} is not used.')
+TRN_DESCRIPTORS, TRN_VALUES = splits['TRN']  # Replace with [:, :5] for only energy.
+TST_DESCRIPTORS, TST_VALUES = splits['TST']
 
 # Register the descriptors and the respective values for the external data.
-EXT_DESCRIPTORS, EXT_VALUES = [], []
-
-for index, row in external_data.iterrows():
-    EXT_DESCRIPTORS.append(row.iloc[2:])
-    EXT_VALUES.append(row.iloc[1])
+EXT_DESCRIPTORS, EXT_VALUES, _ = load_data_arrays(os.path.join(os.getcwd(), 'anion-external-data.csv'))
 
 
 def train_model(trn_descriptors, trn_values, val_descriptors, val_values):
@@ -73,16 +44,16 @@ def train_model(trn_descriptors, trn_values, val_descriptors, val_values):
     :param val_values: The values for the validation set.
     """
 
-    # Initialise the random forest regressor.
-    rfr = RandomForestRegressor(n_estimators=1000, random_state=42, oob_score=True)
-    rfr.fit(trn_descriptors, trn_values)
+    # Initialise the random forest regressor (the trees are fitted in parallel, the results do not depend on N_JOBS).
+    rfr = fit_random_forest(trn_descriptors, trn_values, N_JOBS, BACKEND, n_estimators=1000, random_state=42,
+                            oob_score=True)
 
-    results = rfr.predict(trn_descriptors)
+    results = predict_random_forest(rfr, trn_descriptors, N_JOBS, BACKEND)
     print(f'The R2 score for the training set: {r2_score(trn_values, results)}.')
     print(f'The RMSE score for the training set: {numpy.sqrt(numpy.mean((numpy.array(trn_values) - results) ** 2))}')
     print(f'The MAE score for the training set: {mean_absolute_error(trn_values, results)}')
 
-    results = rfr.predict(val_descriptors)
+    results = predict_random_forest(rfr, val_descriptors, N_JOBS, BACKEND)
     print(f'The R2 score for the test set: {r2_score(val_values, results)}.')
     print(f'The RMSE score for the test set: {numpy.sqrt(numpy.mean((numpy.array(val_values) - results) ** 2))}')
     print(f'The MAE score for the test set: {mean_absolute_error(val_values, results)}')
@@ -121,8 +92,12 @@ def train_model(trn_descriptors, trn_values, val_descriptors, val_values):
 # Train the model.
 model = train_model(TRN_DESCRIPTORS, TRN_VALUES, TST_DESCRIPTORS, TST_VALUES)
 
+# Save the model with the schema of its input, so new complexes can be predicted without retraining.
+save_model_artifact(os.path.join(os.getcwd(), 'non-cavitand-model'), model, list(data.columns[2:]),
+                    Descriptor(DESCRIPTOR, **DESCRIPTOR_PARAMETERS), INTERACTION_RADIUS)
+
 # Test the external test set.
-ext_results = numpy.array(model.predict(EXT_DESCRIPTORS))
+ext_results = predict_random_forest(model, EXT_DESCRIPTORS, N_JOBS, BACKEND)
 
 print(
     f'SbF6-: {round(float(ext_results[0]), 1)} kJ per mol\n'
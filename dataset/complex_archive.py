@@ -0,0 +1,153 @@
+import glob
+import json
+import os
+
+from numpy import array, concatenate, cumsum, load, save
+
+from molecular_structure.atom import Atom
+from molecular_structure.compressed_files import find_file
+from molecular_structure.extended_xyz import read_extended_xyz
+from molecular_structure.molecular_structure import make_atoms, read_partial_charges, read_structure_arrays
+
+METADATA_FILE = 'metadata.json'
+ELEMENTS_FILE = 'elements.npy'
+COORDINATES_FILE = 'coordinates.npy'
+CHARGES_FILE = 'charges.npy'
+OFFSETS_FILE = 'offsets.npy'
+
+
+def get_archive_path(directory: str, prefix: str) -> str:
+    """
+    :param directory: The full path of the directory with the complex files.
+    :param prefix: The prefix of the complex file names.
+    :return: The full path of the archive of the complexes with the given prefix.
+    """
+
+    return os.path.join(directory, f'{prefix}-archive')
+
+
+def is_archive_current(directory: str, prefix: str) -> bool:
+    """
+    :param directory: The full path of the directory with the complex files.
+    :param prefix: The prefix of the complex file names.
+    :return: Whether the directory has an archive of the complexes and no complex file is newer than the archive
+    (complexes added or edited after packing are otherwise left out).
+    """
+
+    metadata_file_path = os.path.join(get_archive_path(directory, prefix), METADATA_FILE)
+
+    if not os.path.isfile(metadata_file_path):
+        return False
+
+    archive_time = os.path.getmtime(metadata_file_path)
+
+    return all(os.path.getmtime(file_path) <= archive_time for file_path in
+               glob.glob(os.path.join(glob.escape(directory), f'{glob.escape(prefix)}-[0-9][0-9][0-9]*')))
+
+
+def pack_complexes(directory: str, prefix: str, archive_path: str | None = None, number_of_complexes: int = 500) -> str:
+    """
+    The function packs the complex files (<prefix>-NNN-information.json, <prefix>-NNN-geometry.xyz and
+    <prefix>-NNN-charges, or <prefix>-NNN.extxyz) into an archive: one metadata table and the concatenated elements,
+    coordinates and charges of all complexes with the offset of every complex.
+
+    :param directory: The full path of the directory with the complex files.
+    :param prefix: The prefix of the complex file names.
+    :param archive_path: The full path of the archive directory (<directory>/<prefix>-archive if None).
+    :param number_of_complexes: The number of potential complex indices that are checked.
+    :raises RuntimeError: The number of atoms and charges of a complex do not match.
+    :return: The full path of the archive directory.
+    """
+
+    if archive_path is None:
+        archive_path = get_archive_path(directory, prefix)
+
+    metadata, elements, coordinates, charges = [], [], [], []
+
+    for index in range(number_of_complexes):
+        complex_path = os.path.join(directory, f'{prefix}-{index:03}')
+
+        if os.path.isfile(f'{complex_path}-information.json'):
+            with open(f'{complex_path}-information.json', 'r') as information_file:
+                complex_information = json.load(information_file)
+
+            complex_elements, complex_coordinates = read_structure_arrays(find_file(f'{complex_path}-geometry.xyz'))
+            complex_charges = read_partial_charges(find_file(f'{complex_path}-charges'), len(complex_elements))
+
+        elif os.path.isfile(extended_xyz_file_path := find_file(f'{complex_path}.extxyz')):
+            complex_elements, complex_coordinates, complex_charges, complex_information = read_extended_xyz(
+                extended_xyz_file_path)
+
+        else:
+            continue
+
+        metadata.append({'Index': index, **complex_information})
+        elements.append(complex_elements)
+        coordinates.append(complex_coordinates)
+        charges.append(complex_charges)
+
+    os.makedirs(archive_path, exist_ok=True)
+
+    with open(os.path.join(archive_path, METADATA_FILE), 'w') as metadata_file:
+        json.dump(metadata, metadata_file)
+
+    save(os.path.join(archive_path, ELEMENTS_FILE), concatenate(elements) if elements else array([], dtype=str))
+    save(os.path.join(archive_path, COORDINATES_FILE), concatenate(coordinates) if coordinates else array([]))
+    save(os.path.join(archive_path, CHARGES_FILE), concatenate(charges) if charges else array([]))
+    save(os.path.join(archive_path, OFFSETS_FILE), concatenate([[0], cumsum([len(charge) for charge in charges])]))
+
+    return archive_path
+
+
+class ComplexArchive:
+    """
+    A class that represents a packed archive of complexes. The arrays are memory-mapped, so only the complexes that
+    are accessed are read from the disk.
+    """
+
+    def __init__(self, archive_path: str):
+        """
+        :param archive_path: The full path of the archive directory.
+        :raises FileNotFoundError: The archive does not exist.
+        """
+
+        with open(os.path.join(archive_path, METADATA_FILE), 'r') as metadata_file:
+            self.metadata = json.load(metadata_file)
+
+        self.elements = load(os.path.join(archive_path, ELEMENTS_FILE), mmap_mode='r')
+        self.coordinates = load(os.path.join(archive_path, COORDINATES_FILE), mmap_mode='r')
+        self.charges = load(os.path.join(archive_path, CHARGES_FILE), mmap_mode='r')
+        self.offsets = load(os.path.join(archive_path, OFFSETS_FILE))
+
+    def __len__(self) -> int:
+        """
+        :return: The number of complexes in the archive.
+        """
+
+        return len(self.metadata)
+
+    def get_index(self, position: int) -> int:
+        """
+        :param position: The position of the complex in the archive.
+        :return: The index of the complex (NNN in the name of the complex files).
+        """
+
+        return self.metadata[position]['Index']
+
+    def get_information(self, position: int) -> dict:
+        """
+        :param position: The position of the complex in the archive.
+        :return: The experimental and computational data of the complex (the content of the information file).
+        """
+
+        return {key: value for key, value in self.metadata[position].items() if key != 'Index'}
+
+    def get_atoms(self, position: int) -> list[Atom]:
+        """
+        :param position: The position of the complex in the archive.
+        :return: A list of Atom objects that represent the structure of the complex.
+        """
+
+        start, end = self.offsets[position], self.offsets[position + 1]
+
+        return make_atoms(self.elements[start:end], self.coordinates[start:end], self.charges[start:end])
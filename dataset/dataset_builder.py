@@ -0,0 +1,81 @@
+from numpy import array, asarray, concatenate, ndarray
+
+from dataset.feature_table import INDEX_COLUMN, get_feature_table_path, save_feature_table
+from dataset.pipeline import get_columns, run_pipeline
+from descriptors.descriptor_cache import DescriptorCache
+from descriptors.descriptor_registry import Descriptor
+
+
+def build_data_set(directory: str, prefix: str, descriptor: Descriptor, number_of_complexes: int = 500,
+                   index_offset: int = 0, interaction_radius: float = 6.0, n_jobs: int = 1,
+                   cache: DescriptorCache | None = None, batch_size: int = 256) -> tuple[ndarray, list[str], ndarray]:
+    """
+    The function builds the data set of the complexes stored in the given directory (the files are named
+    <prefix>-NNN-information.json, <prefix>-NNN-geometry.xyz and <prefix>-NNN-charges, or packed into the archive
+    <prefix>-archive) by collecting the rows of the pipeline. The energies are calculated one complex at a time, while
+    the descriptors are calculated in batches.
+
+    With a cache, the energies and the descriptors that were already calculated are loaded from the disk; thus,
+    switching the descriptor only costs the calculation of the new descriptor.
+
+    :param directory: The full path of the directory with the complex files (or their packed archive).
+    :param prefix: The prefix of the complex file names.
+    :param descriptor: The registered descriptor centered on the central atom of the guest.
+    :param number_of_complexes: The number of potential complex indices that are checked.
+    :param index_offset: The offset added to the complex indices in the data set.
+    :param interaction_radius: The cut-off radius of the interactions in Angstroms.
+    :param n_jobs: The number of parallel jobs used for the descriptors.
+    :param cache: The cache of the energies and descriptors (None disables caching).
+    :param batch_size: The number of complexes per descriptor batch.
+    :return: The values (dG, energies, covalent radius and descriptors), the column names and the complex indices.
+    """
+
+    columns = get_columns(descriptor)
+    indices, rows = [], []
+
+    for index, row in run_pipeline(directory, prefix, descriptor, number_of_complexes, index_offset, interaction_radius,
+                                   batch_size, n_jobs, cache):
+        indices.append(index)
+        rows.append(row)
+
+    return array(rows, dtype=float).reshape(-1, len(columns)), columns, array(indices, dtype=int)
+
+
+def merge_data_sets(*data_sets: tuple[ndarray, list[str], ndarray]) -> tuple[ndarray, list[str], ndarray]:
+    """
+    The function merges data sets with the same columns (e.g., the cavitand and non-cavitand complexes).
+
+    :param data_sets: The data sets as (values, columns, indices) tuples.
+    :raises RuntimeError: The columns of the data sets do not match.
+    :return: The merged values, columns and indices.
+    """
+
+    columns = data_sets[0][1]
+
+    if any(list(data_set[1]) != list(columns) for data_set in data_sets):
+        raise RuntimeError('the columns of the data sets do not match.')
+
+    return (concatenate([data_set[0] for data_set in data_sets]), columns,
+            concatenate([data_set[2] for data_set in data_sets]))
+
+
+def write_data_set(csv_file_path: str, values: ndarray, columns: list[str], indices: ndarray):
+    """
+    The function writes a data set to a CSV file and to the binary feature table next to it.
+
+    :param csv_file_path: The full path of the CSV file.
+    :param values: The values of the data set (one row per complex).
+    :param columns: The column names of the values.
+    :param indices: The complex indices.
+    """
+
+    values = asarray(values, dtype=float)
+
+    with open(csv_file_path, 'w') as data_file:
+        data_file.write(f'{INDEX_COLUMN},{",".join(columns)}\n')
+
+        for index, row in zip(indices, values.tolist()):
+            data_file.write(f'{index:03},{",".join(str(value) for value in row)}\n')
+
+    # The feature table is written after the CSV file, so it is not considered out of date.
+    save_feature_table(get_feature_table_path(csv_file_path), values, columns, indices)
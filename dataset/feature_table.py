@@ -0,0 +1,117 @@
+import os
+
+from numpy import asarray, load, ndarray, save
+from pandas import DataFrame, read_csv
+
+INDEX_COLUMN = 'Anion Index'
+
+VALUES_FILE = 'values.npy'
+COLUMNS_FILE = 'columns.npy'
+INDEX_FILE = 'index.npy'
+
+
+def get_feature_table_path(csv_file_path: str) -> str:
+    """
+    The function returns the path of the binary feature table that belongs to the given CSV file.
+
+    :param csv_file_path: The full path of the CSV file (e.g., anion-data.csv).
+    :return: The full path of the feature table directory (e.g., anion-data-features).
+    """
+
+    return f'{os.path.splitext(csv_file_path)[0]}-features'
+
+
+def save_feature_table(feature_table_path: str, values: ndarray, columns: list[str], index: ndarray):
+    """
+    The function saves a feature table as a bundle of NumPy files (values, column names and complex indices). Every
+    array is stored in the binary .npy format, so the bundle can be memory-mapped on load.
+
+    :param feature_table_path: The full path of the feature table directory.
+    :param values: The two-dimensional array of feature values (one row per complex).
+    :param columns: The names of the feature columns.
+    :param index: The complex indices (one per row).
+    :raises RuntimeError: The shapes of the given arrays do not match.
+    """
+
+    values, index = asarray(values, dtype=float), asarray(index, dtype=int)
+
+    if values.ndim != 2 or values.shape[0] != len(index) or values.shape[1] != len(columns):
+        raise RuntimeError('the shapes of the values, columns and index do not match.')
+
+    os.makedirs(feature_table_path, exist_ok=True)
+
+    save(os.path.join(feature_table_path, VALUES_FILE), values)
+    save(os.path.join(feature_table_path, COLUMNS_FILE), asarray(columns, dtype=str))
+    save(os.path.join(feature_table_path, INDEX_FILE), index)
+
+
+def load_feature_table(feature_table_path: str, mmap_mode: str | None = 'r') -> tuple[ndarray, ndarray, ndarray]:
+    """
+    The function loads a feature table saved with the save_feature_table function.
+
+    :param feature_table_path: The full path of the feature table directory.
+    :param mmap_mode: The memory-map mode of the values and index arrays (None loads the arrays into memory).
+    :raises FileNotFoundError: The feature table does not exist.
+    :return: The feature values, the column names and the complex indices.
+    """
+
+    values = load(os.path.join(feature_table_path, VALUES_FILE), mmap_mode=mmap_mode)
+    columns = load(os.path.join(feature_table_path, COLUMNS_FILE))
+    index = load(os.path.join(feature_table_path, INDEX_FILE), mmap_mode=mmap_mode)
+
+    return values, columns, index
+
+
+def convert_csv_to_feature_table(csv_file_path: str, feature_table_path: str | None = None) -> str:
+    """
+    The function converts a CSV data set (the first column holds the complex indices) into a feature table.
+
+    :param csv_file_path: The full path of the CSV file.
+    :param feature_table_path: The full path of the feature table directory (derived from the CSV path if None).
+    :return: The full path of the feature table directory.
+    """
+
+    if feature_table_path is None:
+        feature_table_path = get_feature_table_path(csv_file_path)
+
+    # The round-trip float parser reads back exactly the values that were written.
+    data = read_csv(csv_file_path, float_precision='round_trip')
+
+    save_feature_table(feature_table_path, data.iloc[:, 1:].to_numpy(dtype=float), list(data.columns[1:]),
+                       data.iloc[:, 0].to_numpy(dtype=int))
+
+    return feature_table_path
+
+
+def update_feature_table(csv_file_path: str) -> str:
+    """
+    The function (re)creates the feature table next to the CSV file if it is missing or out of date.
+
+    :param csv_file_path: The full path of the CSV file.
+    :return: The full path of the feature table directory.
+    """
+
+    feature_table_path = get_feature_table_path(csv_file_path)
+    values_file_path = os.path.join(feature_table_path, VALUES_FILE)
+
+    if not os.path.isfile(values_file_path) or os.path.getmtime(values_file_path) < os.path.getmtime(csv_file_path):
+        convert_csv_to_feature_table(csv_file_path, feature_table_path)
+
+    return feature_table_path
+
+
+def read_feature_data_frame(csv_file_path: str) -> DataFrame:
+    """
+    The function returns a CSV data set as a Pandas dataframe. The values are memory-mapped from the feature table
+    next to the CSV file; the feature table is (re)created from the CSV file if it is missing or out of date.
+
+    :param csv_file_path: The full path of the CSV file.
+    :return: The data set with the complex indices in the first column.
+    """
+
+    values, columns, index = load_feature_table(update_feature_table(csv_file_path))
+
+    data = DataFrame(values, columns=columns.tolist(), copy=False)
+    data.insert(0, INDEX_COLUMN, index)
+
+    return data
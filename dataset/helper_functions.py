@@ -0,0 +1,94 @@
+import hashlib
+import json
+
+from numpy import array
+
+from complexes.complex_guest_anion import ComplexGuestAnion
+from complexes.complex_guest_octahedral_anion import ComplexGuestOctahedralAnion
+from complexes.complex_guest_spherical_anion import ComplexGuestSphericalAnion
+from complexes.complex_guest_tetrahedral_anion import ComplexGuestTetrahedralAnion
+from complexes.guest import Guest
+from molecular_structure.atom import Atom
+from molecular_structure.neighbor_list import BondTopology, VerletNeighborList
+
+ENERGY_COLUMNS = [
+    'Experimental dG',
+    'Dipole Interactions',
+    'Non-polar Dipole Interactions',
+    'Freely rotating Dipole Interactions',
+    'Freely rotating Dipoles Interactions',
+    'Covalent Radius'
+]
+
+# The entries of the information file that the interaction energies depend on.
+ENERGY_INFORMATION_KEYS = ['Guest - Central Atom', 'Guest - Vertex Atoms', 'Solvent', 'HOMO-LUMO Gap']
+
+
+def get_host_guest_complex(atoms: list[Atom], complex_information: dict,
+                           neighbor_list: VerletNeighborList | None = None,
+                           bond_topology: BondTopology | None = None) -> ComplexGuestAnion:
+    """
+    The function forms the host-guest complex object that matches the shape of the guest anion.
+
+    :param atoms: A list of Atom objects that represent the structure of the complex.
+    :param complex_information: The experimental and computational data of the complex (the information file).
+    :param neighbor_list: The neighbor list of the central atom reused across frames (None searches all atoms).
+    :param bond_topology: The bonds held fixed across frames (None perceives the bonds from the distances).
+    :raises RuntimeError: The guest is not a spherical, tetrahedral, or octahedral anion.
+    :return: The host-guest complex.
+    """
+
+    central_atom = complex_information.get('Guest - Central Atom')
+    vertex_atoms = list(complex_information.get('Guest - Vertex Atoms'))
+    solvent = complex_information.get('Solvent')
+    homo_lumo_gap = complex_information.get('HOMO-LUMO Gap')
+
+    guest = Guest(central_atom, vertex_atoms)
+
+    if len(vertex_atoms) == 0:
+        return ComplexGuestSphericalAnion(atoms, guest, solvent, homo_lumo_gap, neighbor_list, bond_topology)
+
+    elif len(vertex_atoms) == 4:
+        return ComplexGuestTetrahedralAnion(atoms, guest, solvent, homo_lumo_gap, neighbor_list, bond_topology)
+
+    elif len(vertex_atoms) == 6:
+        return ComplexGuestOctahedralAnion(atoms, guest, solvent, homo_lumo_gap, neighbor_list, bond_topology)
+
+    raise RuntimeError('not dealing with spherical, tetrahedral, or octahedral anions!')
+
+
+def get_energy_features(host_guest_complex: ComplexGuestAnion, interaction_radius: float = 6.0) -> list[float]:
+    """
+    The function calculates the interaction energy features of a host-guest complex.
+
+    :param host_guest_complex: The host-guest complex.
+    :param interaction_radius: The cut-off radius of the interactions in Angstroms.
+    :return: The dipole, non-polar dipole, freely rotating dipole and freely rotating dipoles interactions in Hartrees
+    and the covalent radius of the central atom of the guest.
+    """
+
+    return [
+        host_guest_complex.get_dipole_interactions(interaction_radius),
+        host_guest_complex.get_non_polar_dipole_interactions(interaction_radius),
+        host_guest_complex.get_freely_rotating_dipole_interactions(interaction_radius),
+        host_guest_complex.get_freely_rotating_dipoles_interactions(interaction_radius),
+        host_guest_complex.atoms[host_guest_complex.guest.central_atom].covalent_radius
+    ]
+
+
+def get_complex_hash(atoms: list[Atom], complex_information: dict) -> str:
+    """
+    The function returns the hash of the inputs of the interaction energies (the atoms, the guest, the solvent and the
+    HOMO-LUMO gap).
+
+    :param atoms: A list of Atom objects that represent the structure of the complex.
+    :param complex_information: The experimental and computational data of the complex (the information file).
+    :return: The hash of the complex.
+    """
+
+    complex_hash = hashlib.sha256()
+    complex_hash.update(' '.join(atom.element for atom in atoms).encode())
+    complex_hash.update(array([[*atom.coord, atom.charge] for atom in atoms], dtype='<f8').tobytes())
+    complex_hash.update(json.dumps({key: complex_information.get(key) for key in ENERGY_INFORMATION_KEYS}).encode())
+
+    return complex_hash.hexdigest()
@@ -0,0 +1,244 @@
+import json
+import os
+from itertools import islice
+from typing import Iterable, Iterator
+
+from numpy import array, concatenate, ndarray
+
+from complexes.complex_guest_anion import ComplexGuestAnion
+from dataset.helper_functions import ENERGY_COLUMNS, get_complex_hash, get_energy_features, get_host_guest_complex
+from dataset.complex_archive import ComplexArchive, get_archive_path, is_archive_current
+from descriptors.atomic_structures import get_ase_atoms
+from descriptors.descriptor_cache import DescriptorCache, create_cached_descriptor_matrix
+from descriptors.descriptor_registry import Descriptor
+from molecular_structure.atom import Atom
+from molecular_structure.compressed_files import find_file
+from molecular_structure.extended_xyz import make_list_of_atoms_from_extended_xyz
+from molecular_structure.molecular_structure import make_list_of_atoms
+
+
+class ComplexRecord:
+    """
+    A class that represents a complex on its way through the pipeline; every stage fills in the data it produces.
+    """
+
+    def __init__(self, index: int, information_file_path: str | None = None, coordinates_file_path: str | None = None,
+                 charge_file_path: str | None = None, extended_xyz_file_path: str | None = None):
+        """
+        :param index: The index of the complex in the data set.
+        :param information_file_path: The full path of the information file of the complex (None if packed).
+        :param coordinates_file_path: The full path of the Cartesian coordinates file of the complex (None if packed).
+        :param charge_file_path: The full path of the atom charges file of the complex (None if packed).
+        :param extended_xyz_file_path: The full path of the extended XYZ file with the atoms, the charges and the
+        information of the complex (None if the complex has separate files).
+        """
+
+        self.index = index
+        self.information_file_path = information_file_path
+        self.coordinates_file_path = coordinates_file_path
+        self.charge_file_path = charge_file_path
+        self.extended_xyz_file_path = extended_xyz_file_path
+
+        self.information: dict | None = None
+        self.atoms: list[Atom] | None = None
+        self.host_guest_complex: ComplexGuestAnion | None = None
+        self.energy_features: ndarray | None = None
+        self.descriptor: ndarray | None = None
+
+
+def discover_complexes(directory: str, prefix: str, number_of_complexes: int = 500, index_offset: int = 0,
+                       use_archive: bool | None = None) -> Iterator[ComplexRecord]:
+    """
+    The stage yields the complexes stored in the directory (the files are named <prefix>-NNN-information.json,
+    <prefix>-NNN-geometry.xyz and <prefix>-NNN-charges, which may be compressed, e.g., <prefix>-NNN-geometry.xyz.gz);
+    complex indices without an information file are skipped. A complex may also be a single extended XYZ file with
+    the charges and the information (<prefix>-NNN.extxyz). If the directory has a packed archive of the complexes
+    (<prefix>-archive), the complexes are read from the archive, unless a complex file is newer than the archive.
+
+    :param directory: The full path of the directory with the complex files.
+    :param prefix: The prefix of the complex file names.
+    :param number_of_complexes: The number of potential complex indices that are checked.
+    :param index_offset: The offset added to the complex indices in the data set.
+    :param use_archive: Whether the complexes are read from the archive (True), from the complex files (False), or
+    from the archive if it is not older than the complex files (None).
+    :raises FileNotFoundError: The archive is used, but it does not exist.
+    :return: The complex records.
+    """
+
+    if use_archive or (use_archive is None and is_archive_current(directory, prefix)):
+        yield from discover_archive_complexes(ComplexArchive(get_archive_path(directory, prefix)),
+                                              number_of_complexes, index_offset)
+        return
+
+    for index in range(number_of_complexes):
+        complex_path = os.path.join(directory, f'{prefix}-{index:03}')
+
+        if os.path.isfile(f'{complex_path}-information.json'):
+            yield ComplexRecord(index + index_offset, f'{complex_path}-information.json',
+                                find_file(f'{complex_path}-geometry.xyz'), find_file(f'{complex_path}-charges'))
+
+        elif os.path.isfile(extended_xyz_file_path := find_file(f'{complex_path}.extxyz')):
+            yield ComplexRecord(index + index_offset, extended_xyz_file_path=extended_xyz_file_path)
+
+
+def discover_archive_complexes(archive: ComplexArchive, number_of_complexes: int = 500,
+                               index_offset: int = 0) -> Iterator[ComplexRecord]:
+    """
+    The stage yields the complexes of a packed archive with the information and the atoms already filled in.
+
+    :param archive: The packed archive of the complexes.
+    :param number_of_complexes: The number of potential complex indices that are checked.
+    :param index_offset: The offset added to the complex indices in the data set.
+    :return: The complex records with the information and the atoms.
+    """
+
+    for position in range(len(archive)):
+        index = archive.get_index(position)
+
+        if index < number_of_complexes:
+            record = ComplexRecord(index + index_offset)
+            record.information = archive.get_information(position)
+            record.atoms = archive.get_atoms(position)
+
+            yield record
+
+
+def parse_complexes(records: Iterable[ComplexRecord]) -> Iterator[ComplexRecord]:
+    """
+    The stage reads the information, the coordinates and the charges of the complexes (records from an archive are
+    passed on as they are).
+
+    :param records: The complex records.
+    :return: The complex records with the information and the atoms.
+    """
+
+    for record in records:
+        if record.extended_xyz_file_path is not None and record.atoms is None:
+            record.atoms, record.information = make_list_of_atoms_from_extended_xyz(record.extended_xyz_file_path)
+
+        if record.information is None:
+            with open(record.information_file_path, 'r') as information_file:
+                record.information = json.load(information_file)
+
+        if record.atoms is None:
+            record.atoms = make_list_of_atoms(record.coordinates_file_path, record.charge_file_path)
+
+        yield record
+
+
+def build_complexes(records: Iterable[ComplexRecord]) -> Iterator[ComplexRecord]:
+    """
+    The stage forms the host-guest complex objects.
+
+    :param records: The complex records with the information and the atoms.
+    :return: The complex records with the host-guest complexes.
+    """
+
+    for record in records:
+        record.host_guest_complex = get_host_guest_complex(record.atoms, record.information)
+
+        yield record
+
+
+def calculate_energies(records: Iterable[ComplexRecord], interaction_radius: float = 6.0,
+                       cache: DescriptorCache | None = None) -> Iterator[ComplexRecord]:
+    """
+    The stage calculates the interaction energy features of the complexes (or loads them from the cache).
+
+    :param records: The complex records with the host-guest complexes.
+    :param interaction_radius: The cut-off radius of the interactions in Angstroms.
+    :param cache: The cache of the energies (None disables caching).
+    :return: The complex records with the energy features.
+    """
+
+    energy_parameters = {'interaction_radius': interaction_radius}
+
+    for record in records:
+        if cache is not None:
+            complex_hash = get_complex_hash(record.atoms, record.information)
+            record.energy_features = cache.load(complex_hash, 'energies', energy_parameters)
+
+        if record.energy_features is None:
+            record.energy_features = array(get_energy_features(record.host_guest_complex, interaction_radius),
+                                           dtype=float)
+
+            if cache is not None:
+                cache.save(complex_hash, 'energies', energy_parameters, record.energy_features)
+
+        yield record
+
+
+def calculate_descriptors(records: Iterable[ComplexRecord], descriptor: Descriptor, batch_size: int = 64,
+                          n_jobs: int = 1, cache: DescriptorCache | None = None) -> Iterator[ComplexRecord]:
+    """
+    The stage calculates the descriptors of the complexes in batches (one batched descriptor call per batch), so only
+    one batch of structures is held in memory.
+
+    :param records: The complex records with the host-guest complexes.
+    :param descriptor: The registered descriptor centered on the central atom of the guest.
+    :param batch_size: The number of complexes per batch.
+    :param n_jobs: The number of parallel jobs used for the descriptors.
+    :param cache: The descriptor cache (None disables caching).
+    :return: The complex records with the descriptors.
+    """
+
+    records = iter(records)
+
+    while batch := list(islice(records, batch_size)):
+        descriptors = create_cached_descriptor_matrix(
+            descriptor, [get_ase_atoms(record.atoms) for record in batch],
+            [record.host_guest_complex.guest.central_atom for record in batch], cache, n_jobs)
+
+        for record, record_descriptor in zip(batch, descriptors):
+            record.descriptor = record_descriptor
+
+        yield from batch
+
+
+def make_rows(records: Iterable[ComplexRecord]) -> Iterator[tuple[int, ndarray]]:
+    """
+    The stage forms the data set rows (dG, energies, covalent radius and descriptors).
+
+    :param records: The complex records with the energy features and the descriptors.
+    :return: The complex indices and the data set rows.
+    """
+
+    for record in records:
+        yield record.index, concatenate([[record.information.get('dG')], record.energy_features, record.descriptor])
+
+
+def get_columns(descriptor: Descriptor) -> list[str]:
+    """
+    :param descriptor: The registered descriptor.
+    :return: The column names of the data set rows.
+    """
+
+    return ENERGY_COLUMNS + [str(number) for number in range(descriptor.get_number_of_features())]
+
+
+def run_pipeline(directory: str, prefix: str, descriptor: Descriptor, number_of_complexes: int = 500,
+                 index_offset: int = 0, interaction_radius: float = 6.0, batch_size: int = 64, n_jobs: int = 1,
+                 cache: DescriptorCache | None = None) -> Iterator[tuple[int, ndarray]]:
+    """
+    The function composes the stages (discover, parse, build complex, energies, descriptors and row) into a lazy
+    pipeline that yields the data set rows while they are produced.
+
+    :param directory: The full path of the directory with the complex files (or their packed archive).
+    :param prefix: The prefix of the complex file names.
+    :param descriptor: The registered descriptor centered on the central atom of the guest.
+    :param number_of_complexes: The number of potential complex indices that are checked.
+    :param index_offset: The offset added to the complex indices in the data set.
+    :param interaction_radius: The cut-off radius of the interactions in Angstroms.
+    :param batch_size: The number of complexes per descriptor batch.
+    :param n_jobs: The number of parallel jobs used for the descriptors.
+    :param cache: The cache of the energies and descriptors (None disables caching).
+    :return: The complex indices and the data set rows.
+    """
+
+    records = discover_complexes(directory, prefix, number_of_complexes, index_offset)
+    records = parse_complexes(records)
+    records = build_complexes(records)
+    records = calculate_energies(records, interaction_radius, cache)
+    records = calculate_descriptors(records, descriptor, batch_size, n_jobs, cache)
+
+    return make_rows(records)
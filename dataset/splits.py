@@ -0,0 +1,84 @@
+import json
+
+from numpy import asarray, isin, ndarray, zeros
+
+from dataset.feature_table import load_feature_table, update_feature_table
+
+
+def load_split_definition(splits_file_path: str, name: str) -> dict[str, ndarray]:
+    """
+    The function loads a split definition from the splits file, a JSON file that maps the name of every model to its
+    splits, e.g., {"cavitand": {"TRN": [0, 2, ...], "VAL": [5, ...], "TST": [1, ...]}}.
+
+    :param splits_file_path: The full path of the splits file.
+    :param name: The name of the split definition (e.g., cavitand).
+    :raises RuntimeError: The splits file has no split definition with the given name.
+    :return: The complex indices of every split.
+    """
+
+    with open(splits_file_path, 'r') as splits_file:
+        split_definitions = json.load(splits_file)
+
+    if name not in split_definitions:
+        raise RuntimeError(f'{splits_file_path} has no split definition named {name}.')
+
+    return {split: asarray(indices, dtype=int) for split, indices in split_definitions[name].items()}
+
+
+def get_split_masks(index: ndarray, split_definition: dict[str, ndarray], complete: bool = True) -> dict[str, ndarray]:
+    """
+    :param index: The complex indices of the rows of the data set.
+    :param split_definition: The complex indices of every split.
+    :param complete: Whether every row of the data set has to be in a split.
+    :raises RuntimeError: A row is in more than one split, or a row is in no split (if complete).
+    :return: The boolean row mask of every split.
+    """
+
+    masks = {split: isin(index, indices) for split, indices in split_definition.items()}
+
+    # Count the splits of every row.
+    counts = zeros(len(index), dtype=int)
+
+    for mask in masks.values():
+        counts += mask
+
+    if (counts > 1).any():
+        raise RuntimeError(f'index {index[counts > 1][0]} is used in more than one split.')
+
+    if complete and (counts == 0).any():
+        raise RuntimeError(f'index {index[counts == 0][0]} is not used.')
+
+    return masks
+
+
+def load_data_arrays(csv_file_path: str) -> tuple[ndarray, ndarray, ndarray]:
+    """
+    The function loads a CSV data set from the feature table next to it (the first column holds the values and the
+    other columns the descriptors).
+
+    :param csv_file_path: The full path of the CSV file.
+    :return: The descriptors (rows, descriptors), the values (rows,) and the complex indices (rows,) of the data set.
+    """
+
+    values, _, index = load_feature_table(update_feature_table(csv_file_path))
+
+    return values[:, 1:], values[:, 0], index
+
+
+def load_split_arrays(csv_file_path: str, split_definition: dict[str, ndarray],
+                      complete: bool = True) -> dict[str, tuple[ndarray, ndarray]]:
+    """
+    The function splits a CSV data set by masking the rows of the memory-mapped feature table with the complex indices
+    of every split; the rows keep the order of the data set.
+
+    :param csv_file_path: The full path of the CSV file.
+    :param split_definition: The complex indices of every split.
+    :param complete: Whether every row of the data set has to be in a split.
+    :raises RuntimeError: A row is in more than one split, or a row is in no split (if complete).
+    :return: The descriptors and the values of every split.
+    """
+
+    descriptors, values, index = load_data_arrays(csv_file_path)
+    masks = get_split_masks(index, split_definition, complete)
+
+    return {split: (descriptors[mask], values[mask]) for split, mask in masks.items()}
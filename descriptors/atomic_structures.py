@@ -0,0 +1,58 @@
+from ase import Atoms
+from numpy import asarray, cumsum, linalg, ndarray, zeros
+
+from molecular_structure.atom import Atom
+
+
+def make_ase_atoms(elements: list[str], coordinates: list[list[float]] | ndarray) -> Atoms:
+    """
+    The function converts an already parsed structure into an ASE Atoms object (the input of the descriptors), so the
+    Cartesian coordinates file does not have to be read again with ase.io.read.
+
+    :param elements: The element symbols of the atoms.
+    :param coordinates: The Cartesian coordinates of the atoms in Angstroms.
+    :raises RuntimeError: The number of elements and coordinates do not match.
+    :return: The structure as a non-periodic ASE Atoms object.
+    """
+
+    coordinates = asarray(coordinates, dtype=float).reshape(-1, 3)
+
+    if len(elements) != len(coordinates):
+        raise RuntimeError('the number of elements and coordinates do not match.')
+
+    return Atoms(symbols=[element.capitalize() for element in elements], positions=coordinates, pbc=False)
+
+
+def get_ase_atoms(atoms: list[Atom]) -> Atoms:
+    """
+    The function converts a list of Atom objects into an ASE Atoms object.
+
+    :param atoms: The list of Atom objects that form the structure.
+    :return: The structure as a non-periodic ASE Atoms object.
+    """
+
+    return make_ase_atoms([atom.element for atom in atoms], [atom.coord for atom in atoms])
+
+
+def crop_structure(structure: Atoms, centers: list[int], r_cut: float) -> tuple[Atoms, list[int]]:
+    """
+    The function crops the structure to the atoms that are within the cut-off radius of at least one of the centers.
+    Descriptors with a strict cut-off (e.g., ACSF) are unchanged by the cropping, while the descriptor input (and the
+    neighbour search) shrinks for large hosts.
+
+    :param structure: The structure as an ASE Atoms object.
+    :param centers: The indices of the center atoms.
+    :param r_cut: The cut-off radius of the descriptor in Angstroms.
+    :return: The cropped structure (the atoms keep their original order) and the indices of the centers in it.
+    """
+
+    positions = structure.get_positions()
+    kept_atoms = zeros(len(structure), dtype=bool)
+
+    for center in centers:
+        kept_atoms |= linalg.norm(positions - positions[center], axis=1) <= r_cut
+
+    # The new index of an atom is the number of kept atoms before it.
+    new_indices = cumsum(kept_atoms) - 1
+
+    return structure[kept_atoms], [int(new_indices[center]) for center in centers]
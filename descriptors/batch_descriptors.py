@@ -0,0 +1,38 @@
+from ase import Atoms
+from numpy import asarray, empty, float32, ndarray
+
+from descriptors.atomic_structures import crop_structure
+
+
+def create_descriptor_matrix(descriptor, structures: list[Atoms], centers: list[int], n_jobs: int = 1,
+                             crop_radius: float | None = None) -> ndarray:
+    """
+    The function calculates the descriptors of all given structures in a single batched (and parallel) call of the
+    descriptor, instead of calling the descriptor one structure at a time.
+
+    :param descriptor: The DScribe descriptor object (e.g., ACSF, SOAP, or LMBTR).
+    :param structures: The structures as ASE Atoms objects.
+    :param centers: The index of the center atom (the central atom of the guest) in each structure.
+    :param n_jobs: The number of parallel jobs (a negative number counts back from the number of CPUs).
+    :param crop_radius: The structures are cropped to the atoms within this radius of the center before the descriptor
+    is calculated (use the cut-off radius of descriptors with a strict cut-off, e.g. ACSF; None disables cropping).
+    :raises RuntimeError: The number of structures and centers do not match.
+    :return: The descriptor matrix (one float32 row per structure, in the order of the given structures).
+    """
+
+    if len(structures) != len(centers):
+        raise RuntimeError('the number of structures and centers do not match.')
+
+    if len(structures) == 0:
+        return empty((0, descriptor.get_number_of_features()), dtype=float32)
+
+    if crop_radius is not None:
+        cropped_structures = [crop_structure(structure, [center], crop_radius)
+                              for structure, center in zip(structures, centers)]
+
+        structures = [structure for structure, _ in cropped_structures]
+        centers = [cropped_centers[0] for _, cropped_centers in cropped_structures]
+
+    descriptors = descriptor.create(structures, centers=[[center] for center in centers], n_jobs=n_jobs)
+
+    return asarray(descriptors, dtype=float32).reshape(len(structures), -1)
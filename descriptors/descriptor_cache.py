@@ -0,0 +1,116 @@
+import hashlib
+import json
+import os
+
+from ase import Atoms
+from numpy import ascontiguousarray, empty, float32, load, ndarray, save
+
+from descriptors.descriptor_registry import Descriptor
+
+
+def get_geometry_hash(structure: Atoms, center: int) -> str:
+    """
+    The function returns the hash of a structure (atomic numbers and positions) and the center of the descriptor.
+
+    :param structure: The structure as an ASE Atoms object.
+    :param center: The index of the center atom.
+    :return: The hash of the geometry.
+    """
+
+    geometry_hash = hashlib.sha256()
+    geometry_hash.update(ascontiguousarray(structure.get_atomic_numbers(), dtype='<i8').tobytes())
+    geometry_hash.update(ascontiguousarray(structure.get_positions(), dtype='<f8').tobytes())
+    geometry_hash.update(str(center).encode())
+
+    return geometry_hash.hexdigest()
+
+
+class DescriptorCache:
+    """
+    A class that stores computed blocks of values (e.g., descriptors) on disk. A block is keyed by the hash of the
+    input, the name of the block and the hash of its parameters, and is stored as <name>/<parameter hash>/<input
+    hash>.npy inside the cache directory.
+    """
+
+    def __init__(self, directory: str):
+        """
+        :param directory: The full path of the cache directory.
+        """
+
+        self.directory = directory
+
+    def get_path(self, input_hash: str, name: str, parameters: dict) -> str:
+        """
+        :param input_hash: The hash of the input (e.g., the geometry hash).
+        :param name: The name of the block (e.g., the descriptor name).
+        :param parameters: The parameters of the block (must be JSON serialisable).
+        :return: The full path of the cached block.
+        """
+
+        parameter_hash = hashlib.sha256(json.dumps(parameters, sort_keys=True).encode()).hexdigest()
+
+        return os.path.join(self.directory, name, parameter_hash, f'{input_hash}.npy')
+
+    def load(self, input_hash: str, name: str, parameters: dict) -> ndarray | None:
+        """
+        :return: The cached block (None if the block is not cached).
+        """
+
+        try:
+            return load(self.get_path(input_hash, name, parameters))
+
+        except FileNotFoundError:
+            return None
+
+    def save(self, input_hash: str, name: str, parameters: dict, values: ndarray):
+        """
+        The function stores a block in the cache (the file is renamed into place, so readers never see a partial file).
+        """
+
+        path = self.get_path(input_hash, name, parameters)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(f'{path}.{os.getpid()}.tmp', 'wb') as temporary_file:
+            save(temporary_file, values)
+
+        os.replace(f'{path}.{os.getpid()}.tmp', path)
+
+
+def create_cached_descriptor_matrix(descriptor: Descriptor, structures: list[Atoms], centers: list[int],
+                                    cache: DescriptorCache | None = None, n_jobs: int = 1) -> ndarray:
+    """
+    The function returns the descriptor matrix of the given structures. The cached descriptors are loaded from the
+    cache, while the missing descriptors are calculated in one batched call and stored in the cache.
+
+    :param descriptor: The registered descriptor.
+    :param structures: The structures as ASE Atoms objects.
+    :param centers: The index of the center atom in each structure.
+    :param cache: The descriptor cache (None disables caching).
+    :param n_jobs: The number of parallel jobs.
+    :return: The descriptor matrix (one float32 row per structure).
+    """
+
+    if cache is None:
+        return descriptor.create(structures, centers, n_jobs)
+
+    descriptors = empty((len(structures), descriptor.get_number_of_features()), dtype=float32)
+    geometry_hashes = [get_geometry_hash(structure, center) for structure, center in zip(structures, centers)]
+    missing_rows = []
+
+    for row, geometry_hash in enumerate(geometry_hashes):
+        cached_descriptor = cache.load(geometry_hash, descriptor.name, descriptor.parameters)
+
+        if cached_descriptor is None:
+            missing_rows.append(row)
+        else:
+            descriptors[row] = cached_descriptor
+
+    if missing_rows:
+        missing_descriptors = descriptor.create([structures[row] for row in missing_rows],
+                                                [centers[row] for row in missing_rows], n_jobs)
+
+        for row, missing_descriptor in zip(missing_rows, missing_descriptors):
+            descriptors[row] = missing_descriptor
+            cache.save(geometry_hashes[row], descriptor.name, descriptor.parameters, missing_descriptor)
+
+    return descriptors
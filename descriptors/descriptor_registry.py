@@ -0,0 +1,133 @@
+from typing import Callable
+
+from ase import Atoms
+from dscribe.descriptors import ACSF, LMBTR, SOAP
+from numpy import empty, float32, ndarray
+
+from descriptors.batch_descriptors import create_descriptor_matrix
+
+ELEMENT_SYMBOLS = ['H', 'B', 'C', 'N', 'O', 'F', 'P', 'S', 'Cl', 'Br', 'Sb', 'I', 'Re']
+
+# The registered descriptors: the name maps to the factory, the default parameters and the name of the parameter that
+# holds the strict cut-off radius (the structures are cropped to this radius; None if the descriptor has no strict
+# cut-off).
+DESCRIPTOR_REGISTRY: dict[str, tuple[Callable | None, dict, str | None]] = {}
+
+
+def register_descriptor(name: str, factory: Callable | None, default_parameters: dict,
+                        cut_off_parameter: str | None = None):
+    """
+    The function registers a descriptor, so it can be selected by its name.
+
+    :param name: The name of the descriptor.
+    :param factory: The function that forms the DScribe descriptor object from the parameters (None if the descriptor
+    has no features).
+    :param default_parameters: The default parameters of the descriptor (must be JSON serialisable).
+    :param cut_off_parameter: The name of the parameter that holds the strict cut-off radius of the descriptor.
+    """
+
+    DESCRIPTOR_REGISTRY[name.lower()] = (factory, default_parameters, cut_off_parameter)
+
+
+class Descriptor:
+    """
+    A class that represents a registered descriptor selected by its name and parameters.
+    """
+
+    def __init__(self, name: str, **parameters):
+        """
+        :param name: The name of the registered descriptor (e.g., acsf, soap, lmbtr, or energy).
+        :param parameters: The parameters that replace the default parameters of the descriptor.
+        :raises RuntimeError: The descriptor is not registered or an unknown parameter is given.
+        """
+
+        if name.lower() not in DESCRIPTOR_REGISTRY:
+            raise RuntimeError(f'descriptor {name} is not registered.')
+
+        factory, default_parameters, cut_off_parameter = DESCRIPTOR_REGISTRY[name.lower()]
+
+        unknown_parameters = sorted(set(parameters) - set(default_parameters))
+
+        if unknown_parameters:
+            raise RuntimeError(f'unknown parameters for descriptor {name}: {", ".join(unknown_parameters)}.')
+
+        self.name = name.lower()
+        self.parameters = {**default_parameters, **parameters}
+        self.crop_radius = self.parameters[cut_off_parameter] if cut_off_parameter is not None else None
+
+        self.descriptor = factory(**self.parameters) if factory is not None else None
+
+    def get_number_of_features(self) -> int:
+        """
+        :return: The number of features of the descriptor.
+        """
+
+        return self.descriptor.get_number_of_features() if self.descriptor is not None else 0
+
+    def create(self, structures: list[Atoms], centers: list[int], n_jobs: int = 1) -> ndarray:
+        """
+        The function calculates the descriptors of the given structures in one batched call.
+
+        :param structures: The structures as ASE Atoms objects.
+        :param centers: The index of the center atom in each structure.
+        :param n_jobs: The number of parallel jobs.
+        :return: The descriptor matrix (one float32 row per structure).
+        """
+
+        if self.descriptor is None:
+            return empty((len(structures), 0), dtype=float32)
+
+        return create_descriptor_matrix(self.descriptor, structures, centers, n_jobs, self.crop_radius)
+
+
+def make_acsf(species: list[str], r_cut: float, g2_params: list[list[float]], g4_params: list[list[float]]) -> ACSF:
+    """
+    :return: The atom-centered symmetry functions (ACSF) descriptor.
+    """
+
+    return ACSF(species=species, r_cut=r_cut, g2_params=g2_params, g4_params=g4_params)
+
+
+def make_soap(species: list[str], r_cut: float, n_max: int, l_max: int, weighting: dict) -> SOAP:
+    """
+    :return: The smooth overlap of atomic positions (SOAP) descriptor.
+    """
+
+    return SOAP(species=species, periodic=False, r_cut=r_cut, n_max=n_max, l_max=l_max, weighting=weighting)
+
+
+def make_lmbtr(species: list[str], geometry: dict, grid: dict, weighting: dict, normalization: str) -> LMBTR:
+    """
+    :return: The local many-body tensor representation (LMBTR) descriptor.
+    """
+
+    return LMBTR(species=species, geometry=geometry, grid=grid, weighting=weighting, periodic=False,
+                 normalization=normalization)
+
+
+register_descriptor('acsf', make_acsf, {
+    'species': ELEMENT_SYMBOLS,
+    'r_cut': 15.0,
+    'g2_params': [[1, 1], [1, 2], [1, 3]],
+    'g4_params': [[1, 1, 1], [1, 2, 1], [1, 1, -1], [1, 2, -1]]
+}, cut_off_parameter='r_cut')
+
+# The Gaussian smearing of the atoms extends SOAP beyond the cut-off radius; thus, the structures are not cropped.
+register_descriptor('soap', make_soap, {
+    'species': ELEMENT_SYMBOLS,
+    'r_cut': 15.0,
+    'n_max': 3,
+    'l_max': 3,
+    'weighting': {'function': 'pow', 'r0': 0.503, 'c': 1.0, 'd': 1.0, 'm': 2.0}
+})
+
+register_descriptor('lmbtr', make_lmbtr, {
+    'species': ELEMENT_SYMBOLS,
+    'geometry': {'function': 'distance'},
+    'grid': {'min': 0, 'max': 5, 'n': 100, 'sigma': 0.1},
+    'weighting': {'function': 'exp', 'scale': 0.5, 'threshold': 1e-3},
+    'normalization': 'l2'
+})
+
+# The energy-only data set has no descriptor features.
+register_descriptor('energy', None, {})
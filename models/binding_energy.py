@@ -0,0 +1,97 @@
+import time
+
+from numpy import array, concatenate
+
+from complexes.complex_guest_anion import ComplexGuestAnion
+from dataset.helper_functions import get_energy_features, get_host_guest_complex
+from molecular_structure.extended_xyz import make_list_of_atoms_from_extended_xyz
+
+# The stages of a prediction (in the order they run).
+PREDICTION_STAGES = ['energies', 'descriptor', 'model']
+
+# The loaded model artifacts and their descriptor objects of the process, keyed by the artifact path.
+_warm_models: dict = {}
+
+
+def get_warm_model(artifact_path: str) -> tuple:
+    """
+    The function loads a model artifact and forms its descriptor object once per process; later calls return the
+    same objects. scikit-learn, DScribe and ASE are only imported on the first call.
+
+    :param artifact_path: The full path of the model artifact.
+    :raises RuntimeError: The model was not trained on all features of the pipeline.
+    :return: The model artifact and its descriptor.
+    """
+
+    if artifact_path not in _warm_models:
+        from sklearn.ensemble import RandomForestRegressor
+
+        from models.flat_forest import flatten_random_forest
+        from models.model_artifact import load_model_artifact
+        from models.prediction import check_artifact_columns
+
+        artifact = load_model_artifact(artifact_path)
+
+        # A random forest is predicted from its flat arrays (the same predictions without the per-tree overhead), and
+        # the other models predict a single complex without parallel jobs.
+        if isinstance(artifact.model, RandomForestRegressor):
+            artifact.model = flatten_random_forest(artifact.model)
+
+        elif 'n_jobs' in artifact.model.get_params():
+            artifact.model.set_params(n_jobs=1)
+
+        descriptor = artifact.get_descriptor()
+        check_artifact_columns(artifact, descriptor)
+
+        _warm_models[artifact_path] = artifact, descriptor
+
+    return _warm_models[artifact_path]
+
+
+def read_host_guest_complex(extended_xyz_file_path: str) -> ComplexGuestAnion:
+    """
+    :param extended_xyz_file_path: The full path of the extended XYZ file with the atoms, the charges and the
+    information of the complex (may be compressed).
+    :raises RuntimeError: The guest is not a spherical, tetrahedral, or octahedral anion.
+    :return: The host-guest complex (read in one pass).
+    """
+
+    return get_host_guest_complex(*make_list_of_atoms_from_extended_xyz(extended_xyz_file_path))
+
+
+def predict_binding_energy(host_guest_complex: ComplexGuestAnion, artifact_path: str,
+                           timings: dict[str, float] | None = None) -> float:
+    """
+    The function predicts the binding free energy of a single host-guest complex with the warm model of the process
+    (see get_warm_model); the complex is used as it is, so its atoms are not parsed again.
+
+    :param host_guest_complex: The host-guest complex.
+    :param artifact_path: The full path of the model artifact.
+    :param timings: The dictionary that receives the duration of every stage in seconds (see PREDICTION_STAGES, the
+    model is loaded before the first stage).
+    :raises RuntimeError: The model was not trained on all features of the pipeline.
+    :return: The predicted binding free energy.
+    """
+
+    artifact, descriptor = get_warm_model(artifact_path)
+
+    from descriptors.atomic_structures import get_ase_atoms
+
+    start = time.perf_counter()
+    energy_features = get_energy_features(host_guest_complex, artifact.interaction_radius)
+
+    descriptor_start = time.perf_counter()
+    descriptor_features = descriptor.create([get_ase_atoms(host_guest_complex.atoms)],
+                                            [host_guest_complex.guest.central_atom])
+
+    model_start = time.perf_counter()
+    prediction = float(artifact.predict(concatenate([array(energy_features, dtype=float),
+                                                     descriptor_features[0]])[None, :])[0])
+
+    end = time.perf_counter()
+
+    if timings is not None:
+        timings.update(energies=descriptor_start - start, descriptor=model_start - descriptor_start,
+                       model=end - model_start)
+
+    return prediction
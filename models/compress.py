@@ -0,0 +1,80 @@
+import argparse
+import os
+import sys
+
+from sklearn.ensemble import RandomForestRegressor
+
+from dataset.feature_table import load_feature_table, update_feature_table
+from dataset.splits import load_split_arrays, load_split_definition
+from models.forest_compression import compress_random_forest, get_forest_report
+from models.model_artifact import load_model_artifact, save_model_artifact
+
+REPORT_ENTRIES = ['Trees', 'Nodes', 'Largest Depth', 'Size', 'Latency', 'Batch Latency', 'Flat Latency', 'MAE', 'R2']
+
+
+def write_report(output_file, reports: dict[str, dict]):
+    """
+    :param output_file: The text file the report is written to.
+    :param reports: The reports of the forests (see get_forest_report), keyed by the name of the forest.
+    """
+
+    output_file.write(f'{"":>14}' + ''.join(f'{name:>14}' for name in reports) + '\n')
+
+    for entry in REPORT_ENTRIES:
+        output_file.write(f'{entry:>14}' + ''.join(f'{report[entry]:>14.4g}' for report in reports.values()) + '\n')
+
+
+def main(arguments: list[str] | None = None):
+    """
+    The command line entry point, e.g.,
+
+    python -m models.compress data/cavitand-model --data data/anion-data.csv --splits data/splits.json \
+        --split-name cavitand --tolerance 0.2 --output data/cavitand-compressed-model
+
+    :param arguments: The command line arguments (sys.argv if None).
+    """
+
+    parser = argparse.ArgumentParser(prog='python -m models.compress',
+                                     description='Compress a saved random forest within a validation MAE tolerance.')
+    parser.add_argument('model', help='the directory of the saved model')
+    parser.add_argument('--data', required=True, help='the CSV data set the model was trained on')
+    parser.add_argument('--splits', required=True, help='the splits file of the data set')
+    parser.add_argument('--split-name', required=True, help='the name of the split definition (e.g., cavitand)')
+    parser.add_argument('--validation-split', default='VAL', help='the split the forest is compressed on')
+    parser.add_argument('--tolerance', type=float, required=True, help='the largest increase of the validation MAE')
+    parser.add_argument('--depths', type=int, nargs='+', help='the depths the trees are cut at (every depth if not '
+                                                              'given)')
+    parser.add_argument('--output', required=True, help='the directory of the compressed model')
+    options = parser.parse_args(arguments)
+
+    artifact = load_model_artifact(os.path.abspath(options.model))
+
+    if not isinstance(artifact.model, RandomForestRegressor):
+        parser.error(f'{options.model} is not a random forest.')
+
+    # The columns of the data set (the first column holds the values) have to be the columns of the model.
+    _, columns, _ = load_feature_table(update_feature_table(os.path.abspath(options.data)))
+    splits = load_split_arrays(os.path.abspath(options.data),
+                               load_split_definition(os.path.abspath(options.splits), options.split_name))
+
+    try:
+        artifact.validate(columns=list(columns[1:]))
+        descriptors, values = splits[options.validation_split]
+
+    except (RuntimeError, KeyError) as error:
+        parser.error(f'the validation split cannot be used: {error}')
+
+    artifact.model.set_params(n_jobs=1)
+    depths = [None] + options.depths if options.depths is not None else None
+    compressed_model = compress_random_forest(artifact.model, descriptors, values, options.tolerance, depths)
+
+    save_model_artifact(os.path.abspath(options.output), compressed_model, artifact.columns, artifact.get_descriptor(),
+                        artifact.interaction_radius)
+
+    write_report(sys.stdout, {'Full': get_forest_report(artifact.model, descriptors, values),
+                              'Compressed': get_forest_report(compressed_model, descriptors, values)})
+    print(f'The compressed model is saved to {options.output}.', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+import hashlib
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from joblib import effective_n_jobs
+from numpy import ascontiguousarray, load, ndarray, save
+from sklearn.base import BaseEstimator, clone
+from sklearn.metrics import mean_absolute_error, r2_score
+
+# The descriptors of a worker process (memory-mapped from the cache directory).
+_worker_state: dict = {}
+
+
+def get_fingerprint(*arrays: ndarray) -> str:
+    """
+    :param arrays: The arrays.
+    :return: The SHA-1 hash of the shapes, types and contents of the arrays.
+    """
+
+    fingerprint = hashlib.sha1()
+
+    for values in arrays:
+        values = ascontiguousarray(values)
+        fingerprint.update(f'{values.shape}{values.dtype}'.encode())
+        fingerprint.update(values.tobytes())
+
+    return fingerprint.hexdigest()
+
+
+def get_model_fingerprint(model: BaseEstimator) -> str:
+    """
+    :param model: The (unfitted) model.
+    :return: The SHA-1 hash of the class and the hyperparameters of the model.
+    """
+
+    parameters = sorted((key, repr(value)) for key, value in model.get_params(deep=True).items())
+
+    return hashlib.sha1(f'{type(model).__qualname__}{parameters}'.encode()).hexdigest()
+
+
+def get_fold_cache_path(cache_directory: str, name: str, fold: int, model_fingerprint: str,
+                        data_fingerprint: str) -> str:
+    """
+    :param cache_directory: The full path of the cache directory.
+    :param name: The name of the model.
+    :param fold: The index of the fold.
+    :param model_fingerprint: The hash of the hyperparameters of the model.
+    :param data_fingerprint: The hash of the descriptors, the values and the folds.
+    :return: The full path of the cached predictions of the model for the fold.
+    """
+
+    key = hashlib.sha1(f'{model_fingerprint}{data_fingerprint}'.encode()).hexdigest()[:16]
+
+    return os.path.join(cache_directory, f'{re.sub(r"[^A-Za-z0-9]+", "-", name).lower()}-fold-{fold}-{key}.npy')
+
+
+def save_array(file_path: str, values: ndarray):
+    """
+    The function writes the array into a temporary file first, so an interrupted run leaves no partial cache.
+
+    :param file_path: The full path of the .npy file.
+    :param values: The array.
+    """
+
+    with open(f'{file_path}.tmp', 'wb') as file:
+        save(file, values)
+
+    os.replace(f'{file_path}.tmp', file_path)
+
+
+def fit_fold(model: BaseEstimator, descriptors: ndarray, values: ndarray, train_index: ndarray,
+             test_index: ndarray) -> ndarray:
+    """
+    :param model: The (unfitted) model.
+    :param descriptors: The descriptors of the data set (samples, descriptors).
+    :param values: The values of the data set.
+    :param train_index: The rows of the training set of the fold.
+    :param test_index: The rows of the test set of the fold.
+    :return: The predictions of the model for the test set of the fold.
+    """
+
+    model = clone(model)
+    model.fit(descriptors[train_index], values[train_index])
+
+    return model.predict(descriptors[test_index])
+
+
+def _initialize_worker(descriptors_file_path: str, values: ndarray):
+    _worker_state.update(descriptors=load(descriptors_file_path, mmap_mode='r'), values=values)
+
+
+def _fit_worker_fold(model: BaseEstimator, train_index: ndarray, test_index: ndarray, cache_path: str) -> str:
+    save_array(cache_path, fit_fold(model, _worker_state['descriptors'], _worker_state['values'], train_index,
+                                    test_index))
+
+    return cache_path
+
+
+def cross_validate_models(models: list[tuple[str, BaseEstimator]], descriptors: ndarray, values: ndarray,
+                          folds: list[tuple[ndarray, ndarray]], cache_directory: str,
+                          n_jobs: int = 1) -> dict[str, list[ndarray]]:
+    """
+    The function cross-validates the models: every (model, fold) pair is a job of a process pool, and the predictions
+    of every job are cached in the cache directory, so a rerun only fits the models (or hyperparameters, data sets and
+    folds) that are not cached yet. The descriptors are written once into the cache directory and memory-mapped by
+    every worker process, so they are not copied into the jobs; the file is removed when the pool finishes.
+
+    :param models: The names and the (unfitted) models.
+    :param descriptors: The descriptors of the data set (samples, descriptors).
+    :param values: The values of the data set.
+    :param folds: The training and test rows of every fold.
+    :param cache_directory: The full path of the cache directory.
+    :param n_jobs: The number of worker processes (-1 uses all CPUs).
+    :return: The predictions of every model for the test set of every fold.
+    """
+
+    descriptors, values = ascontiguousarray(descriptors, dtype=float), ascontiguousarray(values, dtype=float)
+
+    os.makedirs(cache_directory, exist_ok=True)
+
+    data_fingerprint = get_fingerprint(descriptors, values, *[index for fold in folds for index in fold])
+    cache_paths = {name: [get_fold_cache_path(cache_directory, name, fold, get_model_fingerprint(model),
+                                              data_fingerprint) for fold in range(len(folds))]
+                   for name, model in models}
+
+    # The (model, fold) jobs without cached predictions.
+    jobs = [(model, *folds[fold], cache_paths[name][fold]) for name, model in models
+            for fold in range(len(folds)) if not os.path.isfile(cache_paths[name][fold])]
+
+    if n_jobs == 1:
+        for model, train_index, test_index, cache_path in jobs:
+            save_array(cache_path, fit_fold(model, descriptors, values, train_index, test_index))
+
+    elif len(jobs) > 0:
+        # The file of the run (named by the process, so concurrent runs do not remove each other's file).
+        descriptors_file_path = os.path.join(cache_directory, f'descriptors-{data_fingerprint[:16]}-{os.getpid()}.npy')
+        save_array(descriptors_file_path, descriptors)
+
+        try:
+            with ProcessPoolExecutor(effective_n_jobs(n_jobs), initializer=_initialize_worker,
+                                     initargs=(descriptors_file_path, values)) as executor:
+                list(executor.map(_fit_worker_fold, *zip(*jobs)))
+
+        finally:
+            os.remove(descriptors_file_path)
+
+    return {name: [load(cache_path) for cache_path in cache_paths[name]] for name, _ in models}
+
+
+def get_fold_scores(predictions: dict[str, list[ndarray]], values: ndarray,
+                    folds: list[tuple[ndarray, ndarray]]) -> tuple[dict[str, list[float]], dict[str, list[float]]]:
+    """
+    :param predictions: The predictions of every model for the test set of every fold.
+    :param values: The values of the data set.
+    :param folds: The training and test rows of every fold.
+    :return: The R2 scores and the mean absolute errors of every model for every fold.
+    """
+
+    r2_scores = {name: [float(r2_score(values[test_index], fold_predictions))
+                        for (_, test_index), fold_predictions in zip(folds, model_predictions)]
+                 for name, model_predictions in predictions.items()}
+    mae_scores = {name: [float(mean_absolute_error(values[test_index], fold_predictions))
+                         for (_, test_index), fold_predictions in zip(folds, model_predictions)]
+                  for name, model_predictions in predictions.items()}
+
+    return r2_scores, mae_scores
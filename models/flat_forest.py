@@ -0,0 +1,135 @@
+from numpy import arange, asarray, concatenate, cumsum, empty, float32, float64, int64, ndarray, repeat, where
+from sklearn.ensemble import RandomForestRegressor
+
+# The child index of the leaves in the scikit-learn trees.
+TREE_LEAF = -1
+
+
+class FlatForest:
+    """
+    A class that represents the trees of a random forest regressor as flat arrays: the nodes of all trees are
+    concatenated, and the children point to the global node indices. The trees are traversed for a batch of samples
+    at once, one level per step, so the prediction has no per-tree overhead.
+    """
+
+    def __init__(self, feature: ndarray, threshold: ndarray, children_left: ndarray, children_right: ndarray,
+                 value: ndarray, roots: ndarray, max_depth: int, n_features_in: int):
+        """
+        :param feature: The feature of every node (0 for the leaves).
+        :param threshold: The threshold of every node (samples with feature <= threshold go left).
+        :param children_left: The global index of the left child of every node (-1 for the leaves).
+        :param children_right: The global index of the right child of every node (-1 for the leaves).
+        :param value: The value of every node.
+        :param roots: The global index of the root of every tree.
+        :param max_depth: The depth of the deepest tree.
+        :param n_features_in: The number of features.
+        """
+
+        self.feature = feature
+        self.threshold = threshold
+        self.children_left = children_left
+        self.children_right = children_right
+        self.value = value
+        self.roots = roots
+        self.max_depth = max_depth
+        self.n_features_in = n_features_in
+
+    def get_number_of_trees(self) -> int:
+        """
+        :return: The number of trees.
+        """
+
+        return len(self.roots)
+
+    def get_number_of_nodes(self) -> int:
+        """
+        :return: The number of nodes of all trees.
+        """
+
+        return len(self.feature)
+
+    def get_size(self) -> int:
+        """
+        :return: The size of the arrays in bytes.
+        """
+
+        return sum(values.nbytes for values in [self.feature, self.threshold, self.children_left, self.children_right,
+                                                self.value, self.roots])
+
+    def apply(self, descriptors: ndarray) -> ndarray:
+        """
+        :param descriptors: The descriptors (samples, descriptors).
+        :return: The global index of the leaf of every sample in every tree (samples, trees).
+        """
+
+        # The trees split on single precision features (compared with the double precision thresholds).
+        descriptors = asarray(descriptors, dtype=float32).astype(float64)
+        rows = arange(len(descriptors))[:, None]
+
+        nodes = repeat(self.roots[None, :], len(descriptors), axis=0)
+
+        for _ in range(self.max_depth):
+            left = self.children_left[nodes]
+
+            if (left == TREE_LEAF).all():
+                break
+
+            go_left = descriptors[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = where(left == TREE_LEAF, nodes, where(go_left, left, self.children_right[nodes]))
+
+        return nodes
+
+    def predict(self, descriptors: ndarray, batch_size: int = 256) -> ndarray:
+        """
+        The function predicts the values like the random forest regressor: the values of the trees are summed in the
+        order of the trees (a cumulative sum, not a pairwise sum) and divided by the number of trees.
+
+        :param descriptors: The descriptors (samples, descriptors).
+        :param batch_size: The number of samples traversed at once (bounds the memory of the traversal).
+        :raises RuntimeError: The number of descriptors does not match the number of features of the forest.
+        :return: The predicted values.
+        """
+
+        descriptors = asarray(descriptors)
+
+        if descriptors.ndim != 2 or descriptors.shape[1] != self.n_features_in:
+            raise RuntimeError(f'the forest expects {self.n_features_in} features per sample.')
+
+        predictions = empty(len(descriptors), dtype=float64)
+
+        for start in range(0, len(descriptors), batch_size):
+            leaf_values = self.value[self.apply(descriptors[start:start + batch_size])]
+            predictions[start:start + batch_size] = cumsum(leaf_values, axis=1)[:, -1] / self.get_number_of_trees()
+
+        return predictions
+
+
+def flatten_random_forest(model: RandomForestRegressor) -> FlatForest:
+    """
+    :param model: The fitted random forest regressor (single output).
+    :raises RuntimeError: The forest predicts more than one output.
+    :return: The flat arrays of the trees of the forest.
+    """
+
+    if model.n_outputs_ != 1:
+        raise RuntimeError('only random forests with a single output can be flattened.')
+
+    trees = [estimator.tree_ for estimator in model.estimators_]
+    offsets = cumsum([0] + [tree.node_count for tree in trees])[:-1]
+
+    # The leaves store an undefined feature (-2), which is replaced with a valid column for the traversal.
+    features = concatenate([tree.feature for tree in trees]).astype(int64)
+
+    def get_children(children: ndarray, offset: int) -> ndarray:
+        return where(children == TREE_LEAF, TREE_LEAF, children + offset)
+
+    return FlatForest(
+        where(features < 0, 0, features),
+        concatenate([tree.threshold for tree in trees]).astype(float64),
+        concatenate([get_children(tree.children_left, offset) for tree, offset in zip(trees, offsets)]).astype(int64),
+        concatenate([get_children(tree.children_right, offset) for tree, offset in zip(trees, offsets)]).astype(int64),
+        concatenate([tree.value[:, 0, 0] for tree in trees]).astype(float64),
+        asarray(offsets, dtype=int64),
+        max(tree.max_depth for tree in trees),
+        model.n_features_in_
+    )
@@ -0,0 +1,199 @@
+import copy
+import pickle
+import statistics
+import time
+
+from numpy import argmax, array, cumsum, float32, inf, logical_and, ndarray, stack
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.metrics import mean_absolute_error, r2_score
+from sklearn.tree import DecisionTreeRegressor
+from sklearn.tree._tree import Tree
+
+from models.flat_forest import TREE_LEAF, flatten_random_forest
+
+# The feature and the threshold of the leaves in the scikit-learn trees.
+TREE_UNDEFINED = -2
+
+
+def prune_tree(estimator: DecisionTreeRegressor, max_depth: int | None) -> DecisionTreeRegressor:
+    """
+    The function cuts a fitted tree at the given depth: the nodes at that depth become leaves that predict their
+    stored value (the mean of the training samples of the node), and the nodes below them are removed.
+
+    :param estimator: The fitted regression tree.
+    :param max_depth: The largest depth of the pruned tree (None keeps the tree).
+    :return: The pruned tree (the estimator itself if it is not deeper than the depth).
+    """
+
+    tree = estimator.tree_
+
+    if max_depth is None or tree.max_depth <= max_depth:
+        return estimator
+
+    state = tree.__getstate__()
+    nodes = state['nodes']
+
+    # Collect the kept nodes in depth-first order (the parents before their children, as the tree builder does).
+    kept, depths, unvisited = [], {}, [(0, 0)]
+
+    while unvisited:
+        node, depth = unvisited.pop()
+        kept.append(node)
+        depths[node] = depth
+
+        if nodes[node]['left_child'] != TREE_LEAF and depth < max_depth:
+            unvisited.extend([(nodes[node]['right_child'], depth + 1), (nodes[node]['left_child'], depth + 1)])
+
+    new_indices = {node: new_index for new_index, node in enumerate(kept)}
+    pruned_nodes = nodes[kept].copy()
+
+    for new_index, node in enumerate(kept):
+        if nodes[node]['left_child'] == TREE_LEAF:
+            continue
+
+        if depths[node] == max_depth:
+            pruned_nodes[new_index]['left_child'] = pruned_nodes[new_index]['right_child'] = TREE_LEAF
+            pruned_nodes[new_index]['feature'] = TREE_UNDEFINED
+            pruned_nodes[new_index]['threshold'] = TREE_UNDEFINED
+            pruned_nodes[new_index]['missing_go_to_left'] = 0
+
+        else:
+            pruned_nodes[new_index]['left_child'] = new_indices[nodes[node]['left_child']]
+            pruned_nodes[new_index]['right_child'] = new_indices[nodes[node]['right_child']]
+
+    pruned_tree = Tree(tree.n_features, tree.n_classes, tree.n_outputs)
+    pruned_tree.__setstate__({'max_depth': max_depth, 'node_count': len(kept), 'nodes': pruned_nodes,
+                              'values': state['values'][kept]})
+
+    pruned_estimator = copy.copy(estimator)
+    pruned_estimator.tree_ = pruned_tree
+    pruned_estimator.max_depth = max_depth
+
+    return pruned_estimator
+
+
+def prune_random_forest(model: RandomForestRegressor, n_estimators: int | None = None,
+                        max_depth: int | None = None) -> RandomForestRegressor:
+    """
+    The function keeps the first trees of a fitted forest and cuts them at the given depth; the trees of a random
+    forest are fitted independently, so the first trees are a forest of their own.
+
+    :param model: The fitted random forest regressor.
+    :param n_estimators: The number of kept trees (all trees if None).
+    :param max_depth: The largest depth of the trees (None keeps the trees).
+    :raises RuntimeError: The number of kept trees is not between one and the number of trees of the forest.
+    :return: The compressed random forest regressor (the out-of-bag results of the full forest are dropped).
+    """
+
+    n_estimators = n_estimators if n_estimators is not None else len(model.estimators_)
+
+    if not 1 <= n_estimators <= len(model.estimators_):
+        raise RuntimeError(f'the number of kept trees has to be between 1 and {len(model.estimators_)}.')
+
+    compressed_model = copy.copy(model)
+    compressed_model.estimators_ = [prune_tree(estimator, max_depth) for estimator in model.estimators_[:n_estimators]]
+    compressed_model.n_estimators = n_estimators
+    compressed_model.max_depth = max_depth if max_depth is not None else model.max_depth
+
+    for attribute in ['oob_score_', 'oob_prediction_']:
+        if hasattr(compressed_model, attribute):
+            delattr(compressed_model, attribute)
+
+    return compressed_model
+
+
+def get_compression_curve(model: RandomForestRegressor, descriptors: ndarray, values: ndarray,
+                          max_depth: int | None) -> tuple[ndarray, ndarray]:
+    """
+    The function evaluates every number of first trees at once: the predictions of the trees are summed in the order
+    of the trees, so the running sums give the predictions of all smaller forests.
+
+    :param model: The fitted random forest regressor.
+    :param descriptors: The validation descriptors.
+    :param values: The validation values.
+    :param max_depth: The largest depth of the trees (None keeps the trees).
+    :return: The validation MAE and the number of nodes of the forests of 1, 2, ... trees.
+    """
+
+    descriptors = array(descriptors, dtype=float32)
+    trees = [prune_tree(estimator, max_depth) for estimator in model.estimators_]
+
+    tree_predictions = stack([tree.predict(descriptors, check_input=False) for tree in trees])
+    predictions = cumsum(tree_predictions, axis=0) / array(range(1, len(trees) + 1))[:, None]
+
+    return abs(predictions - values[None, :]).mean(axis=1), cumsum([tree.tree_.node_count for tree in trees])
+
+
+def compress_random_forest(model: RandomForestRegressor, descriptors: ndarray, values: ndarray, tolerance: float,
+                           depths: list[int | None] | None = None) -> RandomForestRegressor:
+    """
+    The function selects the smallest forest (the fewest nodes) of the first trees of a fitted forest, cut at one of
+    the depths, whose validation MAE is at most the tolerance above the MAE of the full forest. The MAE has to stay
+    within the tolerance for every larger number of trees, so a small forest that is only accurate on the validation
+    set by chance is not selected.
+
+    :param model: The fitted random forest regressor.
+    :param descriptors: The validation descriptors.
+    :param values: The validation values.
+    :param tolerance: The largest increase of the validation MAE.
+    :param depths: The depths the trees are cut at (None keeps the trees), by default every depth of the forest.
+    :return: The compressed random forest regressor (the full forest if no smaller forest is within the tolerance).
+    """
+
+    if depths is None:
+        depths = [None] + list(range(1, max(estimator.tree_.max_depth for estimator in model.estimators_)))
+
+    # The margin covers the rounding of the running sums.
+    largest_mae = mean_absolute_error(values, model.predict(descriptors)) + tolerance + 1e-12
+    best_nodes, best_settings = inf, (len(model.estimators_), None)
+
+    for max_depth in depths:
+        mae, nodes = get_compression_curve(model, descriptors, values, max_depth)
+
+        # The numbers of trees from which on every larger forest is within the tolerance.
+        stable = logical_and.accumulate((mae <= largest_mae)[::-1])[::-1]
+
+        if stable.any() and nodes[argmax(stable)] < best_nodes:
+            best_nodes, best_settings = nodes[argmax(stable)], (int(argmax(stable)) + 1, max_depth)
+
+    return prune_random_forest(model, *best_settings)
+
+
+def get_forest_report(model: RandomForestRegressor, descriptors: ndarray, values: ndarray,
+                      repeats: int = 20) -> dict:
+    """
+    :param model: The fitted random forest regressor.
+    :param descriptors: The validation descriptors.
+    :param values: The validation values.
+    :param repeats: The number of timed predictions.
+    :return: The size, the latency and the accuracy of the forest (the latencies are the medians of single-job
+    predictions of one complex and of the validation set, and of one complex with the flat forest).
+    """
+
+    model = copy.copy(model)
+    model.n_jobs = 1
+    flat_forest = flatten_random_forest(model)
+
+    def get_median_time(predict, features) -> float:
+        timings = []
+
+        for _ in range(repeats):
+            start = time.perf_counter()
+            predict(features)
+            timings.append(time.perf_counter() - start)
+
+        return statistics.median(timings)
+
+    predictions = model.predict(descriptors)
+
+    return {
+        'Trees': len(model.estimators_),
+        'Nodes': flat_forest.get_number_of_nodes(),
+        'Largest Depth': flat_forest.max_depth,
+        'Size': len(pickle.dumps(model)),
+        'Latency': get_median_time(model.predict, descriptors[:1]),
+        'Batch Latency': get_median_time(model.predict, descriptors),
+        'Flat Latency': get_median_time(flat_forest.predict, descriptors[:1]),
+        'MAE': mean_absolute_error(values, predictions),
+        'R2': r2_score(values, predictions)
+    }
@@ -0,0 +1,103 @@
+import json
+import os
+
+from joblib import parallel_config
+from numpy import generic, ndarray
+from pandas import DataFrame
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401 (enables the halving search)
+from sklearn.model_selection import HalvingGridSearchCV
+
+from models.random_forest import get_parallel_backend
+
+BEST_PARAMETERS_FILE = '{name}-best-parameters.json'
+SEARCH_RESULTS_FILE = '{name}-search-results.csv'
+
+
+def make_halving_search(parameter_grid: dict | list[dict], resource: str = 'n_estimators', min_resources: int = 100,
+                        max_resources: int = 5000, factor: int = 3, n_jobs: int = -1, cv: int = 3,
+                        random_state: int = 42, verbose: int = 0) -> HalvingGridSearchCV:
+    """
+    The function sets up a successive halving search over the hyperparameters of the random forest regressor: all
+    candidates are evaluated with the smallest resource, and only the best 1 / factor of them are evaluated again with
+    factor times the resource, until one candidate or the largest resource is left.
+
+    :param parameter_grid: The values of every hyperparameter (without the resource).
+    :param resource: The resource that grows in every iteration ('n_estimators' or 'n_samples').
+    :param min_resources: The resource of the first iteration.
+    :param max_resources: The largest resource of an iteration.
+    :param factor: The factor the candidates are cut by and the resource grows by in every iteration.
+    :param n_jobs: The number of parallel jobs over the candidates and folds (-1 uses all CPUs).
+    :param cv: The number of cross-validation folds.
+    :param random_state: The seed of the forests and of the subsampling of the training set.
+    :param verbose: The verbosity of the search.
+    :raises RuntimeError: The resource is not n_estimators or n_samples.
+    :return: The successive halving search.
+    """
+
+    if resource not in ['n_estimators', 'n_samples']:
+        raise RuntimeError(f'unknown resource: {resource} (use n_estimators or n_samples).')
+
+    return HalvingGridSearchCV(estimator=RandomForestRegressor(random_state=random_state, n_jobs=1),
+                               param_grid=parameter_grid, resource=resource, min_resources=min_resources,
+                               max_resources=max_resources, factor=factor, cv=cv, scoring='neg_mean_absolute_error',
+                               n_jobs=n_jobs, random_state=random_state, verbose=verbose)
+
+
+def get_json_value(value: object) -> object:
+    """
+    :param value: A hyperparameter value (possibly a NumPy scalar).
+    :return: The value as a built-in Python type.
+    """
+
+    return value.item() if isinstance(value, (generic, ndarray)) else value
+
+
+def save_search_results(search: HalvingGridSearchCV, directory: str, name: str) -> tuple[str, str]:
+    """
+    The function writes the best hyperparameters (JSON) and the results of all candidates in all iterations (CSV).
+
+    :param search: The fitted search.
+    :param directory: The full path of the output directory.
+    :param name: The name of the model (the prefix of the file names).
+    :return: The full paths of the best parameters file and the search results file.
+    """
+
+    os.makedirs(directory, exist_ok=True)
+
+    best_parameters_path = os.path.join(directory, BEST_PARAMETERS_FILE.format(name=name))
+    search_results_path = os.path.join(directory, SEARCH_RESULTS_FILE.format(name=name))
+
+    with open(best_parameters_path, 'w') as best_parameters_file:
+        json.dump({'Parameters': {key: get_json_value(value) for key, value in search.best_params_.items()},
+                   'Mean Absolute Error': -float(search.best_score_)}, best_parameters_file, indent=4)
+
+    DataFrame(search.cv_results_).to_csv(search_results_path, index=False)
+
+    return best_parameters_path, search_results_path
+
+
+def run_halving_search(descriptors: ndarray, values: ndarray, parameter_grid: dict | list[dict], directory: str,
+                       name: str, backend: str = 'threads', **parameters) -> HalvingGridSearchCV:
+    """
+    The function runs a successive halving search in parallel and writes its results into the output directory.
+
+    :param descriptors: The descriptors of the training set (samples, descriptors).
+    :param values: The values of the training set.
+    :param parameter_grid: The values of every hyperparameter (without the resource).
+    :param directory: The full path of the output directory.
+    :param name: The name of the model (the prefix of the file names).
+    :param backend: The backend of the parallel jobs ('threads' or 'processes').
+    :param parameters: The settings of the search (see make_halving_search).
+    :raises RuntimeError: The backend or the resource is unknown.
+    :return: The fitted search.
+    """
+
+    search = make_halving_search(parameter_grid, **parameters)
+
+    with parallel_config(backend=get_parallel_backend(backend)):
+        search.fit(descriptors, values)
+
+    save_search_results(search, directory, name)
+
+    return search
@@ -0,0 +1,165 @@
+import json
+import os
+import subprocess
+
+import joblib
+import sklearn
+from numpy import ndarray
+from sklearn.base import BaseEstimator
+
+from descriptors.descriptor_registry import Descriptor
+
+# The version of the schema file (changed whenever its entries change).
+SCHEMA_VERSION = 1
+
+MODEL_FILE = 'model.joblib'
+SCHEMA_FILE = 'schema.json'
+
+
+def get_code_version() -> str:
+    """
+    :return: The commit of the code (with a -dirty suffix if the tree has changes), or unknown outside a git checkout.
+    """
+
+    try:
+        return subprocess.run(['git', 'describe', '--always', '--dirty'], cwd=os.path.dirname(__file__),
+                              capture_output=True, text=True, check=True).stdout.strip() or 'unknown'
+
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+class ModelArtifact:
+    """
+    A class that represents a fitted model together with the schema of its input: the feature columns, the descriptor
+    and its parameters, the interaction radius of the energy features and the version of the code it was trained with.
+    """
+
+    def __init__(self, model: BaseEstimator, columns: list[str], descriptor_name: str, descriptor_parameters: dict,
+                 interaction_radius: float, code_version: str | None = None):
+        """
+        :param model: The fitted model.
+        :param columns: The names of the feature columns (in the order of the model input).
+        :param descriptor_name: The name of the registered descriptor.
+        :param descriptor_parameters: All parameters of the descriptor.
+        :param interaction_radius: The cut-off radius of the interactions in Angstroms.
+        :param code_version: The version of the code (the current version if None).
+        """
+
+        self.model = model
+        self.columns = [str(column) for column in columns]
+        self.descriptor_name = descriptor_name
+        self.descriptor_parameters = descriptor_parameters
+        self.interaction_radius = float(interaction_radius)
+        self.code_version = code_version if code_version is not None else get_code_version()
+
+    def get_schema(self) -> dict:
+        """
+        :return: The schema of the model input.
+        """
+
+        return {
+            'Schema Version': SCHEMA_VERSION,
+            'Columns': self.columns,
+            'Descriptor': self.descriptor_name,
+            'Descriptor Parameters': self.descriptor_parameters,
+            'Interaction Radius': self.interaction_radius,
+            'Code Version': self.code_version,
+            'Scikit-learn Version': sklearn.__version__
+        }
+
+    def get_descriptor(self) -> Descriptor:
+        """
+        :return: The descriptor the features of the model are calculated with.
+        """
+
+        return Descriptor(self.descriptor_name, **self.descriptor_parameters)
+
+    def validate(self, columns: list[str] | None = None, descriptor: Descriptor | None = None,
+                 interaction_radius: float | None = None):
+        """
+        The function checks that features calculated with the given settings match the input of the model.
+
+        :param columns: The names of the feature columns.
+        :param descriptor: The descriptor.
+        :param interaction_radius: The cut-off radius of the interactions in Angstroms.
+        :raises RuntimeError: The columns, the descriptor or the interaction radius do not match the schema.
+        """
+
+        if columns is not None and [str(column) for column in columns] != self.columns:
+            raise RuntimeError('the feature columns do not match the columns of the model.')
+
+        if descriptor is not None and (descriptor.name != self.descriptor_name or
+                                       json.loads(json.dumps(descriptor.parameters)) != self.descriptor_parameters):
+            raise RuntimeError(f'the descriptor does not match the descriptor of the model ({self.descriptor_name}).')
+
+        if interaction_radius is not None and float(interaction_radius) != self.interaction_radius:
+            raise RuntimeError(f'the interaction radius {interaction_radius} does not match the interaction radius of '
+                               f'the model ({self.interaction_radius}).')
+
+    def predict(self, features: ndarray) -> ndarray:
+        """
+        :param features: The features of the complexes (complexes, columns).
+        :raises RuntimeError: The number of features does not match the number of columns.
+        :return: The predicted binding free energies.
+        """
+
+        if features.shape[-1] != len(self.columns):
+            raise RuntimeError(f'{features.shape[-1]} features are given, but the model has {len(self.columns)}.')
+
+        return self.model.predict(features)
+
+
+def save_model_artifact(artifact_path: str, model: BaseEstimator, columns: list[str], descriptor: Descriptor,
+                        interaction_radius: float) -> ModelArtifact:
+    """
+    The function saves a fitted model (uncompressed, so plain arrays of the model can be memory-mapped on load) and the
+    schema of its input into the artifact directory.
+
+    :param artifact_path: The full path of the artifact directory.
+    :param model: The fitted model.
+    :param columns: The names of the feature columns (in the order of the model input).
+    :param descriptor: The descriptor the features were calculated with.
+    :param interaction_radius: The cut-off radius of the interactions in Angstroms.
+    :return: The model artifact.
+    """
+
+    # The parameters are stored as they are read back from the schema file (e.g., tuples as lists).
+    artifact = ModelArtifact(model, columns, descriptor.name, json.loads(json.dumps(descriptor.parameters)),
+                             interaction_radius)
+
+    os.makedirs(artifact_path, exist_ok=True)
+
+    joblib.dump(model, os.path.join(artifact_path, MODEL_FILE))
+
+    with open(os.path.join(artifact_path, SCHEMA_FILE), 'w') as schema_file:
+        json.dump(artifact.get_schema(), schema_file, indent=4)
+
+    return artifact
+
+
+def load_model_artifact(artifact_path: str, mmap_mode: str | None = None) -> ModelArtifact:
+    """
+    :param artifact_path: The full path of the artifact directory.
+    :param mmap_mode: The memory-map mode of the plain arrays of the model (None loads the arrays into memory); the
+    trees of a random forest copy their arrays on load, so they are always in memory.
+    :raises FileNotFoundError: The artifact does not exist.
+    :raises RuntimeError: The schema version or the scikit-learn version does not match.
+    :return: The model artifact.
+    """
+
+    with open(os.path.join(artifact_path, SCHEMA_FILE), 'r') as schema_file:
+        schema = json.load(schema_file)
+
+    if schema.get('Schema Version') != SCHEMA_VERSION:
+        raise RuntimeError(f'the schema version of {artifact_path} is {schema.get("Schema Version")}, but version '
+                           f'{SCHEMA_VERSION} is supported.')
+
+    if schema['Scikit-learn Version'] != sklearn.__version__:
+        raise RuntimeError(f'{artifact_path} was saved with scikit-learn {schema["Scikit-learn Version"]}, but '
+                           f'{sklearn.__version__} is installed.')
+
+    model = joblib.load(os.path.join(artifact_path, MODEL_FILE), mmap_mode=mmap_mode)
+
+    return ModelArtifact(model, schema['Columns'], schema['Descriptor'], schema['Descriptor Parameters'],
+                         schema['Interaction Radius'], schema['Code Version'])
@@ -0,0 +1,84 @@
+import argparse
+import os
+import sys
+
+from dataset.complex_archive import METADATA_FILE, is_archive_current
+from models.prediction import iterate_predictions, write_predictions
+
+ARCHIVE_SUFFIX = '-archive'
+
+
+def get_complex_source(path: str, prefix: str | None) -> tuple[str, str, bool | None]:
+    """
+    :param path: The full path of the directory with the complex files or of a packed archive (<prefix>-archive).
+    :param prefix: The prefix of the complex file names (taken from the name of the archive if None).
+    :raises RuntimeError: The prefix is neither given nor part of the name of an archive, or it does not match the
+    name of the archive.
+    :return: The directory and the prefix of the complexes, and whether the complexes are read from the archive (True
+    for a given archive, even if complex files are newer, None otherwise, see discover_complexes).
+    """
+
+    path = os.path.abspath(path)
+
+    if os.path.isfile(os.path.join(path, METADATA_FILE)) and path.endswith(ARCHIVE_SUFFIX):
+        archive_prefix = os.path.basename(path)[:-len(ARCHIVE_SUFFIX)]
+
+        if prefix is not None and prefix != archive_prefix:
+            raise RuntimeError(f'the prefix {prefix} does not match the archive {os.path.basename(path)}.')
+
+        return os.path.dirname(path), archive_prefix, True
+
+    if prefix is None:
+        raise RuntimeError(f'the prefix of the complex file names in {path} is not given.')
+
+    return path, prefix, None
+
+
+def main(arguments: list[str] | None = None):
+    """
+    The command line entry point, e.g.,
+
+    python -m models.predict data --prefix anions --model data/cavitand-model --output predictions.csv --n-jobs -1
+    python -m models.predict data/anions-archive --model data/cavitand-model
+
+    :param arguments: The command line arguments (sys.argv if None).
+    """
+
+    parser = argparse.ArgumentParser(prog='python -m models.predict',
+                                     description='Predict the binding free energies of host-guest complexes.')
+    parser.add_argument('complexes', help='the directory with the complex files or a packed archive')
+    parser.add_argument('--prefix', help='the prefix of the complex file names (e.g., anions)')
+    parser.add_argument('--model', required=True, help='the directory of the saved model')
+    parser.add_argument('--output', help='the CSV file of the predictions (printed if not given)')
+    parser.add_argument('--number-of-complexes', type=int, default=500,
+                        help='the number of potential complex indices that are checked')
+    parser.add_argument('--index-offset', type=int, default=0, help='the offset added to the complex indices')
+    parser.add_argument('--batch-size', type=int, default=64, help='the number of complexes per batch')
+    parser.add_argument('--n-jobs', type=int, default=1, help='the number of worker processes (-1 uses all CPUs)')
+    options = parser.parse_args(arguments)
+
+    try:
+        directory, prefix, use_archive = get_complex_source(options.complexes, options.prefix)
+
+    except RuntimeError as error:
+        parser.error(str(error))
+
+    if use_archive and not is_archive_current(directory, prefix):
+        print(f'Warning: complex files in {directory} are newer than {options.complexes}; the archive is read.',
+              file=sys.stderr)
+
+    predictions = iterate_predictions(directory, prefix, options.model, options.number_of_complexes,
+                                      options.index_offset, options.batch_size, options.n_jobs, use_archive)
+
+    if options.output is None:
+        write_predictions(sys.stdout, predictions)
+        return
+
+    with open(options.output, 'w') as output_file:
+        number_of_predictions = write_predictions(output_file, predictions)
+
+    print(f'{number_of_predictions} predictions written to {options.output}.', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, TextIO
+
+from joblib import effective_n_jobs
+from numpy import concatenate, ndarray, stack
+
+from dataset.feature_table import INDEX_COLUMN
+from dataset.pipeline import (ComplexRecord, build_complexes, calculate_descriptors, calculate_energies,
+                              discover_complexes, get_columns, parse_complexes)
+from descriptors.descriptor_registry import Descriptor
+from models.model_artifact import ModelArtifact, load_model_artifact
+
+PREDICTION_COLUMN = 'Predicted dG'
+
+# The model artifact and its descriptor of a worker process.
+_worker_state: dict = {}
+
+
+def get_features(record: ComplexRecord) -> ndarray:
+    """
+    :param record: The complex record with the energy features and the descriptor.
+    :return: The features of the complex (in the order of the columns of the data set, without dG).
+    """
+
+    return concatenate([record.energy_features, record.descriptor])
+
+
+def check_artifact_columns(artifact: ModelArtifact, descriptor: Descriptor):
+    """
+    :param artifact: The model artifact.
+    :param descriptor: The descriptor of the model.
+    :raises RuntimeError: The model was not trained on all features of the pipeline (e.g., only on the energies).
+    """
+
+    artifact.validate(columns=get_columns(descriptor)[1:])
+
+
+def predict_records(records: Iterable[ComplexRecord], artifact: ModelArtifact, descriptor: Descriptor,
+                    batch_size: int = 64) -> Iterator[tuple[int, float]]:
+    """
+    The function runs the stages of the pipeline (parse, build complex, energies and descriptors) on the complexes
+    and predicts their binding free energies one batch at a time.
+
+    :param records: The complex records.
+    :param artifact: The model artifact.
+    :param descriptor: The descriptor of the model.
+    :param batch_size: The number of complexes per descriptor and prediction batch.
+    :return: The complex indices and the predicted binding free energies.
+    """
+
+    records = build_complexes(parse_complexes(records))
+    records = calculate_energies(records, artifact.interaction_radius)
+    records = calculate_descriptors(records, descriptor, batch_size)
+
+    while batch := list(islice(records, batch_size)):
+        predictions = artifact.predict(stack([get_features(record) for record in batch]))
+
+        yield from ((record.index, float(prediction)) for record, prediction in zip(batch, predictions))
+
+
+def _initialize_worker(artifact_path: str):
+    artifact = load_model_artifact(artifact_path)
+
+    _worker_state.update(artifact=artifact, descriptor=artifact.get_descriptor())
+
+
+def _predict_worker_batch(records: list[ComplexRecord]) -> list[tuple[int, float]]:
+    return list(predict_records(records, _worker_state['artifact'], _worker_state['descriptor'], len(records)))
+
+
+def iterate_predictions(directory: str, prefix: str, artifact_path: str, number_of_complexes: int = 500,
+                        index_offset: int = 0, batch_size: int = 64, n_jobs: int = 1,
+                        use_archive: bool | None = None) -> Iterator[tuple[int, float]]:
+    """
+    The function predicts the binding free energies of the complexes stored in the directory (or in its packed
+    archive) with a saved model. The complexes are sent to the worker processes in batches, and only a few batches
+    per worker are in flight at a time, so the memory does not grow with the number of complexes; the predictions are
+    yielded in the order of the complexes while the later batches are evaluated.
+
+    :param directory: The full path of the directory with the complex files (or their packed archive).
+    :param prefix: The prefix of the complex file names.
+    :param artifact_path: The full path of the model artifact.
+    :param number_of_complexes: The number of potential complex indices that are checked.
+    :param index_offset: The offset added to the complex indices.
+    :param batch_size: The number of complexes per batch.
+    :param n_jobs: The number of worker processes (-1 uses all CPUs).
+    :param use_archive: Whether the complexes are read from the archive (see discover_complexes).
+    :raises RuntimeError: The model was not trained on all features of the pipeline.
+    :return: The complex indices and the predicted binding free energies.
+    """
+
+    artifact = load_model_artifact(artifact_path)
+    descriptor = artifact.get_descriptor()
+    check_artifact_columns(artifact, descriptor)
+
+    records = discover_complexes(directory, prefix, number_of_complexes, index_offset, use_archive)
+
+    if n_jobs == 1:
+        yield from predict_records(records, artifact, descriptor, batch_size)
+        return
+
+    number_of_workers = effective_n_jobs(n_jobs)
+
+    with ProcessPoolExecutor(number_of_workers, initializer=_initialize_worker,
+                             initargs=(artifact_path,)) as executor:
+        futures = deque()
+
+        while True:
+            # Keep two batches per worker in flight.
+            while len(futures) < 2 * number_of_workers and (batch := list(islice(records, batch_size))):
+                futures.append(executor.submit(_predict_worker_batch, batch))
+
+            if not futures:
+                return
+
+            yield from futures.popleft().result()
+
+
+def write_predictions(output_file: TextIO, predictions: Iterable[tuple[int, float]]) -> int:
+    """
+    The function writes the predictions as CSV rows while they are produced (every row is flushed).
+
+    :param output_file: The output file.
+    :param predictions: The complex indices and the predicted binding free energies.
+    :return: The number of predictions.
+    """
+
+    output_file.write(f'{INDEX_COLUMN},{PREDICTION_COLUMN}\n')
+    number_of_predictions = 0
+
+    for index, prediction in predictions:
+        output_file.write(f'{index:03},{prediction}\n')
+        output_file.flush()
+        number_of_predictions += 1
+
+    return number_of_predictions
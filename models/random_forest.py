@@ -0,0 +1,105 @@
+from joblib import Parallel, delayed, effective_n_jobs, parallel_config
+from numpy import array_split, asarray, float32, ndarray, zeros
+from sklearn.ensemble import RandomForestRegressor
+
+# The joblib backends of the parallel jobs: threads share the memory of the process (the trees release the GIL),
+# processes (loky) copy the data set and the trees into every worker.
+PARALLEL_BACKENDS = {
+    'threads': 'threading',
+    'processes': 'loky'
+}
+
+
+def get_parallel_backend(backend: str) -> str:
+    """
+    :param backend: The backend of the parallel jobs ('threads' or 'processes').
+    :raises RuntimeError: The backend is unknown.
+    :return: The name of the joblib backend.
+    """
+
+    if backend not in PARALLEL_BACKENDS:
+        raise RuntimeError(f'unknown backend: {backend} (use threads or processes).')
+
+    return PARALLEL_BACKENDS[backend]
+
+
+def make_random_forest(n_estimators: int = 1000, random_state: int = 42, oob_score: bool = True, n_jobs: int = 1,
+                       **parameters) -> RandomForestRegressor:
+    """
+    :param n_estimators: The number of trees.
+    :param random_state: The seed of the forest; the seeds of the trees are drawn from it before the trees are fitted,
+    so the forest does not depend on the number of jobs.
+    :param oob_score: Whether the out-of-bag score is calculated.
+    :param n_jobs: The number of parallel jobs (-1 uses all CPUs).
+    :param parameters: The other hyperparameters of the forest.
+    :return: The random forest regressor.
+    """
+
+    return RandomForestRegressor(n_estimators=n_estimators, random_state=random_state, oob_score=oob_score,
+                                 n_jobs=n_jobs, **parameters)
+
+
+def fit_random_forest(descriptors: ndarray, values: ndarray, n_jobs: int = -1, backend: str = 'threads',
+                      **parameters) -> RandomForestRegressor:
+    """
+    The function fits a random forest regressor with the trees distributed over the parallel jobs.
+
+    :param descriptors: The descriptors of the training set (samples, descriptors).
+    :param values: The values of the training set.
+    :param n_jobs: The number of parallel jobs (-1 uses all CPUs).
+    :param backend: The backend of the parallel jobs ('threads' or 'processes').
+    :param parameters: The hyperparameters of the forest (see make_random_forest).
+    :raises RuntimeError: The backend is unknown.
+    :return: The fitted random forest regressor.
+    """
+
+    model = make_random_forest(n_jobs=n_jobs, **parameters)
+
+    with parallel_config(backend=get_parallel_backend(backend)):
+        model.fit(descriptors, values)
+
+    return model
+
+
+def get_tree_predictions(trees: list, descriptors: ndarray) -> list[ndarray]:
+    """
+    :param trees: The decision trees.
+    :param descriptors: The descriptors (samples, descriptors) as single precision floats.
+    :return: The predictions of every tree.
+    """
+
+    return [tree.predict(descriptors, check_input=False) for tree in trees]
+
+
+def predict_random_forest(model: RandomForestRegressor, descriptors: ndarray, n_jobs: int = -1,
+                          backend: str = 'threads') -> ndarray:
+    """
+    The function predicts the values with a random forest regressor; the trees are evaluated in parallel jobs, but
+    their predictions are summed in the order of the trees, so the result is the same for any number of jobs (the
+    predict method of the forest sums them in the order the jobs finish).
+
+    :param model: The fitted random forest regressor.
+    :param descriptors: The descriptors (samples, descriptors).
+    :param n_jobs: The number of parallel jobs (-1 uses all CPUs).
+    :param backend: The backend of the parallel jobs ('threads' or 'processes').
+    :raises RuntimeError: The backend is unknown.
+    :return: The predicted values.
+    """
+
+    # The trees split on single precision thresholds.
+    descriptors = asarray(descriptors, dtype=float32, order='C')
+
+    # Every job evaluates a consecutive chunk of the trees.
+    number_of_chunks = min(effective_n_jobs(n_jobs), len(model.estimators_))
+    chunks = Parallel(n_jobs=n_jobs, backend=get_parallel_backend(backend))(
+        delayed(get_tree_predictions)([model.estimators_[tree] for tree in trees], descriptors)
+        for trees in array_split(range(len(model.estimators_)), number_of_chunks))
+
+    predictions = zeros(len(descriptors), dtype=float)
+
+    for chunk in chunks:
+        for tree_predictions in chunk:
+            predictions += tree_predictions
+
+    return predictions / len(model.estimators_)
+
@@ -0,0 +1,320 @@
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from queue import Empty, Queue
+
+from numpy import array, concatenate, stack
+
+from complexes.complex_guest_anion import ComplexGuestAnion
+from dataset.helper_functions import get_energy_features, get_host_guest_complex
+from models.binding_energy import get_warm_model, read_host_guest_complex
+from molecular_structure.molecular_structure import make_atoms
+
+# The errors of invalid requests (answered with 400, other errors with 500).
+REQUEST_ERRORS = (RuntimeError, ValueError, KeyError, IndexError, TypeError, OSError)
+
+
+class MicroBatcher:
+    """
+    A class that collects the complexes of concurrent requests into micro-batches: a batch is closed when it is full or
+    when the first complex of the batch waited for the longest wait time, and the descriptors and the predictions of
+    the whole batch are calculated in one call each.
+    """
+
+    def __init__(self, artifact_path: str, max_batch_size: int = 32, max_wait: float = 0.005):
+        """
+        :param artifact_path: The full path of the model artifact (loaded once and kept warm).
+        :param max_batch_size: The largest number of complexes per batch.
+        :param max_wait: The longest time in seconds the first complex of a batch waits for more complexes.
+        :raises RuntimeError: The model was not trained on all features of the pipeline.
+        """
+
+        self.artifact, self.descriptor = get_warm_model(artifact_path)
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+
+        self.queue: Queue = Queue()
+        self.lock = threading.Lock()
+        self.counters = {'Requests': 0, 'Errors': 0, 'Batches': 0, 'Predictions': 0, 'Largest Batch': 0,
+                         'Total Latency': 0.0, 'Largest Latency': 0.0}
+        self.start_time = time.perf_counter()
+
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def submit(self, host_guest_complex: ComplexGuestAnion) -> Future:
+        """
+        The function calculates the energy features of the complex (in the thread of the request) and queues the
+        complex for the next batch.
+
+        :param host_guest_complex: The host-guest complex.
+        :return: The future of the predicted binding free energy.
+        """
+
+        future = Future()
+        energy_features = array(get_energy_features(host_guest_complex, self.artifact.interaction_radius), dtype=float)
+
+        self.queue.put((host_guest_complex, energy_features, future, time.perf_counter()))
+
+        return future
+
+    def collect_batch(self) -> list[tuple]:
+        """
+        :return: The queued complexes of the next batch (empty if the batcher is closed).
+        """
+
+        batch = [self.queue.get()]
+
+        if batch[0] is None:
+            return []
+
+        deadline = time.perf_counter() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            try:
+                item = self.queue.get(timeout=max(deadline - time.perf_counter(), 0.0))
+
+            except Empty:
+                break
+
+            if item is None:
+                self.queue.put(None)
+                break
+
+            batch.append(item)
+
+        return batch
+
+    def predict_batch(self, batch: list[tuple]) -> list[float]:
+        """
+        :param batch: The queued complexes of the batch.
+        :return: The predicted binding free energies of the complexes.
+        """
+
+        from descriptors.atomic_structures import get_ase_atoms
+
+        descriptors = self.descriptor.create([get_ase_atoms(item[0].atoms) for item in batch],
+                                             [item[0].guest.central_atom for item in batch])
+
+        return [float(prediction) for prediction in
+                self.artifact.predict(stack([concatenate([energy_features, descriptor]) for
+                                             (_, energy_features, _, _), descriptor in zip(batch, descriptors)]))]
+
+    def run(self):
+        """
+        The loop of the batcher thread.
+        """
+
+        while batch := self.collect_batch():
+            try:
+                results = list(zip(batch, self.predict_batch(batch)))
+
+            except Exception:
+
+                # A failing complex does not fail the other complexes of the batch, so they are predicted one by one.
+                results = []
+
+                for item in batch:
+                    try:
+                        results.append((item, self.predict_batch([item])[0]))
+
+                    except Exception as error:
+                        item[2].set_exception(error)
+
+            end = time.perf_counter()
+
+            with self.lock:
+                self.counters['Batches'] += 1
+                self.counters['Predictions'] += len(results)
+                self.counters['Largest Batch'] = max(self.counters['Largest Batch'], len(batch))
+                self.counters['Total Latency'] += sum(end - start for (_, _, _, start), _ in results)
+                self.counters['Largest Latency'] = max([self.counters['Largest Latency']] +
+                                                       [end - start for (_, _, _, start), _ in results])
+
+            for (_, _, future, _), prediction in results:
+                future.set_result(prediction)
+
+    def count_request(self, error: bool = False):
+        """
+        :param error: Whether the request failed.
+        """
+
+        with self.lock:
+            self.counters['Requests'] += 1
+            self.counters['Errors'] += int(error)
+
+    def get_counters(self) -> dict:
+        """
+        :return: The throughput and latency counters (the latency is measured from the queueing of the complex).
+        """
+
+        with self.lock:
+            counters = dict(self.counters)
+
+        uptime = time.perf_counter() - self.start_time
+        predictions = counters['Predictions']
+
+        counters.update({
+            'Uptime': uptime,
+            'Throughput': predictions / uptime if uptime > 0 else 0.0,
+            'Mean Batch Size': predictions / counters['Batches'] if counters['Batches'] > 0 else 0.0,
+            'Mean Latency': counters['Total Latency'] / predictions if predictions > 0 else 0.0
+        })
+
+        return counters
+
+    def close(self):
+        """
+        The function stops the batcher thread after the queued complexes are predicted.
+        """
+
+        self.queue.put(None)
+        self.thread.join()
+
+
+def read_request_complex(request: dict) -> ComplexGuestAnion:
+    """
+    :param request: The request, either {"extended_xyz_file_path": ...} or {"elements": [...], "coordinates": [...],
+    "charges": [...], "information": {...}}.
+    :raises RuntimeError: The request has neither an extended XYZ file nor the atoms and the information.
+    :return: The host-guest complex of the request.
+    """
+
+    if 'extended_xyz_file_path' in request:
+        return read_host_guest_complex(request['extended_xyz_file_path'])
+
+    if not {'elements', 'coordinates', 'charges', 'information'} <= set(request):
+        raise RuntimeError('the request has neither an extended XYZ file nor the atoms and the information.')
+
+    if not len(request['elements']) == len(request['coordinates']) == len(request['charges']):
+        raise RuntimeError('the numbers of elements, coordinates and charges do not match.')
+
+    atoms = make_atoms(array(request['elements']), array(request['coordinates'], dtype=float).reshape(-1, 3),
+                       array(request['charges'], dtype=float))
+
+    return get_host_guest_complex(atoms, request['information'])
+
+
+class PredictionRequestHandler(BaseHTTPRequestHandler):
+    """
+    A class that handles the requests of the prediction server: POST /predict predicts a complex and GET /counters
+    returns the throughput and latency counters.
+    """
+
+    server: 'PredictionServer'
+
+    def send_json(self, status: int, body: dict):
+        """
+        :param status: The HTTP status code.
+        :param body: The body of the response.
+        """
+
+        content = json.dumps(body).encode()
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        if self.path != '/counters':
+            self.send_json(404, {'error': f'unknown path: {self.path}.'})
+            return
+
+        self.send_json(200, self.server.batcher.get_counters())
+
+    def do_POST(self):
+        if self.path != '/predict':
+            self.send_json(404, {'error': f'unknown path: {self.path}.'})
+            return
+
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+            prediction = self.server.batcher.submit(read_request_complex(request)).result()
+
+        except Exception as error:
+            self.server.batcher.count_request(error=True)
+            self.send_json(400 if isinstance(error, REQUEST_ERRORS) else 500, {'error': str(error)})
+            return
+
+        self.server.batcher.count_request()
+        self.send_json(200, {'dG': prediction})
+
+    def log_message(self, format: str, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class PredictionServer(ThreadingHTTPServer):
+    """
+    A class that represents a local HTTP server that keeps the model and the descriptor warm; every request is
+    handled in its own thread, and the complexes of concurrent requests are predicted in micro-batches.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, artifact_path: str, host: str = '127.0.0.1', port: int = 8000, max_batch_size: int = 32,
+                 max_wait: float = 0.005, verbose: bool = False):
+        """
+        :param artifact_path: The full path of the model artifact.
+        :param host: The host name the server listens on.
+        :param port: The port the server listens on (0 selects a free port).
+        :param max_batch_size: The largest number of complexes per batch.
+        :param max_wait: The longest time in seconds the first complex of a batch waits for more complexes.
+        :param verbose: Whether the requests are logged.
+        :raises RuntimeError: The model was not trained on all features of the pipeline.
+        """
+
+        self.batcher = MicroBatcher(artifact_path, max_batch_size, max_wait)
+        self.verbose = verbose
+
+        # The batcher thread is stopped if the socket cannot be bound (e.g., the port is in use).
+        try:
+            super().__init__((host, port), PredictionRequestHandler)
+
+        except Exception:
+            self.batcher.close()
+            raise
+
+    def server_close(self):
+        super().server_close()
+        self.batcher.close()
+
+
+def main(arguments: list[str] | None = None):
+    """
+    The command line entry point, e.g.,
+
+    python -m models.server --model data/cavitand-model --port 8000
+
+    :param arguments: The command line arguments (sys.argv if None).
+    """
+
+    parser = argparse.ArgumentParser(prog='python -m models.server',
+                                     description='Serve the predictions of a saved model on localhost.')
+    parser.add_argument('--model', required=True, help='the directory of the saved model')
+    parser.add_argument('--host', default='127.0.0.1', help='the host name the server listens on')
+    parser.add_argument('--port', type=int, default=8000, help='the port the server listens on')
+    parser.add_argument('--max-batch-size', type=int, default=32, help='the largest number of complexes per batch')
+    parser.add_argument('--max-wait', type=float, default=0.005,
+                        help='the longest time in seconds a batch waits for more complexes')
+    parser.add_argument('--verbose', action='store_true', help='log the requests')
+    options = parser.parse_args(arguments)
+
+    with PredictionServer(options.model, options.host, options.port, options.max_batch_size, options.max_wait,
+                          options.verbose) as server:
+        print(f'Serving {options.model} on http://{options.host}:{server.server_address[1]}.')
+
+        try:
+            server.serve_forever()
+
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
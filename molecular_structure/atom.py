@@ -1,5 +1,5 @@
 from typing import List, Union
-from constants.covalent_radii import CovalentRadii
+from constants.element_tables import COVALENT_RADII, SINGLE_BOND, get_atomic_number
 
 from numpy import array, ndarray
 
@@ -9,12 +9,14 @@ class Atom:
     Class representing an atom with coordinates, charge, and index.
     """
 
-    def __init__(self, element: str, coord: Union[List[float], ndarray], partial_charge: float, index: int):
+    def __init__(self, element: str, coord: Union[List[float], ndarray], partial_charge: float, index: int,
+                 atomic_number: int | None = None):
         """
         :param element: The name of the element.
         :param coord: The Cartesian coordinates of the atom.
         :param partial_charge: The partial charge of the atom.
         :param index: The index of the atom in the Cartesian coordinates file.
+        :param atomic_number: The atomic number of the element (looked up from the element if None).
         """
 
         self.element = element
@@ -22,7 +24,8 @@ class Atom:
         self.charge = partial_charge
         self.index = index  # Atom's number in the Cartesian coordinate (.xyz) file
 
-        self.covalent_radius = CovalentRadii[self.element.capitalize()].value[0]
+        self.atomic_number = get_atomic_number(self.element) if atomic_number is None else int(atomic_number)
+        self.covalent_radius = float(COVALENT_RADII[self.atomic_number, SINGLE_BOND])
 
     def __repr__(self) -> str:
         """
@@ -0,0 +1,54 @@
+import bz2
+import gzip
+import lzma
+import os
+from typing import IO
+
+# The decompressing openers selected by the file extension; the files are decompressed while they are read.
+COMPRESSED_FILE_OPENERS = {
+    '.gz': gzip.open,
+    '.xz': lzma.open,
+    '.bz2': bz2.open
+}
+
+
+def is_compressed_file(file_path: str) -> bool:
+    """
+    :param file_path: The full path of the file.
+    :return: True if the extension of the file is a compression format (.gz, .xz or .bz2).
+    """
+
+    return os.path.splitext(file_path)[1].lower() in COMPRESSED_FILE_OPENERS
+
+
+def open_file(file_path: str, mode: str = 'r') -> IO:
+    """
+    The function opens a plain or a compressed file; compressed files are decompressed as a stream (without a
+    temporary file).
+
+    :param file_path: The full path of the file.
+    :param mode: The mode of the file ('r' for text or 'rb' for bytes).
+    :raises FileNotFoundError: The file does not exist.
+    :return: The file object.
+    """
+
+    if is_compressed_file(file_path):
+        opener = COMPRESSED_FILE_OPENERS[os.path.splitext(file_path)[1].lower()]
+
+        return opener(file_path, 'rt' if mode == 'r' else mode)
+
+    return open(file_path, mode)
+
+
+def find_file(file_path: str) -> str:
+    """
+    :param file_path: The full path of the uncompressed file.
+    :return: The full path of the file, or of its compressed version if only that exists (e.g., <file_path>.gz).
+    """
+
+    if not os.path.exists(file_path):
+        for extension in COMPRESSED_FILE_OPENERS:
+            if os.path.exists(file_path + extension):
+                return file_path + extension
+
+    return file_path
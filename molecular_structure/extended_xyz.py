@@ -0,0 +1,241 @@
+import json
+import re
+
+from numpy import array, column_stack, fromiter, ndarray
+
+from molecular_structure.atom import Atom
+from molecular_structure.compressed_files import open_file
+from molecular_structure.molecular_structure import make_atoms
+
+# The per-atom columns read when the comment line has no Properties entry.
+DEFAULT_PROPERTIES = 'species:S:1:pos:R:3'
+
+# The names of the charge column (ASE writes initial_charges).
+CHARGE_PROPERTIES = ['charge', 'charges', 'initial_charges']
+
+# A key or value without quotes, and a key=value pair of the comment line (keys and values may be double-quoted with
+# backslash escapes, values may also be single-quoted).
+BARE_TOKEN = re.compile(r'[^\s="\']+')
+COMMENT_PAIR = re.compile(r'\s*(?P<key>"(?:[^"\\]|\\.)*"|[^\s="\']+)='
+                          r'(?P<value>"(?:[^"\\]|\\.)*"|\'[^\']*\'|[^\s"\']*)(?=\s|$)')
+
+
+def parse_comment_value(value: str) -> object:
+    """
+    :param value: The unquoted value of a key=value pair of the comment line.
+    :return: The value as a number, a boolean, a list or a string.
+    """
+
+    try:
+        return json.loads(value)
+
+    except ValueError:
+        pass
+
+    if value in ['T', 'F']:
+        return value == 'T'
+
+    return value
+
+
+def unquote_comment_token(token: str) -> tuple[str, bool]:
+    """
+    :param token: The key or the value of a key=value pair of the comment line.
+    :return: The token without its quotes and whether it was quoted.
+    """
+
+    if token.startswith('"'):
+        try:
+            return json.loads(token), True
+
+        except ValueError:
+            return token[1:-1].replace('\\"', '"'), True
+
+    if token.startswith("'"):
+        return token[1:-1], True
+
+    return token, False
+
+
+def decode_quoted_value(value: str) -> object:
+    """
+    :param value: The value of a quoted key=value pair of the comment line (without its quotes).
+    :return: The list or the dictionary of a quoted JSON array or object, otherwise the string.
+    """
+
+    if value.startswith(('[', '{')):
+        try:
+            decoded_value = json.loads(value)
+
+        except ValueError:
+            return value
+
+        if isinstance(decoded_value, (list, dict)):
+            return decoded_value
+
+    return value
+
+
+def parse_comment_line(comment: str) -> dict:
+    """
+    The function parses the key=value pairs of an extended XYZ comment line; keys and values with spaces are quoted,
+    e.g., "Guest - Vertex Atoms"=[258,259,261,262] Solvent=Methanol Reference="J. Am. Chem. Soc.". Quoted values are
+    strings (or the lists and dictionaries of quoted JSON arrays and objects), and only the values without quotes are
+    converted to numbers, booleans and lists.
+
+    :param comment: The comment line.
+    :raises RuntimeError: The comment line is not a list of key=value pairs.
+    :return: The metadata of the structure.
+    """
+
+    metadata, comment, position = {}, comment.strip(), 0
+
+    while position < len(comment):
+        if (pair := COMMENT_PAIR.match(comment, position)) is None:
+            raise RuntimeError(f'the comment line is not a list of key=value pairs: {comment}')
+
+        key, _ = unquote_comment_token(pair['key'])
+        value, quoted = unquote_comment_token(pair['value'])
+
+        if key == 'Properties':
+            metadata[key] = value
+
+        else:
+            metadata[key] = decode_quoted_value(value) if quoted else parse_comment_value(value)
+
+        position = pair.end()
+
+    return metadata
+
+
+def parse_properties(properties: str) -> list[tuple[str, str, int]]:
+    """
+    :param properties: The Properties entry of the comment line (e.g., species:S:1:pos:R:3:charge:R:1).
+    :raises RuntimeError: The Properties entry is not a list of name:type:columns triplets.
+    :return: The names, the types and the numbers of columns of the per-atom properties.
+    """
+
+    fields = properties.split(':')
+
+    if len(fields) % 3 != 0:
+        raise RuntimeError(f'the properties are not a list of name:type:columns triplets: {properties}')
+
+    return [(fields[index], fields[index + 1], int(fields[index + 2])) for index in range(0, len(fields), 3)]
+
+
+def read_extended_xyz(file_path: str) -> tuple[ndarray, ndarray, ndarray, dict]:
+    """
+    The function reads an extended XYZ file in one pass: the per-atom columns are given by the Properties entry of
+    the comment line, the charges are an extra column, and the other key=value pairs of the comment line are the
+    metadata of the complex (e.g., the entries of the information file).
+
+    :param file_path: The full path of the extended XYZ file (may be compressed).
+    :raises FileNotFoundError: The file does not exist.
+    :raises RuntimeError: The file has no species, positions or charges, or fewer atoms than the header states.
+    :return: The elements (n,), the coordinates (n, 3), the charges (n,) and the metadata.
+    """
+
+    with open_file(file_path, 'r') as file:
+        header, comment, body = (file.read() + '\n\n').split('\n', 2)
+
+    try:
+        number_of_atoms = int(header)
+
+    except ValueError:
+        raise RuntimeError(f'the header of {file_path} does not contain the number of atoms.')
+
+    metadata = parse_comment_line(comment)
+    properties = parse_properties(metadata.pop('Properties', DEFAULT_PROPERTIES))
+    number_of_columns = sum(columns for _, _, columns in properties)
+
+    tokens = body.split(maxsplit=number_of_columns * number_of_atoms)[:number_of_columns * number_of_atoms]
+
+    if len(tokens) != number_of_columns * number_of_atoms:
+        raise RuntimeError(f'{file_path} contains fewer atoms than the {number_of_atoms} in the header.')
+
+    # Every column is taken from the tokens with the number of columns as the stride.
+    columns, first_column = {}, 0
+
+    for name, _, number_of_property_columns in properties:
+        columns[name] = [tokens[column::number_of_columns] for column in
+                         range(first_column, first_column + number_of_property_columns)]
+        first_column += number_of_property_columns
+
+    charge_property = next((name for name in CHARGE_PROPERTIES if name in columns), None)
+
+    if 'species' not in columns or 'pos' not in columns or charge_property is None:
+        raise RuntimeError(f'{file_path} does not contain the species, the positions and the charges of the atoms.')
+
+    elements = array(columns['species'][0])
+    coordinates = column_stack([fromiter(map(float, column), dtype=float, count=number_of_atoms)
+                                for column in columns['pos']]).reshape(number_of_atoms, 3)
+    charges = fromiter(map(float, columns[charge_property][0]), dtype=float, count=number_of_atoms)
+
+    return elements, coordinates, charges, metadata
+
+
+def make_list_of_atoms_from_extended_xyz(file_path: str) -> tuple[list[Atom], dict]:
+    """
+    :param file_path: The full path of the extended XYZ file (may be compressed).
+    :return: A list of Atom objects and the metadata of the complex.
+    """
+
+    elements, coordinates, charges, metadata = read_extended_xyz(file_path)
+
+    return make_atoms(elements, coordinates, charges), metadata
+
+
+def format_comment_key(key: str) -> str:
+    """
+    :param key: The key of the metadata.
+    :return: The key as it is written to the comment line (double-quoted if it has spaces, quotes or equal signs).
+    """
+
+    return key if BARE_TOKEN.fullmatch(key) else json.dumps(key)
+
+
+def format_comment_value(value: object) -> str:
+    """
+    :param value: The value of the metadata.
+    :raises RuntimeError: The value is a string that would be read back as a list or a dictionary.
+    :return: The value as it is written to the comment line: strings are double-quoted, so they are read back as
+    strings; numbers, booleans and numeric lists are written as compact JSON, and the JSON of other values (e.g.,
+    lists of strings and dictionaries) is double-quoted.
+    """
+
+    if isinstance(value, str):
+        if decode_quoted_value(value) is not value:
+            raise RuntimeError(f'the string {value} would be read back as a JSON array or object.')
+
+        return json.dumps(value)
+
+    formatted_value = json.dumps(value, separators=(',', ':'))
+
+    return formatted_value if BARE_TOKEN.fullmatch(formatted_value) else json.dumps(formatted_value)
+
+
+def write_extended_xyz(file_path: str, elements: list[str], coordinates: ndarray, charges: ndarray,
+                       metadata: dict | None = None):
+    """
+    The function writes the atoms, their charges and the metadata of a complex into an extended XYZ file.
+
+    :param file_path: The full path of the extended XYZ file.
+    :param elements: The elements of the atoms.
+    :param coordinates: The coordinates of the atoms (n, 3).
+    :param charges: The partial charges of the atoms.
+    :param metadata: The metadata of the complex (e.g., the entries of the information file).
+    :raises RuntimeError: The numbers of elements, coordinates and charges do not match, or a string value would be
+    read back as a JSON array or object.
+    """
+
+    if not len(elements) == len(coordinates) == len(charges):
+        raise RuntimeError('the numbers of elements, coordinates and charges do not match.')
+
+    comment = ' '.join([f'Properties={DEFAULT_PROPERTIES}:charge:R:1'] +
+                       [f'{format_comment_key(key)}={format_comment_value(value)}'
+                        for key, value in (metadata or {}).items()])
+
+    with open(file_path, 'w') as file:
+        file.write(f'{len(elements)}\n{comment}\n')
+        file.writelines(f'{element} {float(x)!r} {float(y)!r} {float(z)!r} {float(charge)!r}\n'
+                        for element, (x, y, z), charge in zip(elements, coordinates, charges))
@@ -1,4 +1,79 @@
+from numpy import array, empty, fromiter, ndarray
+
+from constants.element_tables import get_atomic_numbers
 from molecular_structure.atom import Atom
+from molecular_structure.compressed_files import open_file
+
+
+def read_structure_arrays(coordinates_file_path: str) -> tuple[ndarray, ndarray]:
+    """
+    The function reads the elements and the coordinates of a Cartesian coordinates file in one call; the number of
+    atoms is taken from the header, and the coordinates are converted straight into an array of that size. Files
+    compressed with gzip, xz or bzip2 (.gz, .xz or .bz2) are decompressed while they are read.
+
+    :param coordinates_file_path: The full path of the Cartesian coordinates file.
+    :raises FileNotFoundError: The Coordinates file does not exist.
+    :raises RuntimeError: The number of atoms in the header does not match the coordinates.
+    :return: The elements (n,) and the coordinates (n, 3).
+    """
+
+    with open_file(coordinates_file_path, 'r') as file:
+        return parse_structure_text(file.read(), coordinates_file_path)
+
+
+def parse_structure_text(text: str, source: str = 'the structure') -> tuple[ndarray, ndarray]:
+    """
+    The function parses the text of one frame in the Cartesian coordinates (.xyz) format; the lines after the atoms
+    of the frame are ignored.
+
+    :param text: The text of the frame (the header, the comment line and the atoms).
+    :param source: The name of the source of the text used in the error messages.
+    :raises RuntimeError: The number of atoms in the header does not match the coordinates.
+    :return: The elements (n,) and the coordinates (n, 3).
+    """
+
+    header, _, body = (text + '\n\n').split('\n', 2)
+
+    try:
+        number_of_atoms = int(header)
+
+    except ValueError:
+        raise RuntimeError(f'the header of {source} does not contain the number of atoms.')
+
+    tokens = body.split(maxsplit=4 * number_of_atoms)[:4 * number_of_atoms]
+
+    if len(tokens) != 4 * number_of_atoms:
+        raise RuntimeError(f'{source} contains fewer atoms than the {number_of_atoms} in the header.')
+
+    elements = array(tokens[0::4])
+    del tokens[0::4]
+
+    coordinates = fromiter(map(float, tokens), dtype=float, count=3 * number_of_atoms).reshape(number_of_atoms, 3)
+
+    return elements, coordinates
+
+
+def read_partial_charges(charge_file_path: str, number_of_atoms: int | None = None) -> ndarray:
+    """
+    The function reads the charges of a charge file in one call (compressed files are decompressed while they are
+    read).
+
+    :param charge_file_path: The full path to the file with partial charges.
+    :param number_of_atoms: The expected number of charges (None skips the validation).
+    :raises RuntimeError: The number of charges does not match the number of atoms.
+    :return: The partial charges (n,).
+    """
+
+    with open_file(charge_file_path, 'r') as charges_file:
+        tokens = charges_file.read().split()
+
+    if number_of_atoms is not None and len(tokens) != number_of_atoms:
+        raise RuntimeError(f'{charge_file_path} contains {len(tokens)} charges instead of {number_of_atoms}.')
+
+    charges = empty(len(tokens), dtype=float)
+    charges[:] = tokens
+
+    return charges
 
 
 def get_structure_coordinates(coordinates_file_path: str) -> tuple[list[str], list[list[float]]]:
@@ -10,17 +85,9 @@ def get_structure_coordinates(coordinates_file_path: str) -> tuple[list[str], li
     :return: The list of coordinates (as a list).
     """
 
-    molecule_elements = []
-    molecule_coordinates = []
+    elements, coordinates = read_structure_arrays(coordinates_file_path)
 
-    with open(coordinates_file_path, "r") as file:
-        for line_number, line in enumerate(file, 1):
-            if line_number > 2:  # Skip the first two lines.
-                file_lines = line.split()
-                molecule_elements.append(file_lines[0])
-                molecule_coordinates.append([float(coordinate) for coordinate in file_lines[1:]])
-
-    return molecule_elements, molecule_coordinates
+    return elements.tolist(), coordinates.tolist()
 
 
 def get_partial_charges(charge_file_path: str) -> list[float]:
@@ -31,13 +98,7 @@ def get_partial_charges(charge_file_path: str) -> list[float]:
     :return: A list with partial charges.
     """
 
-    charges = []
-
-    with open(charge_file_path, 'r') as charges_file:
-        for line in charges_file:
-            charges.append(float(line.strip()))
-
-    return charges
+    return read_partial_charges(charge_file_path).tolist()
 
 
 def make_list_of_atoms(coordinate_file_path: str, charge_file_path: str) -> list[Atom]:
@@ -46,12 +107,26 @@ def make_list_of_atoms(coordinate_file_path: str, charge_file_path: str) -> list
 
     :param coordinate_file_path: The full path to the Cartesian coordinates file.
     :param charge_file_path: The full path to the atom charges file.
+    :raises RuntimeError: The number of charges does not match the number of atoms.
     :return: A list of Atom objects.
     """
 
-    elements, coordinates = get_structure_coordinates(coordinate_file_path)
-    charges = get_partial_charges(charge_file_path)
-    indices = list(range(len(coordinates)))
+    elements, coordinates = read_structure_arrays(coordinate_file_path)
+    charges = read_partial_charges(charge_file_path, len(elements))
+
+    return make_atoms(elements, coordinates, charges)
+
+
+def make_atoms(elements: ndarray, coordinates: ndarray, charges: ndarray) -> list[Atom]:
+    """
+    The function forms a list of Atom objects; the element symbols are converted into atomic numbers once.
+
+    :param elements: The elements of the atoms.
+    :param coordinates: The coordinates of the atoms (n, 3).
+    :param charges: The partial charges of the atoms.
+    :return: A list of Atom objects.
+    """
 
-    return [Atom(element, coordinate, charge, index) for element, coordinate, charge, index in zip(
-        elements, coordinates, charges, indices)]
+    return [Atom(str(element), coordinate, float(charge), index, atomic_number) for
+            index, (element, coordinate, charge, atomic_number) in
+            enumerate(zip(elements, coordinates, charges, get_atomic_numbers(elements)))]
@@ -0,0 +1,222 @@
+from numpy import (arange, array, asarray, concatenate, empty, flatnonzero, full, int64, lexsort, linalg, maximum,
+                   minimum, ndarray, nonzero, triu)
+
+from constants.element_tables import COVALENT_RADII, SINGLE_BOND
+from molecular_structure.atom import Atom
+from molecular_structure.spatial_ordering import SpatialOrdering
+
+# The bonds are perceived like in get_dipole_moments: the distance is at most the scaled sum of the covalent radii.
+BOND_SCALING_FACTOR = 1.3
+
+
+def get_candidate_pairs(coordinates: ndarray, cut_off: float, block_size: int = 256,
+                        reorder: bool = False) -> tuple[ndarray, ndarray]:
+    """
+    The function returns the pairs of atoms (i < j) within the cut-off. The distances are calculated between blocks
+    of atoms, and pairs of blocks whose bounding boxes are farther apart than the cut-off are skipped. The blocks of
+    atoms in file order are scattered over the whole structure; with reorder, the atoms are sorted along a Morton
+    curve first, so the blocks are compact and most block pairs are skipped.
+
+    :param coordinates: The coordinates of the atoms (n, 3).
+    :param cut_off: The cut-off distance in Angstroms.
+    :param block_size: The number of atoms per block.
+    :param reorder: Whether the atoms are sorted along a Morton curve (the pairs keep the original atom indices).
+    :return: The first and the second atom indices of the pairs (sorted by the first and then the second index).
+    """
+
+    coordinates = asarray(coordinates, dtype=float)
+    ordering = SpatialOrdering(coordinates) if reorder else None
+
+    if ordering is not None:
+        coordinates = ordering.reorder(coordinates)
+
+    starts = list(range(0, len(coordinates), block_size))
+    lower = array([coordinates[start:start + block_size].min(axis=0) for start in starts]).reshape(-1, 3)
+    upper = array([coordinates[start:start + block_size].max(axis=0) for start in starts]).reshape(-1, 3)
+
+    # The distances between the bounding boxes of all pairs of blocks.
+    gaps = maximum(0.0, maximum(lower[None, :, :] - upper[:, None, :], lower[:, None, :] - upper[None, :, :]))
+    block_pairs = zip(*nonzero(triu(linalg.norm(gaps, axis=2) <= cut_off)))
+
+    first, second = [empty(0, dtype=int64)], [empty(0, dtype=int64)]
+
+    for block_a, block_b in block_pairs:
+        start_a, start_b = starts[block_a], starts[block_b]
+        distances = linalg.norm(coordinates[start_a:start_a + block_size, None, :] -
+                                coordinates[None, start_b:start_b + block_size, :], axis=2)
+
+        rows, columns = nonzero(distances <= cut_off)
+        rows += start_a
+        columns += start_b
+
+        # Within a block, only the pairs with j > i are kept.
+        keep = columns > rows
+        first.append(rows[keep])
+        second.append(columns[keep])
+
+    first, second = concatenate(first), concatenate(second)
+
+    if ordering is not None:
+        first, second = ordering.get_original_indices(first), ordering.get_original_indices(second)
+        first, second = minimum(first, second), maximum(first, second)
+
+    order = lexsort((second, first))
+
+    return first[order], second[order]
+
+
+class VerletNeighborList:
+    """
+    A class that represents a Verlet neighbor list: the pairs of atoms within the cut-off plus a skin distance. The
+    list is only rebuilt when an atom has moved more than half of the skin since the last build; otherwise, the
+    neighbors within the cut-off are found among the stored candidates. With centers, only the pairs of the centers
+    and the other atoms are stored (e.g., the central atom of the guest and the host atoms).
+    """
+
+    def __init__(self, cut_off: float, skin: float = 1.0, centers: list[int] | None = None, reorder: bool = False):
+        """
+        :param cut_off: The cut-off distance in Angstroms.
+        :param skin: The skin distance in Angstroms.
+        :param centers: The indices of the center atoms (None stores all pairs).
+        :param reorder: Whether the pair search sorts the atoms along a Morton curve (faster for large structures).
+        """
+
+        self.cut_off = cut_off
+        self.skin = skin
+        self.centers = None if centers is None else list(centers)
+        self.reorder = reorder
+
+        self.reference_coordinates: ndarray | None = None
+        self.first: ndarray | None = None
+        self.second: ndarray | None = None
+        self.number_of_builds = 0
+
+    def build(self, coordinates: ndarray):
+        """
+        Finds the candidate pairs within the cut-off plus the skin distance.
+
+        :param coordinates: The coordinates of the atoms (n, 3).
+        """
+
+        coordinates = asarray(coordinates, dtype=float)
+
+        if self.centers is None:
+            self.first, self.second = get_candidate_pairs(coordinates, self.cut_off + self.skin, reorder=self.reorder)
+
+        else:
+            first, second = [], []
+
+            for center in self.centers:
+                neighbors = flatnonzero(linalg.norm(coordinates - coordinates[center], axis=1) <=
+                                        self.cut_off + self.skin)
+                first.append(array([center] * len(neighbors), dtype=int64))
+                second.append(neighbors.astype(int64))
+
+            self.first, self.second = concatenate(first), concatenate(second)
+
+        self.reference_coordinates = coordinates.copy()
+        self.number_of_builds += 1
+
+    def update(self, coordinates: ndarray) -> bool:
+        """
+        Rebuilds the list if the number of atoms changed or an atom moved more than half of the skin distance.
+
+        :param coordinates: The coordinates of the atoms (n, 3).
+        :return: True if the list was rebuilt.
+        """
+
+        coordinates = asarray(coordinates, dtype=float)
+
+        if self.reference_coordinates is None or self.reference_coordinates.shape != coordinates.shape or \
+                linalg.norm(coordinates - self.reference_coordinates, axis=1).max() > self.skin / 2:
+            self.build(coordinates)
+            return True
+
+        return False
+
+    def get_pairs(self, coordinates: ndarray) -> tuple[ndarray, ndarray, ndarray]:
+        """
+        :param coordinates: The current coordinates of the atoms (n, 3).
+        :return: The first and the second atom indices and the distances of the pairs within the cut-off.
+        """
+
+        coordinates = asarray(coordinates, dtype=float)
+        self.update(coordinates)
+
+        distances = linalg.norm(coordinates[self.second] - coordinates[self.first], axis=1)
+        within = distances <= self.cut_off
+
+        return self.first[within], self.second[within], distances[within]
+
+    def get_neighbors(self, center: int, coordinates: ndarray) -> ndarray:
+        """
+        :param center: The index of the atom.
+        :param coordinates: The current coordinates of the atoms (n, 3).
+        :return: The sorted indices of the atoms within the cut-off of the atom (the atom included).
+        """
+
+        first, second, _ = self.get_pairs(coordinates)
+        neighbors = concatenate([second[first == center], first[second == center], [center]])
+
+        return array(sorted(set(neighbors.tolist())), dtype=int64)
+
+
+class BondTopology:
+    """
+    A class that represents the bonds of a structure. The bonds are perceived once and then held fixed for every
+    frame of a trajectory until they are perceived again.
+    """
+
+    def __init__(self, atoms: list[Atom] | None = None, reorder: bool = False):
+        """
+        :param atoms: The atoms the bonds are perceived from (None leaves the topology empty).
+        :param reorder: Whether the pair search sorts the atoms along a Morton curve (faster for large structures).
+        """
+
+        self.bonds = empty((0, 2), dtype=int64)
+        self.reorder = reorder
+
+        if atoms is not None:
+            self.perceive(atoms)
+
+    def perceive(self, atoms: list[Atom]):
+        """
+        Perceives the bonds: two atoms are bonded if their distance is at most 1.3 times the sum of their covalent
+        radii.
+
+        :param atoms: The atoms of the structure (the list position must match the atom index).
+        """
+
+        coordinates = array([atom.coord for atom in atoms], dtype=float)
+        radii = COVALENT_RADII[array([atom.atomic_number for atom in atoms], dtype=int), SINGLE_BOND]
+
+        first, second = get_candidate_pairs(coordinates, 2 * radii.max(initial=0.0) * BOND_SCALING_FACTOR,
+                                            reorder=self.reorder)
+        distances = linalg.norm(coordinates[second] - coordinates[first], axis=1)
+        bonded = distances <= (radii[first] + radii[second]) * BOND_SCALING_FACTOR
+
+        bonds = array([first[bonded], second[bonded]]).T.reshape(-1, 2)
+        self.bonds = bonds[lexsort((bonds[:, 1], bonds[:, 0]))]
+
+    def get_bonds(self, indices: list[int]) -> ndarray:
+        """
+        :param indices: The atom indices.
+        :return: The bonds between the given atoms as pairs of positions in the indices, ordered like the combinations
+        of the indices (so the dipole moments match the ones of get_dipole_moments).
+        """
+
+        indices = asarray(indices, dtype=int64)
+
+        if len(indices) == 0 or len(self.bonds) == 0:
+            return empty((0, 2), dtype=int64)
+
+        positions = full(max(indices.max(), self.bonds.max()) + 1, -1, dtype=int64)
+        positions[indices] = arange(len(indices))
+
+        first, second = positions[self.bonds[:, 0]], positions[self.bonds[:, 1]]
+        included = (first >= 0) & (second >= 0)
+
+        first, second = minimum(first, second)[included], maximum(first, second)[included]
+        order = lexsort((second, first))
+
+        return array([first[order], second[order]]).T.reshape(-1, 2)
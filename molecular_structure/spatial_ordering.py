@@ -0,0 +1,89 @@
+from numpy import argsort, asarray, empty_like, floor, ndarray, uint64, zeros
+
+# The number of bits per axis of the Morton code (3 * 21 bits fit into 64 bits).
+MORTON_BITS = 21
+
+
+def spread_bits(values: ndarray) -> ndarray:
+    """
+    The function inserts two zero bits between the bits of the values (the first 21 bits), so the bits of three
+    values can be interleaved.
+
+    :param values: The values (unsigned 64-bit integers).
+    :return: The values with the bits spread out.
+    """
+
+    values = values & 0x1fffff
+    values = (values | values << 32) & 0x1f00000000ffff
+    values = (values | values << 16) & 0x1f0000ff0000ff
+    values = (values | values << 8) & 0x100f00f00f00f00f
+    values = (values | values << 4) & 0x10c30c30c30c30c3
+    values = (values | values << 2) & 0x1249249249249249
+
+    return values
+
+
+def get_morton_codes(coordinates: ndarray, bits: int = MORTON_BITS) -> ndarray:
+    """
+    The function returns the Morton (Z-order) codes of the points: the coordinates are quantized on a grid spanning
+    the bounding box of the points, and the bits of the grid cells are interleaved.
+
+    :param coordinates: The coordinates of the points (n, 3).
+    :param bits: The number of bits per axis (at most 21).
+    :return: The Morton codes of the points (unsigned 64-bit integers).
+    """
+
+    coordinates = asarray(coordinates, dtype=float)
+
+    if len(coordinates) == 0:
+        return zeros(0, dtype=uint64)
+
+    lower = coordinates.min(axis=0)
+    extent = (coordinates.max(axis=0) - lower).max()
+    scale = ((1 << bits) - 1) / extent if extent > 0 else 0.0
+
+    cells = floor((coordinates - lower) * scale).astype(uint64)
+
+    return spread_bits(cells[:, 0]) | spread_bits(cells[:, 1]) << uint64(1) | spread_bits(cells[:, 2]) << uint64(2)
+
+
+class SpatialOrdering:
+    """
+    A class that represents the order of the atoms along a Morton space-filling curve, so atoms that are close in
+    space are close in memory. The permutation is stored, so the results can be mapped back to the original order
+    (the indices of the Atom and Guest objects are not changed).
+    """
+
+    def __init__(self, coordinates: ndarray):
+        """
+        :param coordinates: The coordinates of the atoms in the original order (n, 3).
+        """
+
+        # The original index of every position in the new order and the new position of every original index.
+        self.permutation = argsort(get_morton_codes(coordinates), kind='stable')
+        self.inverse_permutation = empty_like(self.permutation)
+        self.inverse_permutation[self.permutation] = range(len(self.permutation))
+
+    def reorder(self, values: ndarray) -> ndarray:
+        """
+        :param values: The values of the atoms in the original order.
+        :return: The values of the atoms in the spatial order.
+        """
+
+        return asarray(values)[self.permutation]
+
+    def restore(self, values: ndarray) -> ndarray:
+        """
+        :param values: The values of the atoms in the spatial order.
+        :return: The values of the atoms in the original order.
+        """
+
+        return asarray(values)[self.inverse_permutation]
+
+    def get_original_indices(self, positions: ndarray) -> ndarray:
+        """
+        :param positions: The positions of atoms in the spatial order.
+        :return: The original indices of the atoms.
+        """
+
+        return self.permutation[positions]
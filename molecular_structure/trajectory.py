@@ -0,0 +1,267 @@
+import os
+from mmap import ACCESS_READ, mmap
+from typing import Iterator
+
+from numpy import array, flatnonzero, frombuffer, load, ndarray, save, uint8
+
+from molecular_structure.compressed_files import is_compressed_file, open_file
+from molecular_structure.molecular_structure import parse_structure_text
+
+NEW_LINE = ord('\n')
+
+
+def get_frame_index_path(trajectory_file_path: str) -> str:
+    """
+    :param trajectory_file_path: The full path of the trajectory (.xyz) file.
+    :return: The full path of the frame index stored next to the trajectory file.
+    """
+
+    return f'{trajectory_file_path}.frames.npy'
+
+
+def build_frame_index(trajectory_file_path: str) -> ndarray:
+    """
+    The function scans a multi-frame Cartesian coordinates file once and returns the byte offsets of the frames. Every
+    frame is skipped by its header (the number of atoms), and the new lines of a frame are located with NumPy in a
+    window of the memory-mapped file, so the memory use does not grow with the size of the file. Compressed files are
+    scanned line by line while they are decompressed, and the offsets refer to the decompressed data.
+
+    :param trajectory_file_path: The full path of the trajectory (.xyz) file.
+    :raises FileNotFoundError: The trajectory file does not exist.
+    :raises RuntimeError: A frame has no valid header or fewer lines than its header states.
+    :return: The byte offsets of the frames followed by the end offset of the last frame (n + 1,).
+    """
+
+    offsets = [0]
+
+    if is_compressed_file(trajectory_file_path):
+        return build_stream_frame_index(trajectory_file_path)
+
+    if os.path.getsize(trajectory_file_path) == 0:
+        return array(offsets, dtype=int)
+
+    with open(trajectory_file_path, 'rb') as file, mmap(file.fileno(), 0, access=ACCESS_READ) as data:
+        buffer = frombuffer(data, dtype=uint8)
+
+        try:
+            window = 4096
+
+            # Trailing white space after the last frame is not a frame.
+            content_end = len(data)
+
+            while content_end > 0 and data[content_end - 1:content_end].isspace():
+                content_end -= 1
+
+            while offsets[-1] < content_end:
+                start = offsets[-1]
+                header_end = data.find(b'\n', start)
+
+                try:
+                    number_of_lines = int(data[start:header_end if header_end != -1 else len(data)]) + 2
+
+                except ValueError:
+                    raise RuntimeError(f'frame {len(offsets) - 1} of {trajectory_file_path} has no valid header.')
+
+                while True:
+                    new_lines = flatnonzero(buffer[start:start + window] == NEW_LINE)
+
+                    if len(new_lines) >= number_of_lines or start + window >= len(data):
+                        break
+
+                    window *= 2
+
+                if len(new_lines) >= number_of_lines:
+                    offsets.append(start + int(new_lines[number_of_lines - 1]) + 1)
+
+                elif len(new_lines) == number_of_lines - 1 and start + int(new_lines[-1]) + 1 < content_end:
+                    offsets.append(len(data))  # The last line of the file has no new line.
+
+                else:
+                    raise RuntimeError(f'frame {len(offsets) - 1} of {trajectory_file_path} is incomplete.')
+
+        finally:
+            del buffer  # The memory map can not be closed while the array refers to it.
+
+    return array(offsets, dtype=int)
+
+
+def build_stream_frame_index(trajectory_file_path: str) -> ndarray:
+    """
+    The function scans a trajectory file once as a stream (e.g., while it is decompressed) and returns the byte
+    offsets of the frames.
+
+    :param trajectory_file_path: The full path of the trajectory (.xyz) file.
+    :raises RuntimeError: A frame has no valid header or fewer lines than its header states.
+    :return: The byte offsets of the frames followed by the end offset of the last frame (n + 1,).
+    """
+
+    offsets = [0]
+
+    with open_file(trajectory_file_path, 'rb') as file:
+        while header := file.readline():
+            if not header.strip():
+                if file.read().strip():
+                    raise RuntimeError(f'frame {len(offsets) - 1} of {trajectory_file_path} has no valid header.')
+
+                break
+
+            try:
+                number_of_lines = int(header) + 1
+
+            except ValueError:
+                raise RuntimeError(f'frame {len(offsets) - 1} of {trajectory_file_path} has no valid header.')
+
+            frame_length = len(header)
+
+            for _ in range(number_of_lines):
+                line = file.readline()
+
+                if not line:
+                    raise RuntimeError(f'frame {len(offsets) - 1} of {trajectory_file_path} is incomplete.')
+
+                frame_length += len(line)
+
+            offsets.append(offsets[-1] + frame_length)
+
+    return array(offsets, dtype=int)
+
+
+def load_frame_index(trajectory_file_path: str, index_file_path: str | None = None) -> ndarray:
+    """
+    The function loads the frame index stored next to the trajectory file, or builds and stores it if it is missing
+    or older than the trajectory file.
+
+    :param trajectory_file_path: The full path of the trajectory (.xyz) file.
+    :param index_file_path: The full path of the frame index (<trajectory>.frames.npy if None).
+    :return: The byte offsets of the frames followed by the end offset of the last frame (n + 1,).
+    """
+
+    if index_file_path is None:
+        index_file_path = get_frame_index_path(trajectory_file_path)
+
+    if os.path.isfile(index_file_path) and \
+            os.path.getmtime(index_file_path) >= os.path.getmtime(trajectory_file_path):
+        return load(index_file_path)
+
+    offsets = build_frame_index(trajectory_file_path)
+
+    try:
+        save(index_file_path, offsets)
+
+    except OSError:
+        pass  # The index is only a cache; read-only directories are fine.
+
+    return offsets
+
+
+class Trajectory:
+    """
+    A class that represents a multi-frame Cartesian coordinates (.xyz) file, e.g., the output of molecular dynamics
+    or a conformer search. The file is memory-mapped and indexed by frame, so any frame can be read without parsing
+    the frames before it. Compressed files (.gz, .xz or .bz2) are read by seeking in the decompressed stream instead;
+    reading the frames in order is fast, while seeking backwards restarts the decompression.
+    """
+
+    def __init__(self, trajectory_file_path: str, index_file_path: str | None = None):
+        """
+        :param trajectory_file_path: The full path of the trajectory (.xyz) file.
+        :param index_file_path: The full path of the frame index (<trajectory>.frames.npy if None).
+        :raises FileNotFoundError: The trajectory file does not exist.
+        """
+
+        self.trajectory_file_path = trajectory_file_path
+        self.offsets = load_frame_index(trajectory_file_path, index_file_path)
+
+        self.file = open_file(trajectory_file_path, 'rb')
+
+        if is_compressed_file(trajectory_file_path):
+            self.data = None
+
+        else:
+            self.data = mmap(self.file.fileno(), 0, access=ACCESS_READ) if len(self.offsets) > 1 else b''
+
+    def __len__(self) -> int:
+        """
+        :return: The number of frames in the trajectory.
+        """
+
+        return len(self.offsets) - 1
+
+    def __getitem__(self, frame: int) -> tuple[ndarray, ndarray]:
+        """
+        :param frame: The index of the frame (negative indices count from the end).
+        :return: The elements (n,) and the coordinates (n, 3) of the frame.
+        """
+
+        return self.get_frame(frame)
+
+    def __iter__(self) -> Iterator[tuple[ndarray, ndarray]]:
+        """
+        :return: The elements and the coordinates of every frame.
+        """
+
+        return self.iterate_frames()
+
+    def __enter__(self) -> 'Trajectory':
+        return self
+
+    def __exit__(self, *exception_information):
+        self.close()
+
+    def close(self):
+        """
+        Closes the memory map and the trajectory file.
+        """
+
+        if isinstance(self.data, mmap):
+            self.data.close()
+
+        self.file.close()
+
+    def get_frame_text(self, frame: int) -> str:
+        """
+        :param frame: The index of the frame (negative indices count from the end).
+        :raises IndexError: The frame does not exist.
+        :return: The text of the frame (the header, the comment line and the atoms).
+        """
+
+        if not -len(self) <= frame < len(self):
+            raise IndexError(f'the trajectory has {len(self)} frames.')
+
+        frame %= len(self)
+
+        if self.data is None:
+            self.file.seek(int(self.offsets[frame]))
+            return self.file.read(int(self.offsets[frame + 1] - self.offsets[frame])).decode()
+
+        return self.data[self.offsets[frame]:self.offsets[frame + 1]].decode()
+
+    def get_comment(self, frame: int) -> str:
+        """
+        :param frame: The index of the frame (negative indices count from the end).
+        :return: The comment line of the frame.
+        """
+
+        return (self.get_frame_text(frame) + '\n\n').split('\n', 2)[1].strip()
+
+    def get_frame(self, frame: int) -> tuple[ndarray, ndarray]:
+        """
+        :param frame: The index of the frame (negative indices count from the end).
+        :return: The elements (n,) and the coordinates (n, 3) of the frame.
+        """
+
+        return parse_structure_text(self.get_frame_text(frame), f'frame {frame} of {self.trajectory_file_path}')
+
+    def iterate_frames(self, start: int = 0, stop: int | None = None,
+                       step: int = 1) -> Iterator[tuple[ndarray, ndarray]]:
+        """
+        The function reads every step-th frame from start to stop; the skipped frames are not parsed.
+
+        :param start: The index of the first frame.
+        :param stop: The index after the last frame (None reads to the end).
+        :param step: The stride between the frames.
+        :return: The elements and the coordinates of the frames.
+        """
+
+        for frame in range(len(self))[start:stop:step]:
+            yield self.get_frame(frame)
@@ -0,0 +1,87 @@
+import json
+import os
+from pathlib import Path
+from shutil import copyfile
+
+from numpy import ndarray
+from numpy.random import default_rng
+
+from dataset.dataset_builder import build_data_set
+from descriptors.descriptor_registry import Descriptor
+from models.model_artifact import save_model_artifact
+from models.random_forest import fit_random_forest
+from tests.helper_functions import build_path
+
+
+def build_regression_data(number_of_samples: int, number_of_features: int) -> tuple[ndarray, ndarray]:
+    """
+    Builds a small random regression problem (a noisy linear function of normally distributed descriptors).
+
+    :param number_of_samples: The number of samples.
+    :param number_of_features: The number of descriptors per sample.
+    :return: The descriptors (samples, descriptors) and the values (samples,).
+    """
+
+    generator = default_rng(42)
+    descriptors = generator.normal(size=(number_of_samples, number_of_features))
+    weights = generator.normal(size=number_of_features)
+    values = descriptors @ weights + generator.normal(scale=0.1, size=number_of_samples)
+
+    return descriptors, values
+
+
+def build_complex_directory(directory: str, prefix: str = 'anions') -> list[dict]:
+    """
+    Writes the spherical, tetrahedral and octahedral test complexes into a directory in the layout of the data set
+    (<prefix>-NNN-information.json, <prefix>-NNN-geometry.xyz and <prefix>-NNN-charges).
+
+    :param directory: The full path of the directory.
+    :param prefix: The prefix of the complex file names.
+    :return: The information of the complexes (in the order of the complex indices).
+    """
+
+    complexes = [
+        ('spherical', {'Guest - Central Atom': 0, 'Guest - Vertex Atoms': [], 'dG': -10.5}),
+        ('tetrahedral', {'Guest - Central Atom': 260, 'Guest - Vertex Atoms': [258, 259, 261, 262], 'dG': -20.5}),
+        ('octahedral', {'Guest - Central Atom': 197, 'Guest - Vertex Atoms': [194, 195, 196, 198, 199, 200],
+                        'dG': -30.5})
+    ]
+
+    information = []
+
+    for index, (shape, complex_information) in enumerate(complexes):
+        complex_information.update({'HOMO-LUMO Gap': 0.15, 'Reference': 'test', 'Solvent': 'Methanol'})
+        information.append(complex_information)
+
+        complex_path = Path(directory).joinpath(f'{prefix}-{index:03}')
+
+        copyfile(build_path(f'anion_{shape}_geometry.xyz'), f'{complex_path}-geometry.xyz')
+        copyfile(build_path(f'anion_{shape}_charges'), f'{complex_path}-charges')
+
+        with open(f'{complex_path}-information.json', 'w') as information_file:
+            json.dump(complex_information, information_file, indent=4)
+
+    return information
+
+
+def build_model_artifact(directory: str) -> tuple[list[dict], str, ndarray, ndarray]:
+    """
+    Writes the test complexes into a directory and saves a small random forest trained on their features (with a small
+    ACSF descriptor) as the model artifact cavitand-model in the same directory.
+
+    :param directory: The full path of the directory.
+    :return: The information of the complexes, the full path of the model artifact, the predictions of the model for
+    the complexes and the complex indices.
+    """
+
+    information = build_complex_directory(directory)
+
+    descriptor = Descriptor('acsf', g2_params=[[1, 1], [1, 2]], g4_params=[[1, 1, 1]])
+    values, columns, indices = build_data_set(directory, 'anions', descriptor, number_of_complexes=10)
+
+    model = fit_random_forest(values[:, 1:], values[:, 0], 1, n_estimators=10, oob_score=False)
+
+    artifact_path = os.path.join(directory, 'cavitand-model')
+    save_model_artifact(artifact_path, model, columns[1:], descriptor, 6.0)
+
+    return information, artifact_path, model.predict(values[:, 1:]), indices
@@ -0,0 +1,81 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from numpy import allclose, array, array_equal
+
+from complexes.ensemble import (ENSEMBLE_COLUMNS, calculate_ensemble_energies, get_boltzmann_weights,
+                                get_ensemble_average, get_interaction_energies)
+from dataset.helper_functions import get_host_guest_complex
+from molecular_structure.molecular_structure import make_list_of_atoms, read_partial_charges, read_structure_arrays
+from tests.helper_functions import build_path
+
+
+class TestEnsemble(TestCase):
+
+    def setUp(self):
+
+        # Set up a trajectory of the tetrahedral test complex with the guest shifted in every frame.
+        self.directory = TemporaryDirectory()
+        self.trajectory_file = os.path.join(self.directory.name, 'trajectory.xyz')
+
+        self.information = {'Guest - Central Atom': 260, 'Guest - Vertex Atoms': [258, 259, 261, 262],
+                            'HOMO-LUMO Gap': 0.15, 'Solvent': 'Methanol'}
+        self.charges = read_partial_charges(build_path('anion_tetrahedral_charges'))
+
+        elements, coordinates = read_structure_arrays(build_path('anion_tetrahedral_geometry.xyz'))
+
+        with open(self.trajectory_file, 'w') as trajectory_file:
+            for shift in [0.0, 0.1, 0.2, 0.3]:
+                frame_coordinates = coordinates.copy()
+                frame_coordinates[258:263] += shift
+
+                trajectory_file.write(f'{len(elements)}\nshift {shift}\n')
+                trajectory_file.writelines(f'{element} {float(x)!r} {float(y)!r} {float(z)!r}\n'
+                                           for element, (x, y, z) in zip(elements, frame_coordinates))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_calculate_ensemble_energies(self):
+        """
+        Tests that the frame energies match the complex energies and do not depend on the number of processes.
+        """
+
+        energies = calculate_ensemble_energies(self.trajectory_file, self.charges, self.information)
+        self.assertEqual(energies.shape, (4, len(ENSEMBLE_COLUMNS)))
+
+        atoms = make_list_of_atoms(build_path('anion_tetrahedral_geometry.xyz'),
+                                   build_path('anion_tetrahedral_charges'))
+        self.assertTrue(array_equal(energies[0], get_interaction_energies(get_host_guest_complex(atoms,
+                                                                                                 self.information))))
+
+        self.assertFalse(array_equal(energies[0], energies[1]))
+        self.assertTrue(array_equal(calculate_ensemble_energies(self.trajectory_file, self.charges, self.information,
+                                                                n_jobs=2, chunk_size=1), energies))
+        self.assertTrue(array_equal(calculate_ensemble_energies(self.trajectory_file, self.charges, self.information,
+                                                                start=1, step=2), energies[1::2]))
+
+        self.assertTrue(allclose(calculate_ensemble_energies(self.trajectory_file, self.charges, self.information,
+                                                             skin=None), energies, rtol=1e-12, atol=0.0))
+
+        with self.assertRaises(RuntimeError):
+            calculate_ensemble_energies(self.trajectory_file, self.charges[:-1], self.information)
+
+    def test_get_ensemble_average(self):
+        """
+        Tests the uniform and the Boltzmann averages.
+        """
+
+        energies = array([[1.0, 2.0], [3.0, 4.0]])
+
+        self.assertTrue(array_equal(get_ensemble_average(energies), [2.0, 3.0]))
+        self.assertTrue(allclose(get_ensemble_average(energies, 'boltzmann', frame_energies=[0.0, 0.0]), [2.0, 3.0]))
+        self.assertTrue(allclose(get_ensemble_average(energies, 'boltzmann'), [1.0, 2.0]))
+
+        weights = get_boltzmann_weights([0.0, 0.001])
+        self.assertAlmostEqual(weights.sum(), 1.0)
+        self.assertGreater(weights[0], weights[1])
+
+        with self.assertRaises(RuntimeError):
+            get_ensemble_average(energies, 'median')
@@ -75,3 +75,18 @@ class TestBindingEnergies(unittest.TestCase):
 
         self.assertIsInstance(binding_energy, float)
         self.assertEqual(round(binding_energy, 8), -0.00194021)
+
+    def test_shared_dipole_moments(self):
+        """
+        Test that the interaction energies share the dipole moments of the complex.
+        """
+
+        dipole_interactions = self.complex_guest.get_dipole_interactions(6.0)
+
+        self.assertIs(self.complex_guest.get_host_dipole_moments(6.0), self.complex_guest.get_host_dipole_moments(6.0))
+        self.assertIs(self.complex_guest.get_guest_dipole_moments(), self.complex_guest.get_guest_dipole_moments())
+        self.assertEqual(self.complex_guest.get_dipole_interactions(6.0), dipole_interactions)
+
+        # Another radius selects other host dipole moments.
+        self.assertNotEqual(len(self.complex_guest.get_host_dipole_moments(4.0)),
+                            len(self.complex_guest.get_host_dipole_moments(6.0)))
@@ -0,0 +1,102 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from numpy import array_equal
+
+from dataset.complex_archive import ComplexArchive, get_archive_path, is_archive_current, pack_complexes
+from dataset.dataset_builder import build_data_set
+from dataset.pipeline import discover_complexes
+from descriptors.descriptor_registry import Descriptor
+from molecular_structure.molecular_structure import make_list_of_atoms
+from tests.model_fixtures import build_complex_directory
+
+
+class TestComplexArchive(TestCase):
+
+    def setUp(self):
+
+        # Set up a directory with the test complexes and their archive.
+        self.directory = TemporaryDirectory()
+        self.information = build_complex_directory(self.directory.name)
+
+        self.archive_path = pack_complexes(self.directory.name, 'anions', os.path.join(self.directory.name, 'packed'),
+                                           number_of_complexes=10)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_pack_complexes(self):
+        """
+        Tests that the archive holds the information and the atoms of the complex files.
+        """
+
+        archive = ComplexArchive(self.archive_path)
+
+        self.assertEqual(len(archive), 3)
+        self.assertEqual(archive.offsets[-1], len(archive.charges))
+
+        for position in range(len(archive)):
+            complex_path = os.path.join(self.directory.name, f'anions-{position:03}')
+            atoms = make_list_of_atoms(f'{complex_path}-geometry.xyz', f'{complex_path}-charges')
+
+            self.assertEqual(archive.get_index(position), position)
+            self.assertEqual(archive.get_information(position), self.information[position])
+
+            for atom, expected_atom in zip(archive.get_atoms(position), atoms, strict=True):
+                self.assertEqual(atom.element, expected_atom.element)
+                self.assertEqual(atom.index, expected_atom.index)
+                self.assertEqual(atom.charge, expected_atom.charge)
+                self.assertTrue(array_equal(atom.coord, expected_atom.coord))
+
+    def test_pack_complexes_mismatch(self):
+        """
+        Tests that a complex with a different number of coordinates and charges can not be packed.
+        """
+
+        with open(os.path.join(self.directory.name, 'anions-001-charges'), 'a') as charge_file:
+            charge_file.write('0.0\n')
+
+        with self.assertRaises(RuntimeError):
+            pack_complexes(self.directory.name, 'anions', os.path.join(self.directory.name, 'mismatch'))
+
+    def test_build_data_set(self):
+        """
+        Tests that the data set built from the archive matches the data set built from the complex files.
+        """
+
+        acsf = Descriptor('acsf', g2_params=[[1, 1]], g4_params=[[1, 1, 1]])
+        values, columns, indices = build_data_set(self.directory.name, 'anions', acsf, number_of_complexes=3)
+
+        os.rename(self.archive_path, get_archive_path(self.directory.name, 'anions'))
+
+        for file_name in os.listdir(self.directory.name):
+            if file_name.startswith('anions-0'):
+                os.remove(os.path.join(self.directory.name, file_name))
+
+        archive_values, archive_columns, archive_indices = build_data_set(self.directory.name, 'anions', acsf,
+                                                                          number_of_complexes=3, index_offset=1)
+
+        self.assertTrue(array_equal(archive_values, values))
+        self.assertEqual(archive_columns, columns)
+        self.assertTrue(array_equal(archive_indices, indices + 1))
+
+    def test_stale_archive(self):
+        """
+        Tests that the complex files are read instead of the archive when a complex file is newer than the archive.
+        """
+
+        os.rename(self.archive_path, get_archive_path(self.directory.name, 'anions'))
+
+        self.assertTrue(is_archive_current(self.directory.name, 'anions'))
+        self.assertTrue(all(record.information_file_path is None for record in
+                            discover_complexes(self.directory.name, 'anions', number_of_complexes=10)))
+
+        # Edit a complex file after packing.
+        information_file_path = os.path.join(self.directory.name, 'anions-001-information.json')
+        os.utime(information_file_path, (os.path.getmtime(information_file_path) + 60,) * 2)
+
+        self.assertFalse(is_archive_current(self.directory.name, 'anions'))
+        self.assertEqual([record.information_file_path is not None for record in
+                          discover_complexes(self.directory.name, 'anions', number_of_complexes=10)], [True] * 3)
+        self.assertFalse(is_archive_current(self.directory.name, 'cations'))
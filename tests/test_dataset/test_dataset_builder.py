@@ -0,0 +1,108 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from numpy import allclose, array_equal, float32, save, zeros
+from pandas import read_csv
+
+from dataset.dataset_builder import build_data_set, merge_data_sets, write_data_set
+from dataset.feature_table import get_feature_table_path, load_feature_table
+from dataset.helper_functions import ENERGY_COLUMNS, get_energy_features, get_host_guest_complex
+from descriptors.atomic_structures import get_ase_atoms
+from descriptors.descriptor_cache import DescriptorCache
+from descriptors.descriptor_registry import Descriptor
+from molecular_structure.molecular_structure import make_list_of_atoms
+from tests.model_fixtures import build_complex_directory
+
+
+class TestDatasetBuilder(TestCase):
+
+    def setUp(self):
+
+        # Set up a directory with the test complexes and the ACSF descriptor.
+        self.directory = TemporaryDirectory()
+        self.information = build_complex_directory(self.directory.name)
+
+        self.acsf = Descriptor('acsf', g2_params=[[1, 1], [1, 2]], g4_params=[[1, 1, 1]])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_build_data_set(self):
+        """
+        Tests building a data set from the complex files.
+        """
+
+        values, columns, indices = build_data_set(self.directory.name, 'anions', self.acsf, number_of_complexes=5,
+                                                  index_offset=100)
+
+        self.assertEqual(columns[:len(ENERGY_COLUMNS)], ENERGY_COLUMNS)
+        self.assertEqual(len(columns), len(ENERGY_COLUMNS) + self.acsf.get_number_of_features())
+        self.assertEqual(values.shape, (3, len(columns)))
+        self.assertEqual(indices.tolist(), [100, 101, 102])
+
+        for row, index, complex_information in zip(values, range(3), self.information):
+            atoms = make_list_of_atoms(os.path.join(self.directory.name, f'anions-{index:03}-geometry.xyz'),
+                                       os.path.join(self.directory.name, f'anions-{index:03}-charges'))
+            host_guest_complex = get_host_guest_complex(atoms, complex_information)
+            central_atom = complex_information['Guest - Central Atom']
+
+            self.assertEqual(row[0], complex_information['dG'])
+            self.assertEqual(row[1:6].tolist(), get_energy_features(host_guest_complex))
+            expected_descriptor = self.acsf.descriptor.create(get_ase_atoms(atoms), [central_atom])[0]
+            self.assertTrue(allclose(row[6:], expected_descriptor, rtol=1e-6))
+
+    def test_build_data_set_cached(self):
+        """
+        Tests that the cached energies and descriptors are reused.
+        """
+
+        cache = DescriptorCache(os.path.join(self.directory.name, 'cache'))
+        data_set = build_data_set(self.directory.name, 'anions', self.acsf, number_of_complexes=3, cache=cache)
+
+        self.assertEqual(len(os.listdir(os.path.join(self.directory.name, 'cache', 'acsf'))), 1)
+        self.assertEqual(len(os.listdir(os.path.join(self.directory.name, 'cache', 'energies'))), 1)
+
+        # Replace the cached descriptors, so a cache hit is detected.
+        for directory, _, file_names in os.walk(os.path.join(self.directory.name, 'cache', 'acsf')):
+            for file_name in file_names:
+                save(os.path.join(directory, file_name), zeros(self.acsf.get_number_of_features(), dtype=float32))
+
+        cached_values, _, _ = build_data_set(self.directory.name, 'anions', self.acsf, number_of_complexes=3,
+                                             cache=cache)
+
+        self.assertTrue(array_equal(cached_values[:, :6], data_set[0][:, :6]))
+        self.assertFalse(cached_values[:, 6:].any())
+
+        # Switching the descriptor reuses the energies.
+        energy_values, energy_columns, _ = build_data_set(self.directory.name, 'anions', Descriptor('energy'),
+                                                          number_of_complexes=3, cache=cache)
+
+        self.assertEqual(energy_columns, ENERGY_COLUMNS)
+        self.assertTrue(array_equal(energy_values, data_set[0][:, :6]))
+
+    def test_write_data_set(self):
+        """
+        Tests that the CSV file and the feature table hold the same values.
+        """
+
+        data_set = build_data_set(self.directory.name, 'anions', self.acsf, number_of_complexes=3)
+        values, columns, indices = merge_data_sets(data_set, data_set)
+
+        csv_file = os.path.join(self.directory.name, 'anion-data.csv')
+        write_data_set(csv_file, values, columns, indices)
+
+        data = read_csv(csv_file, float_precision='round_trip')
+        self.assertEqual(list(data.columns), ['Anion Index'] + columns)
+        self.assertEqual(data.iloc[:, 0].tolist(), [0, 1, 2, 0, 1, 2])
+        self.assertTrue(array_equal(data.iloc[:, 1:].to_numpy(), values))
+
+        feature_table_values, feature_table_columns, feature_table_indices = load_feature_table(
+            get_feature_table_path(csv_file))
+
+        self.assertTrue(array_equal(feature_table_values, values))
+        self.assertEqual(feature_table_columns.tolist(), columns)
+        self.assertEqual(feature_table_indices.tolist(), [0, 1, 2, 0, 1, 2])
+
+        with self.assertRaises(RuntimeError):
+            merge_data_sets(data_set, (values[:, :6], columns[:6], indices))
@@ -0,0 +1,76 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from numpy import array, array_equal, memmap
+from pandas import read_csv
+
+from dataset.feature_table import (convert_csv_to_feature_table, get_feature_table_path, load_feature_table,
+                                   read_feature_data_frame, save_feature_table)
+
+
+class TestFeatureTable(TestCase):
+
+    def setUp(self):
+
+        # Set up a small CSV data set in a temporary directory.
+        self.directory = TemporaryDirectory()
+        self.csv_file = os.path.join(self.directory.name, 'anion-data.csv')
+
+        with open(self.csv_file, 'w') as csv_file:
+            csv_file.write(
+                'Anion Index,Experimental dG,Dipole Interactions,0,1\n'
+                '000,-30.9,-0.0001382912345678901,0.1,2.220446049250313e-16\n'
+                '002,-12.5,-4.5e-05,0.30000000000000004,1e-300\n'
+            )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_save_and_load_feature_table(self):
+        """
+        Tests saving and memory-mapping a feature table.
+        """
+
+        feature_table_path = os.path.join(self.directory.name, 'features')
+        save_feature_table(feature_table_path, array([[1.0, 2.0], [3.0, 4.0]]), ['a', 'b'], array([5, 7]))
+
+        values, columns, index = load_feature_table(feature_table_path)
+
+        self.assertIsInstance(values, memmap)
+        self.assertTrue(array_equal(values, array([[1.0, 2.0], [3.0, 4.0]])))
+        self.assertEqual(columns.tolist(), ['a', 'b'])
+        self.assertTrue(array_equal(index, array([5, 7])))
+
+        with self.assertRaises(RuntimeError):
+            save_feature_table(feature_table_path, array([[1.0, 2.0]]), ['a'], array([5]))
+
+    def test_convert_csv_to_feature_table(self):
+        """
+        Tests that converting a CSV data set keeps the values exact.
+        """
+
+        feature_table_path = convert_csv_to_feature_table(self.csv_file)
+        self.assertEqual(feature_table_path, get_feature_table_path(self.csv_file))
+
+        values, columns, index = load_feature_table(feature_table_path)
+        data = read_csv(self.csv_file, float_precision='round_trip')
+
+        self.assertTrue(array_equal(values, data.iloc[:, 1:].to_numpy()))
+        self.assertEqual(columns.tolist(), ['Experimental dG', 'Dipole Interactions', '0', '1'])
+        self.assertEqual(index.tolist(), [0, 2])
+
+    def test_read_feature_data_frame(self):
+        """
+        Tests that the memory-mapped dataframe has the same layout as the CSV dataframe.
+        """
+
+        data = read_feature_data_frame(self.csv_file)
+        expected_data = read_csv(self.csv_file, float_precision='round_trip')
+
+        self.assertEqual(list(data.columns), list(expected_data.columns))
+        self.assertTrue(array_equal(data.to_numpy(), expected_data.to_numpy()))
+        self.assertTrue(os.path.isdir(get_feature_table_path(self.csv_file)))
+
+        with self.assertRaises(FileNotFoundError):
+            read_feature_data_frame(os.path.join(self.directory.name, 'faulty_file_path.csv'))
@@ -0,0 +1,60 @@
+from unittest import TestCase
+
+from complexes.complex_guest_octahedral_anion import ComplexGuestOctahedralAnion
+from complexes.complex_guest_spherical_anion import ComplexGuestSphericalAnion
+from complexes.complex_guest_tetrahedral_anion import ComplexGuestTetrahedralAnion
+from dataset.helper_functions import get_complex_hash, get_energy_features, get_host_guest_complex
+from molecular_structure.molecular_structure import make_list_of_atoms
+from tests.helper_functions import build_path
+
+
+class TestHelperFunctions(TestCase):
+
+    def setUp(self):
+
+        # Set up the list of Atom objects and the information of the complex.
+        self.atoms = make_list_of_atoms(build_path('anion_tetrahedral_geometry.xyz'),
+                                        build_path('anion_tetrahedral_charges'))
+
+        self.information = {'Guest - Central Atom': 260, 'Guest - Vertex Atoms': [258, 259, 261, 262],
+                            'HOMO-LUMO Gap': 10.0, 'Solvent': 'Methanol', 'dG': -20.5}
+
+    def test_get_host_guest_complex(self):
+        """
+        Tests that the complex class matches the shape of the guest.
+        """
+
+        for vertex_atoms, complex_class in [([], ComplexGuestSphericalAnion),
+                                            ([1, 2, 3, 4], ComplexGuestTetrahedralAnion),
+                                            ([1, 2, 3, 4, 5, 6], ComplexGuestOctahedralAnion)]:
+            host_guest_complex = get_host_guest_complex(self.atoms, {**self.information,
+                                                                     'Guest - Vertex Atoms': vertex_atoms})
+            self.assertIsInstance(host_guest_complex, complex_class)
+
+        with self.assertRaises(RuntimeError):
+            get_host_guest_complex(self.atoms, {**self.information, 'Guest - Vertex Atoms': [1, 2]})
+
+    def test_get_energy_features(self):
+        """
+        Tests that the energy features match the interaction energies of the complex.
+        """
+
+        host_guest_complex = get_host_guest_complex(self.atoms, self.information)
+        energy_features = get_energy_features(host_guest_complex, 50.0)
+
+        self.assertEqual(energy_features[0], host_guest_complex.get_dipole_interactions())
+        self.assertEqual(energy_features[1], host_guest_complex.get_non_polar_dipole_interactions())
+        self.assertEqual(energy_features[2], host_guest_complex.get_freely_rotating_dipole_interactions())
+        self.assertEqual(energy_features[3], host_guest_complex.get_freely_rotating_dipoles_interactions())
+        self.assertEqual(energy_features[4], self.atoms[260].covalent_radius)
+
+    def test_get_complex_hash(self):
+        """
+        Tests that the complex hash only depends on the inputs of the interaction energies.
+        """
+
+        complex_hash = get_complex_hash(self.atoms, self.information)
+
+        self.assertEqual(get_complex_hash(self.atoms, {**self.information, 'dG': -10.0}), complex_hash)
+        self.assertNotEqual(get_complex_hash(self.atoms, {**self.information, 'Solvent': 'Water'}), complex_hash)
+        self.assertNotEqual(get_complex_hash(self.atoms[:-1], self.information), complex_hash)
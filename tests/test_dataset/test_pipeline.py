@@ -0,0 +1,94 @@
+import os
+from tempfile import TemporaryDirectory
+from types import GeneratorType
+from unittest import TestCase
+
+from numpy import array_equal
+
+from dataset.dataset_builder import build_data_set
+from dataset.helper_functions import ENERGY_COLUMNS
+from dataset.pipeline import (build_complexes, calculate_descriptors, calculate_energies, discover_complexes,
+                              get_columns, make_rows, parse_complexes, run_pipeline)
+from descriptors.descriptor_registry import Descriptor
+from molecular_structure.extended_xyz import write_extended_xyz
+from molecular_structure.molecular_structure import read_partial_charges, read_structure_arrays
+from tests.model_fixtures import build_complex_directory
+
+
+class TestPipeline(TestCase):
+
+    def setUp(self):
+
+        # Set up a directory with the test complexes and the ACSF descriptor.
+        self.directory = TemporaryDirectory()
+        self.information = build_complex_directory(self.directory.name)
+
+        self.acsf = Descriptor('acsf', g2_params=[[1, 1], [1, 2]], g4_params=[[1, 1, 1]])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_stages(self):
+        """
+        Tests that the stages fill in the complex records lazily.
+        """
+
+        records = discover_complexes(self.directory.name, 'anions', number_of_complexes=10, index_offset=5)
+        self.assertIsInstance(records, GeneratorType)
+
+        records = list(build_complexes(parse_complexes(records)))
+        self.assertEqual([record.index for record in records], [5, 6, 7])
+        self.assertEqual([record.information for record in records], self.information)
+
+        records = list(calculate_descriptors(calculate_energies(records), self.acsf, batch_size=2))
+
+        for record in records:
+            self.assertEqual(len(record.energy_features), len(ENERGY_COLUMNS) - 1)
+            self.assertEqual(len(record.descriptor), self.acsf.get_number_of_features())
+
+        rows = list(make_rows(records))
+        self.assertEqual(rows[1][0], 6)
+        self.assertEqual(rows[1][1][0], self.information[1]['dG'])
+        self.assertEqual(len(rows[1][1]), len(get_columns(self.acsf)))
+
+    def test_extended_xyz(self):
+        """
+        Tests that complexes stored as extended XYZ files give the same rows as the separate files.
+        """
+
+        values, columns, indices = build_data_set(self.directory.name, 'anions', self.acsf, number_of_complexes=3)
+
+        with TemporaryDirectory() as directory:
+            for index, information in enumerate(self.information):
+                complex_path = os.path.join(self.directory.name, f'anions-{index:03}')
+                elements, coordinates = read_structure_arrays(f'{complex_path}-geometry.xyz')
+
+                write_extended_xyz(os.path.join(directory, f'anions-{index:03}.extxyz'), elements, coordinates,
+                                   read_partial_charges(f'{complex_path}-charges'), information)
+
+            records = list(parse_complexes(discover_complexes(directory, 'anions', number_of_complexes=3)))
+            self.assertEqual([record.information for record in records], self.information)
+
+            extended_xyz_values, _, extended_xyz_indices = build_data_set(directory, 'anions', self.acsf,
+                                                                          number_of_complexes=3)
+
+        self.assertTrue(array_equal(extended_xyz_values, values))
+        self.assertTrue(array_equal(extended_xyz_indices, indices))
+
+    def test_run_pipeline(self):
+        """
+        Tests that the pipeline yields the rows of the data set one at a time.
+        """
+
+        rows = run_pipeline(self.directory.name, 'anions', self.acsf, number_of_complexes=3, batch_size=1)
+        self.assertIsInstance(rows, GeneratorType)
+
+        index, row = next(rows)
+        values, columns, indices = build_data_set(self.directory.name, 'anions', self.acsf, number_of_complexes=3)
+
+        self.assertEqual(index, indices[0])
+        self.assertTrue(array_equal(row, values[0]))
+
+        for (index, row), expected_index, expected_row in zip(rows, indices[1:], values[1:]):
+            self.assertEqual(index, expected_index)
+            self.assertTrue(array_equal(row, expected_row))
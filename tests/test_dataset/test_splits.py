@@ -0,0 +1,85 @@
+import json
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from numpy import array, array_equal
+
+from dataset.splits import get_split_masks, load_data_arrays, load_split_arrays, load_split_definition
+
+
+class TestSplits(TestCase):
+
+    def setUp(self):
+
+        # Set up a small CSV data set and a splits file in a temporary directory.
+        self.directory = TemporaryDirectory()
+        self.csv_file = os.path.join(self.directory.name, 'anion-data.csv')
+        self.splits_file = os.path.join(self.directory.name, 'splits.json')
+
+        with open(self.csv_file, 'w') as csv_file:
+            csv_file.write(
+                'Anion Index,Experimental dG,Dipole Interactions,0\n'
+                '000,-30.9,-0.1,0.1\n'
+                '001,-12.5,-0.2,0.2\n'
+                '002,-20.0,-0.3,0.3\n'
+                '003,-25.0,-0.4,0.4\n'
+            )
+
+        with open(self.splits_file, 'w') as splits_file:
+            json.dump({'cavitand': {'TRN': [3, 0], 'VAL': [2], 'TST': [1]}, 'partial': {'TRN': [0, 1]}}, splits_file)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_load_split_definition(self):
+        """
+        Tests loading a split definition from the splits file.
+        """
+
+        split_definition = load_split_definition(self.splits_file, 'cavitand')
+
+        self.assertEqual(list(split_definition), ['TRN', 'VAL', 'TST'])
+        self.assertTrue(array_equal(split_definition['TRN'], array([3, 0])))
+
+        with self.assertRaises(RuntimeError):
+            load_split_definition(self.splits_file, 'unknown')
+
+    def test_get_split_masks(self):
+        """
+        Tests the boolean masks of the splits and the checks of unused and repeated indices.
+        """
+
+        masks = get_split_masks(array([0, 1, 2, 3]), {'TRN': array([3, 0]), 'TST': array([1, 2])})
+
+        self.assertTrue(array_equal(masks['TRN'], array([True, False, False, True])))
+        self.assertTrue(array_equal(masks['TST'], array([False, True, True, False])))
+
+        with self.assertRaises(RuntimeError):
+            get_split_masks(array([0, 1, 2, 3]), {'TRN': array([0, 1])})
+
+        with self.assertRaises(RuntimeError):
+            get_split_masks(array([0, 1, 2, 3]), {'TRN': array([0, 1, 2]), 'TST': array([2, 3])})
+
+        masks = get_split_masks(array([0, 1, 2, 3]), {'TRN': array([0, 1])}, complete=False)
+        self.assertEqual(int(masks['TRN'].sum()), 2)
+
+    def test_load_split_arrays(self):
+        """
+        Tests that the split arrays hold the rows of the data set in the order of the data set.
+        """
+
+        splits = load_split_arrays(self.csv_file, load_split_definition(self.splits_file, 'cavitand'))
+
+        trn_descriptors, trn_values = splits['TRN']
+        self.assertTrue(array_equal(trn_descriptors, array([[-0.1, 0.1], [-0.4, 0.4]])))
+        self.assertTrue(array_equal(trn_values, array([-30.9, -25.0])))
+        self.assertTrue(array_equal(splits['VAL'][1], array([-20.0])))
+        self.assertTrue(array_equal(splits['TST'][0], array([[-0.2, 0.2]])))
+
+        with self.assertRaises(RuntimeError):
+            load_split_arrays(self.csv_file, load_split_definition(self.splits_file, 'partial'))
+
+        descriptors, values, index = load_data_arrays(self.csv_file)
+        self.assertEqual(descriptors.shape, (4, 2))
+        self.assertTrue(array_equal(index, array([0, 1, 2, 3])))
@@ -0,0 +1,69 @@
+from unittest import TestCase
+
+from ase.io import read
+from dscribe.descriptors import ACSF
+from numpy import allclose, array_equal
+
+from descriptors.atomic_structures import crop_structure, get_ase_atoms, make_ase_atoms
+from molecular_structure.molecular_structure import get_structure_coordinates, make_list_of_atoms
+from tests.helper_functions import build_path
+
+
+class TestAtomicStructures(TestCase):
+
+    def setUp(self):
+
+        # Set up the paths of the Cartesian coordinates and charges files.
+        self.coordinates_file = build_path('anion_tetrahedral_geometry.xyz')
+        self.charge_file = build_path('anion_tetrahedral_charges')
+
+    def test_make_ase_atoms(self):
+        """
+        Tests that the converted structure is identical to the structure read by ASE.
+        """
+
+        structure = make_ase_atoms(*get_structure_coordinates(self.coordinates_file))
+        expected_structure = read(self.coordinates_file)
+
+        self.assertEqual(structure.get_chemical_symbols(), expected_structure.get_chemical_symbols())
+        self.assertTrue(array_equal(structure.get_positions(), expected_structure.get_positions()))
+        self.assertFalse(structure.pbc.any())
+
+        with self.assertRaises(RuntimeError):
+            make_ase_atoms(['H', 'H'], [[0.0, 0.0, 0.0]])
+
+    def test_get_ase_atoms(self):
+        """
+        Tests that the ACSF descriptor of the converted structure is identical to the one of the structure read by ASE.
+        """
+
+        acsf = ACSF(species=['H', 'B', 'C', 'N', 'O', 'F', 'P', 'S', 'Cl', 'Br', 'Sb', 'I', 'Re'], r_cut=15.0,
+                    g2_params=[[1, 1], [1, 2], [1, 3]], g4_params=[[1, 1, 1], [1, 2, 1], [1, 1, -1], [1, 2, -1]])
+
+        structure = get_ase_atoms(make_list_of_atoms(self.coordinates_file, self.charge_file))
+        expected_structure = read(self.coordinates_file)
+
+        self.assertTrue(array_equal(acsf.create(structure, centers=[0]), acsf.create(expected_structure, centers=[0])))
+
+    def test_crop_structure(self):
+        """
+        Tests that cropping the structure to the cut-off radius does not change the ACSF descriptor.
+        """
+
+        acsf = ACSF(species=['H', 'B', 'C', 'N', 'O', 'F', 'P', 'S', 'Cl', 'Br', 'Sb', 'I', 'Re'], r_cut=6.0,
+                    g2_params=[[1, 1], [1, 2], [1, 3]], g4_params=[[1, 1, 1], [1, 2, 1], [1, 1, -1], [1, 2, -1]])
+
+        structure = read(self.coordinates_file)
+
+        for centers in [[260], [0], [0, 260]]:
+            cropped_structure, cropped_centers = crop_structure(structure, centers, 6.0)
+
+            kept_atoms = [index for index in range(len(structure))
+                          if any(structure.get_distance(index, center) <= 6.0 for center in centers)]
+
+            self.assertLess(len(cropped_structure), len(structure))
+            self.assertTrue(array_equal(cropped_structure.get_positions(), structure.get_positions()[kept_atoms]))
+            self.assertEqual(cropped_centers, [kept_atoms.index(center) for center in centers])
+            # The cell list of the descriptor sums the neighbours in a different order (round-off differences only).
+            self.assertTrue(allclose(acsf.create(cropped_structure, centers=cropped_centers),
+                                     acsf.create(structure, centers=centers), rtol=1e-12, atol=1e-12))
@@ -0,0 +1,63 @@
+from unittest import TestCase
+
+from dscribe.descriptors import ACSF
+from numpy import allclose, float32
+
+from descriptors.atomic_structures import get_ase_atoms
+from descriptors.batch_descriptors import create_descriptor_matrix
+from molecular_structure.molecular_structure import make_list_of_atoms
+from tests.helper_functions import build_path
+
+
+class TestBatchDescriptors(TestCase):
+
+    def setUp(self):
+
+        # Set up the ACSF descriptor and the structures of the test complexes.
+        self.acsf = ACSF(species=['H', 'B', 'C', 'N', 'O', 'F', 'P', 'S', 'Cl', 'Br', 'Sb', 'I', 'Re'], r_cut=15.0,
+                         g2_params=[[1, 1], [1, 2], [1, 3]], g4_params=[[1, 1, 1], [1, 2, 1], [1, 1, -1], [1, 2, -1]])
+
+        self.structures = [
+            get_ase_atoms(make_list_of_atoms(build_path(f'anion_{shape}_geometry.xyz'),
+                                             build_path(f'anion_{shape}_charges')))
+            for shape in ['spherical', 'tetrahedral', 'octahedral']
+        ]
+
+        self.centers = [0, 0, 0]
+
+    def test_create_descriptor_matrix(self):
+        """
+        Tests that the batched descriptors match the descriptors calculated one structure at a time.
+        """
+
+        for n_jobs in [1, 2]:
+            descriptors = create_descriptor_matrix(self.acsf, self.structures, self.centers, n_jobs)
+
+            self.assertEqual(descriptors.dtype, float32)
+            self.assertEqual(descriptors.shape, (3, self.acsf.get_number_of_features()))
+
+            for descriptor, structure, center in zip(descriptors, self.structures, self.centers):
+                self.assertTrue(allclose(descriptor, self.acsf.create(structure, centers=[center])[0], rtol=1e-6))
+
+    def test_create_descriptor_matrix_cropped(self):
+        """
+        Tests that cropping the structures to the cut-off radius does not change the descriptors.
+        """
+
+        self.acsf = ACSF(species=['H', 'B', 'C', 'N', 'O', 'F', 'P', 'S', 'Cl', 'Br', 'Sb', 'I', 'Re'], r_cut=6.0,
+                         g2_params=[[1, 1], [1, 2], [1, 3]], g4_params=[[1, 1, 1], [1, 2, 1], [1, 1, -1], [1, 2, -1]])
+
+        self.assertTrue(allclose(create_descriptor_matrix(self.acsf, self.structures, self.centers, crop_radius=6.0),
+                                 create_descriptor_matrix(self.acsf, self.structures, self.centers), rtol=1e-6))
+
+    def test_create_descriptor_matrix_edge_cases(self):
+        """
+        Tests a single structure, no structures and mismatching centers.
+        """
+
+        self.assertEqual(create_descriptor_matrix(self.acsf, self.structures[:1], [0]).shape,
+                         (1, self.acsf.get_number_of_features()))
+        self.assertEqual(create_descriptor_matrix(self.acsf, [], []).shape, (0, self.acsf.get_number_of_features()))
+
+        with self.assertRaises(RuntimeError):
+            create_descriptor_matrix(self.acsf, self.structures, [0])
@@ -0,0 +1,73 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from numpy import array, array_equal
+
+from descriptors.atomic_structures import get_ase_atoms
+from descriptors.descriptor_cache import DescriptorCache, create_cached_descriptor_matrix, get_geometry_hash
+from descriptors.descriptor_registry import Descriptor
+from molecular_structure.molecular_structure import make_list_of_atoms
+from tests.helper_functions import build_path
+
+
+class TestDescriptorCache(TestCase):
+
+    def setUp(self):
+
+        # Set up the cache directory, the descriptor and the structures of the test complexes.
+        self.directory = TemporaryDirectory()
+        self.cache = DescriptorCache(self.directory.name)
+
+        self.acsf = Descriptor('acsf', g2_params=[[1, 1]], g4_params=[[1, 1, 1]])
+
+        self.structures = [
+            get_ase_atoms(make_list_of_atoms(build_path(f'anion_{shape}_geometry.xyz'),
+                                             build_path(f'anion_{shape}_charges')))
+            for shape in ['spherical', 'tetrahedral']
+        ]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_get_geometry_hash(self):
+        """
+        Tests that the geometry hash depends on the positions and the center.
+        """
+
+        structure = self.structures[0].copy()
+
+        self.assertEqual(get_geometry_hash(structure, 0), get_geometry_hash(self.structures[0], 0))
+        self.assertNotEqual(get_geometry_hash(structure, 0), get_geometry_hash(structure, 1))
+
+        structure.positions[0, 0] += 1e-9
+        self.assertNotEqual(get_geometry_hash(structure, 0), get_geometry_hash(self.structures[0], 0))
+
+    def test_load_and_save(self):
+        """
+        Tests storing and loading blocks of values.
+        """
+
+        self.assertIsNone(self.cache.load('geometry', 'acsf', {'r_cut': 15.0}))
+
+        self.cache.save('geometry', 'acsf', {'r_cut': 15.0}, array([1.0, 2.0]))
+
+        self.assertTrue(array_equal(self.cache.load('geometry', 'acsf', {'r_cut': 15.0}), array([1.0, 2.0])))
+        self.assertIsNone(self.cache.load('geometry', 'acsf', {'r_cut': 10.0}))
+        self.assertIsNone(self.cache.load('geometry', 'soap', {'r_cut': 15.0}))
+
+    def test_create_cached_descriptor_matrix(self):
+        """
+        Tests that the cached descriptor matrix matches the calculated one and only missing rows are calculated.
+        """
+
+        descriptors = create_cached_descriptor_matrix(self.acsf, self.structures[:1], [0], self.cache)
+        self.assertEqual(len(os.listdir(os.path.dirname(self.cache.get_path('', 'acsf', self.acsf.parameters)))), 1)
+
+        descriptors = create_cached_descriptor_matrix(self.acsf, self.structures, [0, 0], self.cache)
+        self.assertEqual(len(os.listdir(os.path.dirname(self.cache.get_path('', 'acsf', self.acsf.parameters)))), 2)
+
+        self.assertTrue(array_equal(descriptors, self.acsf.create(self.structures, [0, 0])))
+        self.assertTrue(array_equal(create_cached_descriptor_matrix(self.acsf, self.structures, [0, 0], self.cache),
+                                    descriptors))
+        self.assertTrue(array_equal(create_cached_descriptor_matrix(self.acsf, self.structures, [0, 0]), descriptors))
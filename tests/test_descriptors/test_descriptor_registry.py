@@ -0,0 +1,73 @@
+from unittest import TestCase
+
+from dscribe.descriptors import ACSF, LMBTR, SOAP
+from numpy import float32
+
+from descriptors.atomic_structures import get_ase_atoms
+from descriptors.descriptor_registry import DESCRIPTOR_REGISTRY, Descriptor, register_descriptor
+from molecular_structure.molecular_structure import make_list_of_atoms
+from tests.helper_functions import build_path
+
+
+class TestDescriptorRegistry(TestCase):
+
+    def test_descriptor(self):
+        """
+        Tests selecting the registered descriptors by name.
+        """
+
+        acsf = Descriptor('ACSF', r_cut=6.0)
+        self.assertIsInstance(acsf.descriptor, ACSF)
+        self.assertEqual(acsf.name, 'acsf')
+        self.assertEqual(acsf.parameters['r_cut'], 6.0)
+        self.assertEqual(acsf.crop_radius, 6.0)
+
+        soap = Descriptor('soap', n_max=2)
+        self.assertIsInstance(soap.descriptor, SOAP)
+        self.assertIsNone(soap.crop_radius)
+
+        lmbtr = Descriptor('lmbtr')
+        self.assertIsInstance(lmbtr.descriptor, LMBTR)
+        self.assertIsNone(lmbtr.crop_radius)
+
+        energy = Descriptor('energy')
+        self.assertIsNone(energy.descriptor)
+        self.assertEqual(energy.get_number_of_features(), 0)
+
+        with self.assertRaises(RuntimeError):
+            Descriptor('faulty_descriptor')
+
+        with self.assertRaises(RuntimeError):
+            Descriptor('acsf', faulty_parameter=1.0)
+
+    def test_create(self):
+        """
+        Tests calculating the descriptors with the registered descriptors.
+        """
+
+        structures = [get_ase_atoms(make_list_of_atoms(build_path('anion_spherical_geometry.xyz'),
+                                                       build_path('anion_spherical_charges')))]
+
+        acsf = Descriptor('acsf', g2_params=[[1, 1]], g4_params=[[1, 1, 1]])
+        descriptors = acsf.create(structures, [0])
+
+        self.assertEqual(descriptors.shape, (1, acsf.get_number_of_features()))
+        self.assertEqual(descriptors.dtype, float32)
+
+        self.assertEqual(Descriptor('energy').create(structures, [0]).shape, (1, 0))
+
+    def test_register_descriptor(self):
+        """
+        Tests registering a new descriptor.
+        """
+
+        register_descriptor('test_acsf', lambda r_cut: ACSF(species=['H', 'C'], r_cut=r_cut, g2_params=[[1, 1]]),
+                            {'r_cut': 5.0}, cut_off_parameter='r_cut')
+
+        try:
+            descriptor = Descriptor('test_acsf')
+            self.assertEqual(descriptor.crop_radius, 5.0)
+            self.assertEqual(descriptor.get_number_of_features(), 2 * 2)
+
+        finally:
+            del DESCRIPTOR_REGISTRY['test_acsf']
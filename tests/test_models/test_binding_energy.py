@@ -0,0 +1,78 @@
+import json
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from numpy import allclose
+
+from dataset.helper_functions import get_host_guest_complex
+from models.binding_energy import PREDICTION_STAGES, get_warm_model, predict_binding_energy, read_host_guest_complex
+from models.flat_forest import FlatForest
+from molecular_structure.extended_xyz import write_extended_xyz
+from molecular_structure.molecular_structure import make_list_of_atoms
+from tests.model_fixtures import build_model_artifact
+
+
+class TestBindingEnergy(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        # Set up a directory with the test complexes and a model trained on their features.
+        cls.directory = TemporaryDirectory()
+        cls.information, cls.artifact_path, cls.expected_predictions, _ = build_model_artifact(cls.directory.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def get_complex(self, index: int):
+        """
+        :param index: The index of the test complex.
+        :return: The host-guest complex read from its files.
+        """
+
+        complex_path = os.path.join(self.directory.name, f'anions-{index:03}')
+
+        return get_host_guest_complex(make_list_of_atoms(f'{complex_path}-geometry.xyz', f'{complex_path}-charges'),
+                                      self.information[index])
+
+    def test_predict_binding_energy(self):
+        """
+        Tests that a single complex is predicted like the data set and that the stages are timed.
+        """
+
+        for index, expected_prediction in enumerate(self.expected_predictions):
+            timings = {}
+            prediction = predict_binding_energy(self.get_complex(index), self.artifact_path, timings)
+
+            self.assertTrue(allclose(prediction, expected_prediction))
+            self.assertEqual(list(timings), PREDICTION_STAGES)
+            self.assertTrue(all(timing >= 0.0 for timing in timings.values()))
+
+    def test_get_warm_model(self):
+        """
+        Tests that the model and the descriptor are loaded once per process (the random forest as a flat forest).
+        """
+
+        artifact, descriptor = get_warm_model(self.artifact_path)
+
+        self.assertIs(get_warm_model(self.artifact_path)[0], artifact)
+        self.assertIs(get_warm_model(self.artifact_path)[1], descriptor)
+        self.assertIsInstance(artifact.model, FlatForest)
+
+    def test_read_host_guest_complex(self):
+        """
+        Tests predicting a complex read from a single extended XYZ file.
+        """
+
+        host_guest_complex = self.get_complex(1)
+        extended_xyz_file_path = os.path.join(self.directory.name, 'complex.extxyz')
+
+        write_extended_xyz(extended_xyz_file_path, [atom.element for atom in host_guest_complex.atoms],
+                           [atom.coord for atom in host_guest_complex.atoms],
+                           [atom.charge for atom in host_guest_complex.atoms],
+                           json.loads(json.dumps(self.information[1])))
+
+        self.assertTrue(allclose(predict_binding_energy(read_host_guest_complex(extended_xyz_file_path),
+                                                        self.artifact_path), self.expected_predictions[1]))
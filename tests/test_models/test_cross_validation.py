@@ -0,0 +1,84 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from numpy import allclose, array_equal
+from numpy.random import default_rng
+from sklearn.linear_model import LinearRegression, Ridge
+from sklearn.model_selection import KFold
+from sklearn.tree import DecisionTreeRegressor
+
+from models.cross_validation import cross_validate_models, get_fold_scores
+
+
+class TestCrossValidation(TestCase):
+
+    def setUp(self):
+
+        # Set up a small random regression problem and its folds.
+        generator = default_rng(42)
+        self.descriptors = generator.normal(size=(50, 4))
+        self.values = self.descriptors @ generator.normal(size=4) + generator.normal(scale=0.1, size=50)
+        self.folds = list(KFold(n_splits=5, shuffle=True, random_state=42).split(self.descriptors))
+
+    def test_cross_validate_models(self):
+        """
+        Tests that the parallel cross-validation matches fitting every fold in turn.
+        """
+
+        models = [('Linear Regression', LinearRegression()), ('Decision Tree', DecisionTreeRegressor(random_state=42))]
+
+        with TemporaryDirectory() as directory:
+            predictions = cross_validate_models(models, self.descriptors, self.values, self.folds, directory, n_jobs=2)
+
+            # Only the cached predictions are left (the descriptors of the workers are removed).
+            self.assertFalse([file_name for file_name in os.listdir(directory) if file_name.startswith('descriptors-')])
+
+        for name, model in models:
+            for (train_index, test_index), fold_predictions in zip(self.folds, predictions[name]):
+                model.fit(self.descriptors[train_index], self.values[train_index])
+                self.assertTrue(allclose(fold_predictions, model.predict(self.descriptors[test_index])))
+
+        r2_scores, mae_scores = get_fold_scores(predictions, self.values, self.folds)
+        self.assertEqual(len(r2_scores['Linear Regression']), 5)
+        self.assertGreater(min(r2_scores['Linear Regression']), 0.9)
+        self.assertLess(max(mae_scores['Linear Regression']), 0.2)
+
+    def test_cached_predictions(self):
+        """
+        Tests that a rerun only fits the added model and the models with changed hyperparameters.
+        """
+
+        with TemporaryDirectory() as directory:
+            predictions = cross_validate_models([('Linear Regression', LinearRegression())], self.descriptors,
+                                                self.values, self.folds, directory)
+            cache_files = set(os.listdir(directory))
+            self.assertEqual(len(cache_files), 5)
+
+            # Mark the cached predictions, so a refit would be noticed.
+            modification_times = {file: os.path.getmtime(os.path.join(directory, file)) for file in cache_files}
+
+            rerun_predictions = cross_validate_models(
+                [('Linear Regression', LinearRegression()), ('Ridge', Ridge(alpha=1.0))], self.descriptors,
+                self.values, self.folds, directory)
+
+            self.assertEqual(len(set(os.listdir(directory)) - cache_files), 5)
+            self.assertEqual({file: os.path.getmtime(os.path.join(directory, file)) for file in cache_files},
+                             modification_times)
+            self.assertTrue(all(array_equal(fold, rerun_fold) for fold, rerun_fold in
+                                zip(predictions['Linear Regression'], rerun_predictions['Linear Regression'])))
+
+            # Changing a hyperparameter invalidates the cache of the model.
+            cross_validate_models([('Ridge', Ridge(alpha=2.0))], self.descriptors, self.values, self.folds, directory)
+            self.assertEqual(len(os.listdir(directory)), 15)
+
+    def test_negative_n_jobs(self):
+        """
+        Tests that a negative number of jobs counts back from the number of CPUs (as in joblib).
+        """
+
+        with TemporaryDirectory() as directory:
+            predictions = cross_validate_models([('Linear Regression', LinearRegression())], self.descriptors,
+                                                self.values, self.folds, directory, n_jobs=-2)
+
+        self.assertEqual(len(predictions['Linear Regression']), 5)
@@ -0,0 +1,61 @@
+from unittest import TestCase
+
+from numpy import array_equal
+from numpy.random import default_rng
+from sklearn.ensemble import RandomForestRegressor
+
+from models.flat_forest import flatten_random_forest
+
+
+class TestFlatForest(TestCase):
+
+    def setUp(self):
+
+        # Set up a small random regression problem and a forest of trees of different depths.
+        generator = default_rng(42)
+        self.descriptors = generator.normal(size=(80, 6))
+        self.values = self.descriptors @ generator.normal(size=6) + generator.normal(scale=0.1, size=80)
+        self.model = RandomForestRegressor(n_estimators=25, min_samples_leaf=2, random_state=42, n_jobs=1)
+        self.model.fit(self.descriptors, self.values)
+
+    def test_flatten_random_forest(self):
+        """
+        Tests the flat arrays of the trees.
+        """
+
+        flat_forest = flatten_random_forest(self.model)
+
+        self.assertEqual(flat_forest.get_number_of_trees(), 25)
+        self.assertEqual(flat_forest.get_number_of_nodes(), sum(tree.tree_.node_count for tree in
+                                                                self.model.estimators_))
+        self.assertEqual(flat_forest.max_depth, max(tree.tree_.max_depth for tree in self.model.estimators_))
+
+        with self.assertRaises(RuntimeError):
+            flatten_random_forest(RandomForestRegressor(n_estimators=2).fit(self.descriptors,
+                                                                             self.descriptors[:, :2]))
+
+    def test_predict(self):
+        """
+        Tests that the flat forest predicts exactly the values of the random forest (also in small batches).
+        """
+
+        flat_forest = flatten_random_forest(self.model)
+        descriptors = default_rng(7).normal(size=(50, 6))
+
+        self.assertTrue(array_equal(flat_forest.predict(self.descriptors), self.model.predict(self.descriptors)))
+        self.assertTrue(array_equal(flat_forest.predict(descriptors, batch_size=8), self.model.predict(descriptors)))
+        self.assertTrue(array_equal(flat_forest.apply(descriptors) - flat_forest.roots,
+                                    self.model.apply(descriptors)))
+
+        with self.assertRaises(RuntimeError):
+            flat_forest.predict(descriptors[:, :5])
+
+    def test_single_feature(self):
+        """
+        Tests a forest with a single feature (the leaves have no valid feature in the trees).
+        """
+
+        model = RandomForestRegressor(n_estimators=5, random_state=42).fit(self.descriptors[:, :1], self.values)
+
+        self.assertTrue(array_equal(flatten_random_forest(model).predict(self.descriptors[:, :1]),
+                                    model.predict(self.descriptors[:, :1])))
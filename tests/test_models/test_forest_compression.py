@@ -0,0 +1,140 @@
+import io
+import json
+import os
+from contextlib import redirect_stdout
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from numpy import array_equal, float32, where
+from numpy.random import default_rng
+
+from descriptors.descriptor_registry import Descriptor
+from models.compress import main
+from models.flat_forest import flatten_random_forest
+from models.forest_compression import (compress_random_forest, get_compression_curve, get_forest_report, prune_tree,
+                                       prune_random_forest)
+from models.model_artifact import load_model_artifact, save_model_artifact
+from models.random_forest import fit_random_forest
+
+
+class TestForestCompression(TestCase):
+
+    def setUp(self):
+
+        # Set up a small fitted forest and a validation set.
+        generator = default_rng(42)
+        self.descriptors = generator.normal(size=(120, 4))
+        self.values = self.descriptors @ generator.normal(size=4) + generator.normal(scale=0.1, size=120)
+        self.model = fit_random_forest(self.descriptors[:80], self.values[:80], 1, n_estimators=30)
+
+        self.validation_descriptors, self.validation_values = self.descriptors[80:], self.values[80:]
+
+    def test_prune_tree(self):
+        """
+        Tests that a pruned tree predicts the value of the node the samples reach at the depth of the cut.
+        """
+
+        estimator = self.model.estimators_[0]
+        pruned_estimator = prune_tree(estimator, 3)
+        descriptors = self.validation_descriptors.astype(float32)
+
+        # The deepest node of the decision path of every sample that is not below the cut.
+        depths = [0] * estimator.tree_.node_count
+
+        for node in range(estimator.tree_.node_count):
+            for child in [estimator.tree_.children_left[node], estimator.tree_.children_right[node]]:
+                if child != -1:
+                    depths[child] = depths[node] + 1
+
+        expected_predictions = []
+
+        for path in estimator.decision_path(descriptors).toarray():
+            nodes = [node for node in where(path)[0] if depths[node] <= 3]
+            expected_predictions.append(estimator.tree_.value[max(nodes, key=lambda node: depths[node]), 0, 0])
+
+        self.assertEqual(pruned_estimator.tree_.max_depth, 3)
+        self.assertTrue(array_equal(pruned_estimator.predict(descriptors), expected_predictions))
+        self.assertIs(prune_tree(estimator, None), estimator)
+        self.assertIs(prune_tree(estimator, 100), estimator)
+
+    def test_prune_random_forest(self):
+        """
+        Tests that the first trees of a forest predict like a forest of their own.
+        """
+
+        model = prune_random_forest(self.model, 10)
+        mae, nodes = get_compression_curve(self.model, self.validation_descriptors, self.validation_values, None)
+
+        self.assertEqual(len(model.estimators_), 10)
+        self.assertFalse(hasattr(model, 'oob_score_'))
+        self.assertEqual(len(self.model.estimators_), 30)
+        self.assertAlmostEqual(abs(model.predict(self.validation_descriptors) - self.validation_values).mean(), mae[9])
+        self.assertEqual(flatten_random_forest(model).get_number_of_nodes(), nodes[9])
+
+        with self.assertRaises(RuntimeError):
+            prune_random_forest(self.model, 31)
+
+    def test_compress_random_forest(self):
+        """
+        Tests that the compressed forest is smaller and stays within the tolerance.
+        """
+
+        full_report = get_forest_report(self.model, self.validation_descriptors, self.validation_values, 2)
+
+        for tolerance in [0.0, 0.1, 0.5]:
+            model = compress_random_forest(self.model, self.validation_descriptors, self.validation_values, tolerance)
+            report = get_forest_report(model, self.validation_descriptors, self.validation_values, 2)
+
+            self.assertLessEqual(report['MAE'], full_report['MAE'] + tolerance + 1e-9)
+            self.assertLessEqual(report['Nodes'], full_report['Nodes'])
+
+        self.assertLess(report['Nodes'], full_report['Nodes'])
+
+    def test_save_and_load_compressed_model(self):
+        """
+        Tests that a compressed forest is saved and loaded like the full forest.
+        """
+
+        model = compress_random_forest(self.model, self.validation_descriptors, self.validation_values, 0.5, [2, 4])
+
+        with TemporaryDirectory() as directory:
+            save_model_artifact(os.path.join(directory, 'compressed-model'), model,
+                                ['Dipole Interactions', '0', '1', '2'], Descriptor('acsf', r_cut=10.0), 6.0)
+            artifact = load_model_artifact(os.path.join(directory, 'compressed-model'))
+
+            self.assertTrue(array_equal(artifact.predict(self.validation_descriptors),
+                                        model.predict(self.validation_descriptors)))
+
+    def test_main(self):
+        """
+        Tests compressing a saved model on the validation split of its data set from the command line.
+        """
+
+        columns = ['Dipole Interactions', '0', '1', '2']
+
+        with TemporaryDirectory() as directory:
+            save_model_artifact(os.path.join(directory, 'cavitand-model'), self.model, columns,
+                                Descriptor('acsf', r_cut=10.0), 6.0)
+
+            with open(os.path.join(directory, 'anion-data.csv'), 'w') as csv_file:
+                csv_file.write(','.join(['Anion Index', 'Experimental dG'] + columns) + '\n')
+
+                for index, (descriptors, value) in enumerate(zip(self.descriptors, self.values)):
+                    csv_file.write(','.join([f'{index:03d}', str(value)] + [str(number) for number in descriptors]) +
+                                   '\n')
+
+            with open(os.path.join(directory, 'splits.json'), 'w') as splits_file:
+                json.dump({'cavitand': {'TRN': list(range(80)), 'VAL': list(range(80, 120))}}, splits_file)
+
+            output = io.StringIO()
+
+            with redirect_stdout(output):
+                main([os.path.join(directory, 'cavitand-model'), '--data', os.path.join(directory, 'anion-data.csv'),
+                      '--splits', os.path.join(directory, 'splits.json'), '--split-name', 'cavitand', '--tolerance',
+                      '0.5', '--output', os.path.join(directory, 'compressed-model')])
+
+            artifact = load_model_artifact(os.path.join(directory, 'compressed-model'))
+
+            self.assertEqual(artifact.columns, columns)
+            self.assertLess(len(artifact.model.estimators_), 30)
+            self.assertIn('Compressed', output.getvalue())
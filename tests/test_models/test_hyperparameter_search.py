@@ -0,0 +1,54 @@
+import json
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pandas import read_csv
+
+from models.hyperparameter_search import make_halving_search, run_halving_search
+from tests.model_fixtures import build_regression_data
+
+
+class TestHyperparameterSearch(TestCase):
+
+    def setUp(self):
+
+        # Set up a small random regression problem.
+        self.descriptors, self.values = build_regression_data(60, 5)
+
+    def test_make_halving_search(self):
+        """
+        Tests the settings of the successive halving search.
+        """
+
+        search = make_halving_search({'max_depth': [2, None]}, min_resources=10, max_resources=90, n_jobs=2)
+
+        self.assertEqual(search.resource, 'n_estimators')
+        self.assertEqual(search.estimator.n_jobs, 1)
+
+        with self.assertRaises(RuntimeError):
+            make_halving_search({'max_depth': [2, None]}, resource='max_depth')
+
+    def test_run_halving_search(self):
+        """
+        Tests that the search evaluates fewer candidates with more trees and writes its results.
+        """
+
+        with TemporaryDirectory() as directory:
+            search = run_halving_search(self.descriptors, self.values,
+                                        {'max_depth': [1, 2, None], 'min_samples_leaf': [1, 2, 20]}, directory, 'test',
+                                        min_resources=5, max_resources=45, factor=3, n_jobs=2)
+
+            # The candidates are cut by the factor while the number of trees grows by it.
+            self.assertEqual(search.n_resources_, [5, 15, 45])
+            self.assertEqual(search.n_candidates_, [9, 3, 1])
+
+            with open(os.path.join(directory, 'test-best-parameters.json'), 'r') as best_parameters_file:
+                best_parameters = json.load(best_parameters_file)
+
+            self.assertEqual(best_parameters['Parameters'], search.best_params_)
+            self.assertAlmostEqual(best_parameters['Mean Absolute Error'], -search.best_score_)
+
+            results = read_csv(os.path.join(directory, 'test-search-results.csv'))
+            self.assertEqual(len(results), 13)
+            self.assertEqual(sorted(set(results['n_resources'])), [5, 15, 45])
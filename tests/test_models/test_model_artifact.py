@@ -0,0 +1,82 @@
+import json
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from numpy import array_equal
+from numpy.random import default_rng
+
+from descriptors.descriptor_registry import Descriptor
+from models.model_artifact import SCHEMA_FILE, load_model_artifact, save_model_artifact
+from models.random_forest import fit_random_forest
+
+
+class TestModelArtifact(TestCase):
+
+    def setUp(self):
+
+        # Set up a small fitted forest in a temporary directory.
+        generator = default_rng(42)
+        self.descriptors = generator.normal(size=(40, 3))
+        self.model = fit_random_forest(self.descriptors, self.descriptors[:, 0], 1, n_estimators=10)
+        self.columns = ['Dipole Interactions', 'Covalent Radius', '0']
+
+        self.directory = TemporaryDirectory()
+        self.artifact_path = os.path.join(self.directory.name, 'cavitand-model')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_save_and_load_model_artifact(self):
+        """
+        Tests that a loaded model predicts the same values and keeps the schema of its input.
+        """
+
+        save_model_artifact(self.artifact_path, self.model, self.columns, Descriptor('acsf', r_cut=10.0), 6.0)
+        artifact = load_model_artifact(self.artifact_path)
+
+        self.assertTrue(array_equal(artifact.predict(self.descriptors), self.model.predict(self.descriptors)))
+        self.assertEqual(artifact.columns, self.columns)
+        self.assertEqual(artifact.descriptor_name, 'acsf')
+        self.assertEqual(artifact.descriptor_parameters['r_cut'], 10.0)
+        self.assertEqual(artifact.interaction_radius, 6.0)
+        self.assertEqual(artifact.get_descriptor().parameters, Descriptor('acsf', r_cut=10.0).parameters)
+
+        with self.assertRaises(RuntimeError):
+            artifact.predict(self.descriptors[:, :2])
+
+    def test_validate(self):
+        """
+        Tests that features calculated with other settings are rejected.
+        """
+
+        artifact = save_model_artifact(self.artifact_path, self.model, self.columns, Descriptor('acsf'), 6.0)
+        artifact.validate(self.columns, Descriptor('acsf'), 6.0)
+
+        with self.assertRaises(RuntimeError):
+            artifact.validate(columns=self.columns[:2])
+
+        with self.assertRaises(RuntimeError):
+            artifact.validate(descriptor=Descriptor('acsf', r_cut=10.0))
+
+        with self.assertRaises(RuntimeError):
+            artifact.validate(descriptor=Descriptor('energy'))
+
+        with self.assertRaises(RuntimeError):
+            artifact.validate(interaction_radius=8.0)
+
+    def test_schema_version(self):
+        """
+        Tests that an artifact with another schema version is rejected.
+        """
+
+        save_model_artifact(self.artifact_path, self.model, self.columns, Descriptor('energy'), 6.0)
+
+        with open(os.path.join(self.artifact_path, SCHEMA_FILE), 'r') as schema_file:
+            schema = json.load(schema_file)
+
+        with open(os.path.join(self.artifact_path, SCHEMA_FILE), 'w') as schema_file:
+            json.dump({**schema, 'Schema Version': 0}, schema_file)
+
+        with self.assertRaises(RuntimeError):
+            load_model_artifact(self.artifact_path)
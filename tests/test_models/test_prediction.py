@@ -0,0 +1,113 @@
+import io
+import os
+import time
+from contextlib import redirect_stderr
+from shutil import copyfile
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from numpy import allclose
+from pandas import read_csv
+
+from dataset.complex_archive import pack_complexes
+from dataset.dataset_builder import build_data_set
+from descriptors.descriptor_registry import Descriptor
+from models.model_artifact import save_model_artifact
+from models.predict import get_complex_source, main
+from models.prediction import iterate_predictions, write_predictions
+from models.random_forest import fit_random_forest
+from tests.model_fixtures import build_complex_directory
+
+
+class TestPrediction(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        # Set up a directory with the test complexes and a model trained on their features.
+        cls.directory = TemporaryDirectory()
+        build_complex_directory(cls.directory.name)
+
+        descriptor = Descriptor('acsf', g2_params=[[1, 1], [1, 2]], g4_params=[[1, 1, 1]])
+        values, columns, cls.indices = build_data_set(cls.directory.name, 'anions', descriptor, number_of_complexes=10)
+
+        model = fit_random_forest(values[:, 1:], values[:, 0], 1, n_estimators=10, oob_score=False)
+        cls.expected_predictions = model.predict(values[:, 1:])
+
+        cls.artifact_path = os.path.join(cls.directory.name, 'cavitand-model')
+        save_model_artifact(cls.artifact_path, model, columns[1:], descriptor, 6.0)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_iterate_predictions(self):
+        """
+        Tests that the streamed predictions match the predictions of the model, in serial and in parallel.
+        """
+
+        for n_jobs in [1, 2]:
+            predictions = list(iterate_predictions(self.directory.name, 'anions', self.artifact_path,
+                                                   number_of_complexes=10, batch_size=2, n_jobs=n_jobs))
+
+            self.assertEqual([index for index, _ in predictions], self.indices.tolist())
+            self.assertTrue(allclose([prediction for _, prediction in predictions], self.expected_predictions))
+
+    def test_write_predictions(self):
+        """
+        Tests the CSV rows of the predictions.
+        """
+
+        output_file = io.StringIO()
+
+        self.assertEqual(write_predictions(output_file, [(0, -10.5), (12, -20.25)]), 2)
+        self.assertEqual(output_file.getvalue(), 'Anion Index,Predicted dG\n000,-10.5\n012,-20.25\n')
+
+    def test_main(self):
+        """
+        Tests the command line entry point on a packed archive.
+        """
+
+        with TemporaryDirectory() as directory:
+            archive_path = pack_complexes(self.directory.name, 'anions',
+                                          os.path.join(directory, 'anions-archive'), number_of_complexes=10)
+            self.assertEqual(get_complex_source(archive_path, None), (directory, 'anions', True))
+            self.assertEqual(get_complex_source(archive_path, 'anions'), (directory, 'anions', True))
+
+            with self.assertRaises(RuntimeError):
+                get_complex_source(archive_path, 'cations')
+
+            output_file_path = os.path.join(directory, 'predictions.csv')
+            main([archive_path, '--model', self.artifact_path, '--output', output_file_path])
+
+            predictions = read_csv(output_file_path)
+            self.assertEqual(predictions['Anion Index'].tolist(), self.indices.tolist())
+            self.assertTrue(allclose(predictions['Predicted dG'], self.expected_predictions))
+
+        self.assertEqual(get_complex_source(self.directory.name, 'anions'), (self.directory.name, 'anions', None))
+
+        with self.assertRaises(RuntimeError):
+            get_complex_source(self.directory.name, None)
+
+    def test_main_stale_archive(self):
+        """
+        Tests that a given archive is read even if complex files next to it are newer.
+        """
+
+        with TemporaryDirectory() as directory:
+            archive_path = pack_complexes(self.directory.name, 'anions',
+                                          os.path.join(directory, 'anions-archive'), number_of_complexes=10)
+
+            # A complex file written after packing.
+            for suffix in ['-information.json', '-geometry.xyz', '-charges']:
+                copyfile(os.path.join(self.directory.name, f'anions-000{suffix}'),
+                         os.path.join(directory, f'anions-000{suffix}'))
+                os.utime(os.path.join(directory, f'anions-000{suffix}'), (time.time() + 60,) * 2)
+
+            output_file_path = os.path.join(directory, 'predictions.csv')
+
+            with redirect_stderr(io.StringIO()) as error_output:
+                main([archive_path, '--model', self.artifact_path, '--output', output_file_path])
+
+            self.assertEqual(read_csv(output_file_path)['Anion Index'].tolist(), self.indices.tolist())
+            self.assertIn('newer', error_output.getvalue())
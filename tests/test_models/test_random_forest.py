@@ -0,0 +1,45 @@
+from unittest import TestCase
+
+from numpy import array_equal
+from numpy.random import default_rng
+
+from models.random_forest import fit_random_forest, get_parallel_backend, predict_random_forest
+
+
+class TestRandomForest(TestCase):
+
+    def setUp(self):
+
+        # Set up a small random regression problem.
+        generator = default_rng(42)
+        self.descriptors = generator.normal(size=(60, 5))
+        self.values = self.descriptors @ generator.normal(size=5) + generator.normal(scale=0.1, size=60)
+
+    def test_fit_random_forest(self):
+        """
+        Tests that the fitted forest does not depend on the number of jobs or the backend.
+        """
+
+        model = fit_random_forest(self.descriptors, self.values, 1, n_estimators=20)
+        threaded_model = fit_random_forest(self.descriptors, self.values, 2, 'threads', n_estimators=20)
+        process_model = fit_random_forest(self.descriptors, self.values, 2, 'processes', n_estimators=20)
+
+        self.assertEqual(model.oob_score_, threaded_model.oob_score_)
+        self.assertEqual(model.oob_score_, process_model.oob_score_)
+        self.assertTrue(array_equal(predict_random_forest(model, self.descriptors, 1),
+                                    predict_random_forest(process_model, self.descriptors, 1)))
+
+        with self.assertRaises(RuntimeError):
+            get_parallel_backend('gpu')
+
+    def test_predict_random_forest(self):
+        """
+        Tests that the parallel predictions equal the single-job predictions of the forest.
+        """
+
+        model = fit_random_forest(self.descriptors, self.values, 1, n_estimators=20)
+        predictions = model.predict(self.descriptors)
+
+        self.assertTrue(array_equal(predict_random_forest(model, self.descriptors, 1), predictions))
+        self.assertTrue(array_equal(predict_random_forest(model, self.descriptors, 3, 'threads'), predictions))
+        self.assertTrue(array_equal(predict_random_forest(model, self.descriptors, 2, 'processes'), predictions))
@@ -0,0 +1,159 @@
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from numpy import allclose
+
+from dataset.dataset_builder import build_data_set
+from descriptors.descriptor_registry import Descriptor
+from models.model_artifact import save_model_artifact
+from models.random_forest import fit_random_forest
+from models.server import MicroBatcher, PredictionServer, read_request_complex
+from molecular_structure.molecular_structure import read_partial_charges, read_structure_arrays
+from tests.model_fixtures import build_complex_directory
+
+
+class TestServer(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        # Set up the test complexes, a model trained on their features and a server on a free localhost port.
+        cls.directory = TemporaryDirectory()
+        information = build_complex_directory(cls.directory.name)
+
+        descriptor = Descriptor('acsf', g2_params=[[1, 1], [1, 2]], g4_params=[[1, 1, 1]])
+        values, columns, _ = build_data_set(cls.directory.name, 'anions', descriptor, number_of_complexes=10)
+
+        model = fit_random_forest(values[:, 1:], values[:, 0], 1, n_estimators=10, oob_score=False)
+        cls.expected_predictions = model.predict(values[:, 1:])
+
+        cls.artifact_path = os.path.join(cls.directory.name, 'cavitand-model')
+        save_model_artifact(cls.artifact_path, model, columns[1:], descriptor, 6.0)
+
+        cls.requests = []
+
+        for index, complex_information in enumerate(information):
+            complex_path = os.path.join(cls.directory.name, f'anions-{index:03}')
+            elements, coordinates = read_structure_arrays(f'{complex_path}-geometry.xyz')
+
+            cls.requests.append({'elements': elements.tolist(), 'coordinates': coordinates.tolist(),
+                                 'charges': read_partial_charges(f'{complex_path}-charges').tolist(),
+                                 'information': complex_information})
+
+        cls.server = PredictionServer(cls.artifact_path, port=0, max_batch_size=8, max_wait=0.05)
+        cls.url = f'http://127.0.0.1:{cls.server.server_address[1]}'
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.directory.cleanup()
+
+    def post(self, body: dict) -> dict:
+        """
+        :param body: The body of the request.
+        :return: The body of the response.
+        """
+
+        request = Request(f'{self.url}/predict', json.dumps(body).encode(), {'Content-Type': 'application/json'})
+
+        with urlopen(request, timeout=60) as response:
+            return json.loads(response.read())
+
+    def test_predict(self):
+        """
+        Tests that concurrent requests are predicted in batches like the data set.
+        """
+
+        with ThreadPoolExecutor(6) as executor:
+            responses = list(executor.map(self.post, self.requests * 2))
+
+        self.assertTrue(allclose([response['dG'] for response in responses], list(self.expected_predictions) * 2))
+
+        with urlopen(f'{self.url}/counters', timeout=60) as response:
+            counters = json.loads(response.read())
+
+        self.assertGreaterEqual(counters['Predictions'], 6)
+        self.assertLessEqual(counters['Batches'], counters['Predictions'])
+        self.assertGreaterEqual(counters['Mean Batch Size'], 1.0)
+        self.assertGreater(counters['Mean Latency'], 0.0)
+
+    def test_invalid_request(self):
+        """
+        Tests that an invalid request is answered with an error.
+        """
+
+        with self.assertRaises(HTTPError) as context:
+            self.post({'elements': ['H']})
+
+        self.assertEqual(context.exception.code, 400)
+
+        with self.assertRaises(HTTPError) as context:
+            urlopen(f'{self.url}/unknown', timeout=60)
+
+        self.assertEqual(context.exception.code, 404)
+
+    def test_index_error(self):
+        """
+        Tests that a request with a guest outside of the complex is answered with an error and counted.
+        """
+
+        with urlopen(f'{self.url}/counters', timeout=60) as response:
+            errors = json.loads(response.read())['Errors']
+
+        request = dict(self.requests[1], information=dict(self.requests[1]['information'],
+                                                          **{'Guest - Central Atom': 10 ** 6}))
+
+        with self.assertRaises(HTTPError) as context:
+            self.post(request)
+
+        self.assertEqual(context.exception.code, 400)
+
+        with urlopen(f'{self.url}/counters', timeout=60) as response:
+            self.assertEqual(json.loads(response.read())['Errors'], errors + 1)
+
+    def test_failing_complex_in_batch(self):
+        """
+        Tests that a complex that fails in the batch does not fail the other complexes of the batch.
+        """
+
+        from dataset.helper_functions import get_energy_features
+
+        host_guest_complexes = [read_request_complex(request) for request in self.requests]
+        failing_complex = read_request_complex(self.requests[0])
+        failing_complex.guest.central_atom = 10 ** 6
+
+        # The energy features of the failing complex are calculated, so it only fails in the descriptor of the batch.
+        with patch('models.server.get_energy_features',
+                   lambda host_guest_complex, radius: [0.0] * 5 if host_guest_complex is failing_complex else
+                   get_energy_features(host_guest_complex, radius)):
+            batcher = MicroBatcher(self.artifact_path, max_batch_size=8, max_wait=1.0)
+            futures = [batcher.submit(host_guest_complex) for host_guest_complex in
+                       host_guest_complexes[:1] + [failing_complex] + host_guest_complexes[1:]]
+            batcher.close()
+
+        self.assertIsNotNone(futures[1].exception())
+        self.assertTrue(allclose([future.result() for future in futures[:1] + futures[2:]],
+                                 self.expected_predictions))
+        self.assertEqual(batcher.get_counters()['Predictions'], len(host_guest_complexes))
+
+    def test_port_in_use(self):
+        """
+        Tests that the batcher is stopped when the port of the server is in use.
+        """
+
+        threads = threading.active_count()
+
+        with self.assertRaises(OSError):
+            PredictionServer(self.artifact_path, port=self.server.server_address[1])
+
+        self.assertEqual(threading.active_count(), threads)
@@ -2,6 +2,8 @@ from unittest import TestCase
 
 from numpy import array, array_equal
 
+from constants.covalent_radii import CovalentRadii
+from constants.element_tables import COVALENT_RADII, get_atomic_number, get_atomic_numbers
 from molecular_structure.atom import Atom
 
 
@@ -21,3 +23,19 @@ class TestAtom(TestCase):
         self.assertTrue(array_equal(atom.coord, array([0.0, 0.0, 0.0])))
         self.assertEqual(atom.charge, -0.7)
         self.assertEqual(atom.index, 3)
+
+    def test_element_tables(self):
+        """
+        Tests that the atomic numbers and the covalent radii match the element symbols.
+        """
+
+        for element, atomic_number in [('H', 1), ('Cl', 17), ('CL', 17), ('i', 53), ('Og', 118)]:
+            self.assertEqual(get_atomic_number(element), atomic_number)
+            self.assertEqual(Atom(element, [0.0, 0.0, 0.0], 0.0, 0).atomic_number, atomic_number)
+
+        self.assertTrue(array_equal(get_atomic_numbers(['Re', 'H', 'Re', 'c']), [75, 1, 75, 6]))
+        self.assertEqual(Atom('Re', [0.0, 0.0, 0.0], 0.0, 0).covalent_radius, CovalentRadii.Re.value[0])
+        self.assertEqual(tuple(COVALENT_RADII[6]), CovalentRadii.C.value)
+
+        with self.assertRaises(RuntimeError):
+            get_atomic_number('Xx')
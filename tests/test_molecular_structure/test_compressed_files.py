@@ -0,0 +1,92 @@
+import bz2
+import gzip
+import lzma
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from numpy import array_equal
+
+from molecular_structure.compressed_files import find_file, is_compressed_file, open_file
+from molecular_structure.molecular_structure import read_partial_charges, read_structure_arrays
+from molecular_structure.trajectory import Trajectory
+from tests.helper_functions import build_path
+
+
+class TestCompressedFiles(TestCase):
+
+    def setUp(self):
+
+        # Set up the compressed copies of the geometry and the charges of the spherical test complex.
+        self.directory = TemporaryDirectory()
+
+        self.coordinates_file = build_path('anion_spherical_geometry.xyz')
+        self.charge_file = build_path('anion_spherical_charges')
+
+        self.compressed_files = {}
+
+        for extension, opener in [('.gz', gzip.open), ('.xz', lzma.open), ('.bz2', bz2.open)]:
+            for name, file_path in [('geometry.xyz', self.coordinates_file), ('charges', self.charge_file)]:
+                compressed_file = os.path.join(self.directory.name, f'{name}{extension}')
+
+                with open(file_path, 'rb') as file, opener(compressed_file, 'wb') as compressed:
+                    compressed.write(file.read())
+
+                self.compressed_files[(name, extension)] = compressed_file
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_open_file(self):
+        """
+        Tests that the compression format is selected by the file extension.
+        """
+
+        self.assertTrue(is_compressed_file('geometry.xyz.GZ'))
+        self.assertFalse(is_compressed_file('geometry.xyz'))
+
+        with open(self.charge_file, 'r') as file, open_file(self.compressed_files[('charges', '.xz')]) as compressed:
+            self.assertEqual(compressed.read(), file.read())
+
+        self.assertEqual(find_file(os.path.join(self.directory.name, 'charges')),
+                         self.compressed_files[('charges', '.gz')])
+        self.assertEqual(find_file(self.charge_file), self.charge_file)
+
+    def test_readers(self):
+        """
+        Tests that the structure and charge readers read the compressed files.
+        """
+
+        elements, coordinates = read_structure_arrays(self.coordinates_file)
+        charges = read_partial_charges(self.charge_file)
+
+        for extension in ['.gz', '.xz', '.bz2']:
+            compressed_elements, compressed_coordinates = read_structure_arrays(
+                self.compressed_files[('geometry.xyz', extension)])
+
+            self.assertTrue(array_equal(compressed_elements, elements))
+            self.assertTrue(array_equal(compressed_coordinates, coordinates))
+            self.assertTrue(array_equal(read_partial_charges(self.compressed_files[('charges', extension)]), charges))
+
+    def test_trajectory(self):
+        """
+        Tests reading the frames of a compressed trajectory in any order.
+        """
+
+        trajectory_file = os.path.join(self.directory.name, 'trajectory.xyz')
+        compressed_trajectory_file = f'{trajectory_file}.gz'
+
+        with open(self.coordinates_file, 'r') as file:
+            text = file.read()
+
+        with open(trajectory_file, 'w') as file, gzip.open(compressed_trajectory_file, 'wt') as compressed:
+            for frame in range(3):
+                frame_text = text.replace('I ', 'Br', 1) if frame == 1 else text
+                file.write(frame_text)
+                compressed.write(frame_text)
+
+        with Trajectory(trajectory_file) as trajectory, Trajectory(compressed_trajectory_file) as compressed:
+            self.assertTrue(array_equal(compressed.offsets, trajectory.offsets))
+
+            for frame in [2, 1, 0, 1]:
+                self.assertEqual(compressed.get_frame_text(frame), trajectory.get_frame_text(frame))
@@ -0,0 +1,131 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from ase.io import read, write
+from numpy import allclose, array_equal
+
+from descriptors.atomic_structures import make_ase_atoms
+from molecular_structure.extended_xyz import (make_list_of_atoms_from_extended_xyz, parse_comment_line,
+                                              read_extended_xyz, write_extended_xyz)
+from molecular_structure.molecular_structure import make_list_of_atoms, read_partial_charges, read_structure_arrays
+from tests.helper_functions import build_path
+
+
+class TestExtendedXYZ(TestCase):
+
+    def setUp(self):
+
+        # Set up the atoms, the charges and the information of the tetrahedral test complex.
+        self.directory = TemporaryDirectory()
+
+        self.elements, self.coordinates = read_structure_arrays(build_path('anion_tetrahedral_geometry.xyz'))
+        self.charges = read_partial_charges(build_path('anion_tetrahedral_charges'))
+
+        self.information = {'Guest - Central Atom': 260, 'Guest - Vertex Atoms': [258, 259, 261, 262],
+                            'HOMO-LUMO Gap': 0.15, 'Reference': 'J. Am. Chem. Soc.', 'Solvent': 'Methanol',
+                            'dG': -20.5}
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_parse_comment_line(self):
+        """
+        Tests parsing the key=value pairs of the comment line.
+        """
+
+        metadata = parse_comment_line('Properties=species:S:1:pos:R:3 "Guest - Vertex Atoms"=[1,2] dG=-20.5 '
+                                      'Solvent=Methanol pbc="F F F" Reference="J. Am. Chem. Soc."')
+
+        self.assertEqual(metadata, {'Properties': 'species:S:1:pos:R:3', 'Guest - Vertex Atoms': [1, 2], 'dG': -20.5,
+                                    'Solvent': 'Methanol', 'pbc': 'F F F', 'Reference': 'J. Am. Chem. Soc.'})
+
+        with self.assertRaises(RuntimeError):
+            parse_comment_line('frame 0')
+
+    def test_read_extended_xyz(self):
+        """
+        Tests that the atoms, the charges and the information are read back from one file.
+        """
+
+        file_path = os.path.join(self.directory.name, 'complex.extxyz')
+        write_extended_xyz(file_path, self.elements, self.coordinates, self.charges, self.information)
+
+        elements, coordinates, charges, metadata = read_extended_xyz(file_path)
+
+        self.assertTrue(array_equal(elements, self.elements))
+        self.assertTrue(array_equal(coordinates, self.coordinates))
+        self.assertTrue(array_equal(charges, self.charges))
+        self.assertEqual(metadata, self.information)
+
+        atoms, metadata = make_list_of_atoms_from_extended_xyz(file_path)
+        expected_atoms = make_list_of_atoms(build_path('anion_tetrahedral_geometry.xyz'),
+                                            build_path('anion_tetrahedral_charges'))
+
+        self.assertEqual([repr(atom) for atom in atoms], [repr(atom) for atom in expected_atoms])
+
+        with self.assertRaises(RuntimeError):
+            write_extended_xyz(file_path, self.elements, self.coordinates, self.charges[:-1])
+
+    def test_string_round_trip(self):
+        """
+        Tests that string values are read back as strings (also when they look like numbers or booleans), and that
+        ASE reads the written file.
+        """
+
+        file_path = os.path.join(self.directory.name, 'complex.extxyz')
+        information = dict(self.information, **{'Reference': '12', 'Solvent': 'T', 'Comment': 'a "quoted" name',
+                                                 'Empty': '', 'Flag': True})
+        write_extended_xyz(file_path, self.elements, self.coordinates, self.charges, information)
+
+        _, _, _, metadata = read_extended_xyz(file_path)
+
+        self.assertEqual(metadata, information)
+        self.assertEqual(parse_comment_line("Reference='J. Am. Chem. Soc.'"), {'Reference': 'J. Am. Chem. Soc.'})
+
+        with self.assertRaises(RuntimeError):
+            write_extended_xyz(file_path, self.elements, self.coordinates, self.charges, {'Reference': '["a"]'})
+
+        structure = read(file_path, format='extxyz')
+
+        self.assertTrue(array_equal(structure.get_chemical_symbols(), self.elements))
+        self.assertEqual(structure.info['Comment'], 'a "quoted" name')
+
+    def test_non_scalar_round_trip(self):
+        """
+        Tests that lists of strings and dictionaries are read back from the file they are written to.
+        """
+
+        file_path = os.path.join(self.directory.name, 'complex.extxyz')
+        information = dict(self.information, **{'References': ['J. Am. Chem. Soc.', 'a "quoted" name'],
+                                                 'Conditions': {'Solvent': 'Methanol', 'Temperature': 298.15},
+                                                 'Grid': [[1, 2], [3, 4]]})
+        write_extended_xyz(file_path, self.elements, self.coordinates, self.charges, information)
+
+        _, _, _, metadata = read_extended_xyz(file_path)
+
+        self.assertEqual(metadata, information)
+
+    def test_read_ase_extended_xyz(self):
+        """
+        Tests reading an extended XYZ file written by ASE (with the charges as initial charges).
+        """
+
+        file_path = os.path.join(self.directory.name, 'complex.xyz')
+
+        structure = make_ase_atoms(self.elements, self.coordinates)
+        structure.set_initial_charges(self.charges)
+        write(file_path, structure, format='extxyz')
+
+        elements, coordinates, charges, _ = read_extended_xyz(file_path)
+
+        # ASE writes the positions with eight decimals.
+        self.assertTrue(array_equal(elements, self.elements))
+        self.assertTrue(allclose(coordinates, self.coordinates, rtol=0.0, atol=1e-8))
+        self.assertTrue(array_equal(charges, self.charges))
+
+        with open(file_path, 'w') as file:
+            file.write('1\nProperties=species:S:1:pos:R:3\nH 0.0 0.0 0.0\n')
+
+        with self.assertRaises(RuntimeError):
+            read_extended_xyz(file_path)
@@ -1,8 +1,11 @@
+import os
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
 from numpy import array, array_equal
 
-from molecular_structure.molecular_structure import (get_partial_charges, get_structure_coordinates, make_list_of_atoms)
+from molecular_structure.molecular_structure import (get_partial_charges, get_structure_coordinates, make_list_of_atoms,
+                                                     read_partial_charges, read_structure_arrays)
 from tests.helper_functions import build_path
 
 
@@ -86,3 +89,36 @@ class TestMolecularStructure(TestCase):
 
         with self.assertRaises(FileNotFoundError):
             get_structure_coordinates('faulty_file_path.xyz')
+
+    def test_read_structure_arrays(self):
+        """
+        Tests that the bulk parser matches the coordinates and validates the number of atoms in the header.
+        """
+
+        elements, coordinates = read_structure_arrays(self.coordinates_file)
+
+        self.assertEqual(coordinates.shape, (195, 3))
+        self.assertEqual(elements[:2].tolist(), ['I', 'S'])
+        self.assertTrue(array_equal(coordinates[1], array([+4.52978864312664, +0.52424446466811, -2.53435972314979])))
+
+        with TemporaryDirectory() as directory:
+            faulty_file = os.path.join(directory, 'faulty.xyz')
+
+            with open(self.coordinates_file, 'r') as coordinates_file, open(faulty_file, 'w') as file:
+                file.write(coordinates_file.read().replace('195', '196', 1))
+
+            with self.assertRaises(RuntimeError):
+                read_structure_arrays(faulty_file)
+
+    def test_read_partial_charges(self):
+        """
+        Tests that the bulk parser matches the charges and validates the number of charges.
+        """
+
+        charges = read_partial_charges(self.charge_file, 195)
+
+        self.assertEqual(charges[0], -0.88709616)
+        self.assertEqual(charges.tolist(), get_partial_charges(self.charge_file))
+
+        with self.assertRaises(RuntimeError):
+            read_partial_charges(self.charge_file, 194)
@@ -0,0 +1,92 @@
+from itertools import combinations
+from unittest import TestCase
+
+from numpy import array, array_equal, linalg
+
+from complexes.guest import Guest
+from complexes.helper_functions import get_dipole_moments, get_host_atoms
+from molecular_structure.molecular_structure import make_list_of_atoms
+from molecular_structure.neighbor_list import BondTopology, VerletNeighborList, get_candidate_pairs
+from tests.helper_functions import build_path
+
+
+class TestNeighborList(TestCase):
+
+    def setUp(self):
+
+        # Set up the atoms and the guest of the tetrahedral test complex.
+        self.atoms = make_list_of_atoms(build_path('anion_tetrahedral_geometry.xyz'),
+                                        build_path('anion_tetrahedral_charges'))
+        self.coordinates = array([atom.coord for atom in self.atoms])
+        self.guest = Guest(260, [258, 259, 261, 262])
+
+    def get_pairs(self, coordinates, cut_off):
+        return [(i, j) for i, j in combinations(range(len(coordinates)), 2)
+                if linalg.norm(coordinates[j] - coordinates[i]) <= cut_off]
+
+    def test_get_candidate_pairs(self):
+        """
+        Tests that the blocked pair search finds the same pairs as checking every pair.
+        """
+
+        first, second = get_candidate_pairs(self.coordinates, 3.0, block_size=50)
+
+        self.assertEqual(list(zip(first.tolist(), second.tolist())), self.get_pairs(self.coordinates, 3.0))
+
+    def test_verlet_neighbor_list(self):
+        """
+        Tests that the list is only rebuilt when an atom moved more than half of the skin.
+        """
+
+        neighbor_list = VerletNeighborList(3.0, skin=1.0)
+        coordinates = self.coordinates.copy()
+
+        for shift, number_of_builds in [(0.0, 1), (0.2, 1), (0.45, 1), (0.6, 2), (0.9, 2)]:
+            coordinates[:10, 0] = self.coordinates[:10, 0] + shift
+            first, second, distances = neighbor_list.get_pairs(coordinates)
+
+            self.assertEqual(neighbor_list.number_of_builds, number_of_builds)
+            self.assertEqual(list(zip(first.tolist(), second.tolist())), self.get_pairs(coordinates, 3.0))
+
+    def test_get_host_atoms(self):
+        """
+        Tests that the host atoms found with the neighbor list match the ones found by checking every atom.
+        """
+
+        neighbor_list = VerletNeighborList(6.0, skin=1.0, centers=[260])
+
+        for shift in [0.0, 0.3, 0.8]:
+            for atom, coordinates in zip(self.atoms, self.coordinates):
+                atom.coord = coordinates + array([shift if atom.index in self.guest.atoms else 0.0, 0.0, 0.0])
+
+            self.assertEqual([atom.index for atom in get_host_atoms(self.atoms, self.guest, 6.0, neighbor_list)],
+                             [atom.index for atom in get_host_atoms(self.atoms, self.guest, 6.0)])
+
+        self.assertEqual(neighbor_list.number_of_builds, 2)
+
+        with self.assertRaises(RuntimeError):
+            get_host_atoms(self.atoms, self.guest, 5.0, neighbor_list)
+
+    def test_bond_topology(self):
+        """
+        Tests that the fixed bonds form the same dipole moments as the perceived bonds.
+        """
+
+        bond_topology = BondTopology(self.atoms)
+
+        for atoms in [get_host_atoms(self.atoms, self.guest, 6.0), [self.atoms[index] for index in self.guest.atoms]]:
+            dipole_moments = get_dipole_moments(atoms)
+            fixed_dipole_moments = get_dipole_moments(atoms, bond_topology)
+
+            self.assertGreater(len(dipole_moments), 0)
+            self.assertEqual([(dipole_moment.atom_a.index, dipole_moment.atom_b.index)
+                              for dipole_moment in fixed_dipole_moments],
+                             [(dipole_moment.atom_a.index, dipole_moment.atom_b.index)
+                              for dipole_moment in dipole_moments])
+
+        # The bonds are held fixed when the atoms move.
+        self.atoms[259].coord = self.atoms[259].coord + 10.0
+
+        self.assertEqual(len(get_dipole_moments([self.atoms[index] for index in self.guest.atoms], bond_topology)), 4)
+        self.assertTrue(array_equal(BondTopology(self.atoms).get_bonds(self.guest.atoms),
+                                    [[0, 1], [0, 3], [0, 4]]))
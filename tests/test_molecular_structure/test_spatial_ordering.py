@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+from numpy import arange, array, array_equal, random
+
+from molecular_structure.molecular_structure import make_list_of_atoms
+from molecular_structure.neighbor_list import BondTopology, get_candidate_pairs
+from molecular_structure.spatial_ordering import SpatialOrdering, get_morton_codes
+from tests.helper_functions import build_path
+
+
+class TestSpatialOrdering(TestCase):
+
+    def setUp(self):
+
+        # Set up the atoms of the octahedral test complex in a shuffled order.
+        self.atoms = make_list_of_atoms(build_path('anion_octahedral_geometry.xyz'),
+                                        build_path('anion_octahedral_charges'))
+        self.coordinates = array([atom.coord for atom in self.atoms])
+        self.shuffled_coordinates = self.coordinates[random.default_rng(42).permutation(len(self.coordinates))]
+
+    def test_get_morton_codes(self):
+        """
+        Tests that the Morton codes interleave the bits of the grid cells (x in the lowest bit).
+        """
+
+        corners = array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0], [1.0, 1.0, 1.0]])
+
+        self.assertEqual(get_morton_codes(corners, bits=1).tolist(), [0, 1, 2, 4, 7])
+        self.assertEqual(len(get_morton_codes(array([]).reshape(0, 3))), 0)
+
+    def test_spatial_ordering(self):
+        """
+        Tests that the stored permutation restores the original order.
+        """
+
+        ordering = SpatialOrdering(self.shuffled_coordinates)
+        reordered = ordering.reorder(self.shuffled_coordinates)
+
+        self.assertTrue(array_equal(ordering.restore(reordered), self.shuffled_coordinates))
+        self.assertTrue(array_equal(ordering.get_original_indices(arange(len(reordered))), ordering.permutation))
+        self.assertTrue(array_equal(sorted(ordering.permutation), arange(len(reordered))))
+
+    def test_reordered_pairs(self):
+        """
+        Tests that the pairs and bonds found in the spatial order keep the original atom indices.
+        """
+
+        for coordinates in [self.coordinates, self.shuffled_coordinates]:
+            first, second = get_candidate_pairs(coordinates, 4.0, block_size=16)
+            reordered_first, reordered_second = get_candidate_pairs(coordinates, 4.0, block_size=16, reorder=True)
+
+            self.assertTrue(array_equal(reordered_first, first))
+            self.assertTrue(array_equal(reordered_second, second))
+
+        self.assertTrue(array_equal(BondTopology(self.atoms, reorder=True).bonds, BondTopology(self.atoms).bonds))
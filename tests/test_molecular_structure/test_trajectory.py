@@ -0,0 +1,87 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from numpy import array_equal
+
+from molecular_structure.molecular_structure import read_structure_arrays
+from molecular_structure.trajectory import Trajectory, build_frame_index, get_frame_index_path
+from tests.helper_functions import build_path
+
+
+class TestTrajectory(TestCase):
+
+    def setUp(self):
+
+        # Set up a trajectory with the frames of the spherical, tetrahedral and octahedral test complexes.
+        self.directory = TemporaryDirectory()
+        self.trajectory_file = os.path.join(self.directory.name, 'trajectory.xyz')
+
+        self.frames = []
+
+        with open(self.trajectory_file, 'w') as trajectory_file:
+            for frame, shape in enumerate(['spherical', 'tetrahedral', 'octahedral', 'spherical']):
+                with open(build_path(f'anion_{shape}_geometry.xyz'), 'r') as coordinates_file:
+                    header, _, atoms = coordinates_file.read().split('\n', 2)
+
+                trajectory_file.write(f'{header}\nframe {frame}\n{atoms.strip()}\n')
+                self.frames.append(read_structure_arrays(build_path(f'anion_{shape}_geometry.xyz')))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def assert_frame_equal(self, frame, expected_frame):
+        self.assertTrue(array_equal(frame[0], expected_frame[0]))
+        self.assertTrue(array_equal(frame[1], expected_frame[1]))
+
+    def test_build_frame_index(self):
+        """
+        Tests that the frame index holds the byte offsets of the frames.
+        """
+
+        offsets = build_frame_index(self.trajectory_file)
+
+        self.assertEqual(len(offsets), 5)
+        self.assertEqual(offsets[-1], os.path.getsize(self.trajectory_file))
+
+        with open(self.trajectory_file, 'rb') as trajectory_file:
+            for offset in offsets[:-1]:
+                trajectory_file.seek(offset)
+                self.assertTrue(trajectory_file.readline().strip().isdigit())
+
+        with open(self.trajectory_file, 'a') as trajectory_file:
+            trajectory_file.write('10\nincomplete frame\nH 0.0 0.0 0.0\n')
+
+        with self.assertRaises(RuntimeError):
+            build_frame_index(self.trajectory_file)
+
+    def test_random_access(self):
+        """
+        Tests reading the frames in any order and persisting the frame index.
+        """
+
+        with Trajectory(self.trajectory_file) as trajectory:
+            self.assertEqual(len(trajectory), 4)
+            self.assertTrue(os.path.isfile(get_frame_index_path(self.trajectory_file)))
+
+            for frame in [2, 0, 3, 1, -1]:
+                self.assert_frame_equal(trajectory[frame], self.frames[frame])
+
+            self.assertEqual(trajectory.get_comment(2), 'frame 2')
+
+            with self.assertRaises(IndexError):
+                trajectory.get_frame(4)
+
+        with Trajectory(self.trajectory_file) as trajectory:
+            self.assertTrue(array_equal(trajectory.offsets, build_frame_index(self.trajectory_file)))
+
+    def test_iterate_frames(self):
+        """
+        Tests the strided iteration over the frames.
+        """
+
+        with Trajectory(self.trajectory_file) as trajectory:
+            self.assertEqual(len(list(trajectory)), 4)
+
+            for frame, expected_frame in zip(trajectory.iterate_frames(1, step=2), self.frames[1::2], strict=True):
+                self.assert_frame_equal(frame, expected_frame)